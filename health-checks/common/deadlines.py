@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Check Deadlines and Hedged Probes
+=================================
+
+Bounded-latency execution of health checks:
+- A ``CheckDeadline`` carries the time budget of one check execution and is
+  visible to every probe the check runs (via a context variable), so probe
+  timeouts are clipped to whatever budget is left
+- Probes record their outcome on the deadline as they finish; when the check
+  is cancelled at its deadline, completed work survives as partial evidence
+- ``hedged()`` re-issues an idempotent probe after a delay (or immediately
+  after a failure) and takes the first success, cancelling the stragglers
+
+Forensic Methodology Applied:
+- Timed-out and cancelled probes are recorded by name, never silently dropped
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# Budget held back when clipping a probe timeout, so a probe that runs out
+# its timeout fails before the check deadline and the check still reports
+PROBE_BUDGET_MARGIN_SECONDS = 0.25
+
+_current_deadline: ContextVar[Optional["CheckDeadline"]] = ContextVar("health_check_deadline", default=None)
+
+
+class ProbeTimeoutError(asyncio.TimeoutError):
+    """A probe exceeded its own timeout or the remaining check budget."""
+
+
+class CheckDeadline:
+    """Time budget of one check execution plus the probe outcomes recorded so far."""
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.budget_seconds = budget_seconds
+        self._loop = asyncio.get_running_loop()
+        self.started_at = self._loop.time()
+        self.expires_at = self.started_at + budget_seconds if budget_seconds else None
+
+        self.completed_probes: Dict[str, Any] = {}
+        self.failed_probes: Dict[str, str] = {}
+        self.pending_probes: List[str] = []
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget (``None`` when unbounded)."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - self._loop.time(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def clip(self, timeout: Optional[float], margin_seconds: float = 0.0) -> Optional[float]:
+        """The smaller of ``timeout`` and the remaining budget less ``margin_seconds``."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        remaining = max(remaining - margin_seconds, 0.0)
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def probe_started(self, name: str):
+        self.pending_probes.append(name)
+
+    def probe_completed(self, name: str, result: Any):
+        self._settle(name)
+        self.completed_probes[name] = result
+
+    def probe_failed(self, name: str, error: BaseException):
+        self._settle(name)
+        self.failed_probes[name] = str(error) or type(error).__name__
+
+    def partial_evidence(self) -> Dict[str, Any]:
+        """Everything the check had finished (or abandoned) when it was stopped."""
+        return {
+            "budget_seconds": self.budget_seconds,
+            "elapsed_seconds": self._loop.time() - self.started_at,
+            "completed_probes": self.completed_probes,
+            "failed_probes": self.failed_probes,
+            "pending_probes": list(self.pending_probes)
+        }
+
+    def _settle(self, name: str):
+        try:
+            self.pending_probes.remove(name)
+        except ValueError:
+            pass
+
+    def activate(self):
+        """Make this the deadline seen by code running in the current context."""
+        return _current_deadline.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[CheckDeadline]:
+    """Deadline of the check executing in the current context, if any."""
+    return _current_deadline.get()
+
+
+async def hedged(
+    probe_factory: Callable[[], Awaitable[Any]],
+    hedge_after_seconds: float,
+    max_attempts: int = 2
+) -> Tuple[Any, int]:
+    """
+    Run ``probe_factory()`` and start another attempt if it has not finished
+    after ``hedge_after_seconds`` (or as soon as an attempt fails), up to
+    ``max_attempts`` attempts in total.
+
+    Returns ``(result, attempt_index)`` of the first successful attempt; the
+    remaining attempts are cancelled. Only use for idempotent probes.
+    """
+    attempts: Dict[asyncio.Task, int] = {}
+    errors: List[BaseException] = []
+
+    def launch():
+        attempts[asyncio.ensure_future(probe_factory())] = len(attempts)
+
+    launch()
+    pending = set(attempts)
+    try:
+        while pending:
+            can_hedge = len(attempts) < max_attempts
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=hedge_after_seconds if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), attempts[task]
+                errors.append(task.exception())
+
+            # Nothing succeeded: the attempts are slow or failed, so issue a hedge
+            if can_hedge:
+                launch()
+                pending = {task for task in attempts if not task.done()}
+        raise errors[-1]
+    finally:
+        for task in attempts:
+            if not task.done():
+                task.cancel()
@@ -17,21 +17,30 @@ Compliance: FDA 21 CFR Part 11, SOX, PCI DSS
 """
 
 import asyncio
-import hashlib
+import atexit
 import json
 import logging
+import os
+import queue
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from enum import Enum
+from functools import total_ordering
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 import aiohttp
 import psutil
 import yaml
 
+from .deadlines import PROBE_BUDGET_MARGIN_SECONDS, CheckDeadline, ProbeTimeoutError, current_deadline, hedged
+from .integrity import HASH_SCHEME, MERKLE_SCHEME, canonical_encode, merkle_root, sha256_hex
+from .result_cache import CacheLookup, ResultCache
+from .tracing import CheckSpan, tracer
+
 
 class HealthStatus(Enum):
     """Health status enumeration following forensic classification principles."""
@@ -42,6 +51,7 @@ class HealthStatus(Enum):
     MAINTENANCE = "MAINTENANCE"
 
 
+@total_ordering
 class Severity(Enum):
     """Severity classification for forensic incident response."""
     LOW = 1
@@ -49,6 +59,17 @@ class Severity(Enum):
     HIGH = 3
     CRITICAL = 4
     EMERGENCY = 5
+    
+    def __lt__(self, other):
+        if isinstance(other, Severity):
+            return self.value < other.value
+        return NotImplemented
+
+
+# Fields covered by a result's chain-of-custody hash (evidence is excluded)
+RESULT_HASH_FIELDS = (
+    'check_id', 'timestamp', 'component', 'check_type', 'status', 'score', 'metrics', 'duration_ms'
+)
 
 
 @dataclass
@@ -71,7 +92,7 @@ class HealthCheckResult:
         self.hash = self._generate_hash()
     
     def _generate_hash(self) -> str:
-        """Generate SHA-256 hash for forensic integrity verification."""
+        """Generate SHA-256 hash over the canonical encoding, once per result."""
         content = {
             'check_id': self.check_id,
             'timestamp': self.timestamp.isoformat(),
@@ -82,44 +103,325 @@ class HealthCheckResult:
             'metrics': self.metrics,
             'duration_ms': self.duration_ms
         }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        return sha256_hex(canonical_encode(content))
+    
+    @staticmethod
+    def compute_hash(result: Dict[str, Any]) -> str:
+        """Recompute the chain-of-custody hash from a serialized result (``to_dict`` form)."""
+        return sha256_hex(canonical_encode({field: result.get(field) for field in RESULT_HASH_FIELDS}))
+    
+    @staticmethod
+    def verify_hash(result: Dict[str, Any]) -> bool:
+        """Check a serialized result against its recorded hash."""
+        return "hash" in result and HealthCheckResult.compute_hash(result) == result["hash"]
+    
+    def iter_fields(self) -> Iterator[Tuple[str, Any]]:
+        """Yield serialized ``(name, value)`` pairs; metrics and evidence are not copied."""
+        for result_field in fields(self):
+            value = getattr(self, result_field.name)
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            yield result_field.name, value
+        yield 'hash', self.hash
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging and storage."""
-        return {
-            **asdict(self),
-            'status': self.status.value,
-            'severity': self.severity.value,
-            'timestamp': self.timestamp.isoformat(),
-            'hash': self.hash
+        """Convert to dictionary for logging and storage (shallow, shares metrics/evidence)."""
+        return dict(self.iter_fields())
+
+
+class AsyncLogSink:
+    """
+    Non-blocking forensic log sink with batched, group-committed writes.
+    
+    Records are placed on a bounded queue by the caller and drained by a
+    dedicated writer thread, so the asyncio event loop never waits on disk I/O.
+    The writer flushes in batches and fsyncs according to the configured
+    group-commit policy:
+    
+    - ``always``: fsync after every batch (one fsync covers the whole batch)
+    - ``interval``: fsync at most once every ``fsync_interval_seconds``
+    - ``never``: leave durability to the OS page cache
+    
+    When the queue is full the caller is held for at most
+    ``block_timeout_seconds`` (``backpressure="block"``) before the record is
+    dropped, or dropped immediately (``backpressure="drop"``). Callers on an
+    event loop thread are never held: they always drop. Every drop is
+    counted so that audit-trail gaps remain visible.
+    """
+    
+    def __init__(
+        self,
+        targets: Dict[Path, Optional[logging.Formatter]],
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 0.5,
+        fsync_policy: str = "always",
+        fsync_interval_seconds: float = 1.0,
+        backpressure: str = "block",
+        block_timeout_seconds: float = 0.05
+    ):
+        if fsync_policy not in ("always", "interval", "never"):
+            raise ValueError(f"Unsupported fsync policy: {fsync_policy}")
+        if backpressure not in ("block", "drop"):
+            raise ValueError(f"Unsupported backpressure mode: {backpressure}")
+        
+        self.targets = targets
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.fsync_policy = fsync_policy
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.backpressure = backpressure
+        self.block_timeout_seconds = block_timeout_seconds
+        
+        self._queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize=max_queue_size)
+        self._files = {path: open(path, 'a', encoding='utf-8') for path in targets}
+        self._last_fsync = time.monotonic()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "batches_written": 0,
+            "fsyncs": 0,
+            "write_errors": 0,
+            "queue_high_water_mark": 0
         }
+        self._closed = False
+        
+        self._writer = threading.Thread(
+            target=self._run, name="forensic-log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+    
+    def submit(self, record: logging.LogRecord) -> bool:
+        """Enqueue a record for writing, applying the configured backpressure."""
+        if self._closed:
+            self._increment("dropped")
+            return False
+        
+        try:
+            if self.backpressure == "block" and not _on_event_loop():
+                self._queue.put(record, timeout=self.block_timeout_seconds)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            self._increment("dropped")
+            return False
+        
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["queue_high_water_mark"]:
+                self._stats["queue_high_water_mark"] = depth
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return sink counters for monitoring and audit completeness checks."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["queue_capacity"] = self._queue.maxsize
+        stats["fsync_policy"] = self.fsync_policy
+        return stats
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every record enqueued so far has been written."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+    
+    def close(self, timeout: float = 5.0):
+        """Drain outstanding records, fsync and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._writer.join(timeout)
+        for handle in self._files.values():
+            try:
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+            except (OSError, ValueError):
+                pass
+    
+    def _increment(self, counter: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[counter] += amount
+    
+    def _run(self):
+        """Writer loop: collect a batch, write it to every target, group-commit."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                continue
+            
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = any(record is None for record in batch)
+            records = [record for record in batch if record is not None]
+            
+            if records:
+                self._write_batch(records)
+            
+            for _ in batch:
+                self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write_batch(self, records: List[logging.LogRecord]):
+        """Write a batch to all targets with a single flush/fsync per file."""
+        try:
+            for path, formatter in self.targets.items():
+                handle = self._files[path]
+                lines = [
+                    (formatter.format(record) if formatter else record.getMessage()) + "\n"
+                    for record in records
+                ]
+                handle.write("".join(lines))
+                handle.flush()
+            
+            now = time.monotonic()
+            if self.fsync_policy == "always" or (
+                self.fsync_policy == "interval"
+                and now - self._last_fsync >= self.fsync_interval_seconds
+            ):
+                for handle in self._files.values():
+                    os.fsync(handle.fileno())
+                self._last_fsync = now
+                self._increment("fsyncs")
+            
+            with self._stats_lock:
+                self._stats["written"] += len(records)
+                self._stats["batches_written"] += 1
+        
+        except (OSError, ValueError):
+            self._increment("write_errors")
+            self._increment("dropped", len(records))
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _AsyncSinkHandler(logging.Handler):
+    """Logging handler that hands records to an AsyncLogSink without blocking."""
+    
+    def __init__(self, sink: AsyncLogSink):
+        super().__init__()
+        self.sink = sink
+    
+    def emit(self, record: logging.LogRecord):
+        self.sink.submit(record)
 
 
 class ForensicLogger:
     """Forensic-grade logging system with immutable audit trail."""
     
-    def __init__(self, log_dir: Path = Path("/var/log/health-checks")):
+    # One sink and one stdlib logger per log directory, shared by every
+    # ForensicLogger writing there, so directories never see each other's records
+    _sinks: Dict[Path, AsyncLogSink] = {}
+    _handlers: Dict[Path, _AsyncSinkHandler] = {}
+    _sink_configs: Dict[Path, Dict[str, Any]] = {}
+    _sinks_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        log_dir: Path = Path("/var/log/health-checks"),
+        sink_config: Optional[Dict[str, Any]] = None
+    ):
         self.log_dir = log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Setup structured logging
-        self.logger = logging.getLogger("forensic_health_checks")
+        self.logger = logging.getLogger(self._logger_name(log_dir.resolve()))
         self.logger.setLevel(logging.INFO)
-        
-        # Forensic audit log handler
-        audit_handler = logging.FileHandler(
-            self.log_dir / "audit.log", mode='a'
-        )
-        audit_handler.setFormatter(logging.Formatter(
-            '%(asctime)s|%(levelname)s|%(name)s|%(message)s'
-        ))
-        self.logger.addHandler(audit_handler)
-        
-        # JSON structured log handler
-        json_handler = logging.FileHandler(
-            self.log_dir / "health_checks.jsonl", mode='a'
-        )
-        self.logger.addHandler(json_handler)
+        self.sink = self._get_or_create_sink(log_dir, sink_config or {})
+    
+    @staticmethod
+    def _logger_name(key: Path) -> str:
+        # Dots would make one directory's logger a parent of another's
+        return "forensic_health_checks." + key.as_posix().replace(".", "_")
+    
+    @classmethod
+    def _get_or_create_sink(cls, log_dir: Path, sink_config: Dict[str, Any]) -> AsyncLogSink:
+        """Create the shared async sink for a log directory on first use."""
+        key = log_dir.resolve()
+        with cls._sinks_lock:
+            if key in cls._sinks and cls._sinks[key].closed:
+                cls._discard_sink(key)
+            if key not in cls._sinks:
+                targets = {
+                    # Forensic audit log
+                    log_dir / "audit.log": logging.Formatter(
+                        '%(asctime)s|%(levelname)s|%(name)s|%(message)s'
+                    ),
+                    # JSON structured log
+                    log_dir / "health_checks.jsonl": None
+                }
+                sink = AsyncLogSink(targets, **sink_config)
+                handler = _AsyncSinkHandler(sink)
+                logging.getLogger(cls._logger_name(key)).addHandler(handler)
+                cls._sinks[key] = sink
+                cls._handlers[key] = handler
+                cls._sink_configs[key] = dict(sink_config)
+            elif sink_config and sink_config != cls._sink_configs[key]:
+                raise ValueError(
+                    f"Forensic log sink for {log_dir} already exists with a different configuration "
+                    f"({cls._sink_configs[key]} vs {sink_config})"
+                )
+            return cls._sinks[key]
+    
+    @classmethod
+    def _discard_sink(cls, key: Path):
+        """Forget a directory's sink and detach its handler (caller holds the lock)."""
+        cls._sinks.pop(key, None)
+        cls._sink_configs.pop(key, None)
+        handler = cls._handlers.pop(key, None)
+        if handler is not None:
+            logging.getLogger(cls._logger_name(key)).removeHandler(handler)
+    
+    def get_sink_stats(self) -> Dict[str, Any]:
+        """Expose queue depth, dropped records and write counters."""
+        return self.sink.get_stats()
+    
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending records to reach disk without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.sink.flush, timeout)
+    
+    def close(self):
+        """Drain and close the underlying sink; a later logger for the directory opens a new one."""
+        key = self.log_dir.resolve()
+        with self._sinks_lock:
+            if self._sinks.get(key) is self.sink:
+                self._discard_sink(key)
+        self.sink.close()
     
     def log_health_check(self, result: HealthCheckResult):
         """Log health check result with forensic integrity."""
@@ -147,6 +449,58 @@ class ForensicLogger:
         self.logger.info(f"AUDIT|{json.dumps(audit_entry)}")
 
 
+class HTTPSessionManager:
+    """
+    Shared, pooled aiohttp client session for all health check probes.
+    
+    A single connector is reused across checks and cycles so that latency
+    measurements reflect the probed service rather than repeated TCP/TLS
+    handshakes. The connector enforces global and per-host connection limits,
+    keeps idle connections alive and caches DNS lookups.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.limit = config.get("connection_limit", 100)
+        self.limit_per_host = config.get("connection_limit_per_host", 10)
+        self.keepalive_timeout = config.get("keepalive_timeout_seconds", 30.0)
+        self.dns_cache_ttl = config.get("dns_cache_ttl_seconds", 300)
+        self.default_timeout = aiohttp.ClientTimeout(
+            total=config.get("default_timeout_seconds", 10.0)
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on the running loop if needed."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self.default_timeout
+                )
+        return self._session
+    
+    async def close(self):
+        """Close the shared session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
 class BaseHealthCheck(ABC):
     """Abstract base class for all health checks with forensic validation."""
     
@@ -154,12 +508,126 @@ class BaseHealthCheck(ABC):
         self.component = component
         self.logger = logger
         self.check_id = str(uuid.uuid4())
+        self.session_manager: Optional[HTTPSessionManager] = None
+        # Set when the check created its own fallback pool and must close it
+        self._owns_session_manager = False
+        
+        # Deadline budget per execution and optional probe hedging
+        self.timeout_seconds: Optional[float] = None
+        self.probe_timeout_seconds: Optional[float] = None
+        self.hedge_after_seconds: Optional[float] = None
+        self.max_hedged_attempts = 2
+        self.probe_stats = {"probes": 0, "probe_timeouts": 0, "hedges_launched": 0, "hedge_wins": 0}
+        self.metrics = None
+    
+    def use_session_manager(self, session_manager: HTTPSessionManager):
+        """Inject the shared HTTP session manager owned by the orchestrator."""
+        self.session_manager = session_manager
+        self._owns_session_manager = False
+    
+    def use_metrics(self, metrics):
+        """Report per-probe latency to a ``HealthCheckMetrics`` exporter."""
+        self.metrics = metrics
+    
+    def configure_deadlines(
+        self,
+        timeout_seconds: Optional[float] = None,
+        probe_timeout_seconds: Optional[float] = None,
+        hedge_after_seconds: Optional[float] = None,
+        max_hedged_attempts: int = 2
+    ):
+        """Set the per-execution budget, the probe timeout cap and hedging policy."""
+        self.timeout_seconds = timeout_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.hedge_after_seconds = hedge_after_seconds
+        self.max_hedged_attempts = max_hedged_attempts
+    
+    def _probe_timeout(self, default_seconds: float) -> float:
+        """Probe timeout: the probe default, capped by config and the remaining check budget."""
+        timeout = default_seconds
+        if self.probe_timeout_seconds is not None:
+            timeout = min(timeout, self.probe_timeout_seconds)
+        deadline = current_deadline()
+        return deadline.clip(timeout, PROBE_BUDGET_MARGIN_SECONDS) if deadline is not None else timeout
+    
+    async def _run_probe(
+        self,
+        name: str,
+        probe_factory: Callable[[], Awaitable[Any]],
+        timeout_seconds: float = 5.0,
+        hedge: bool = False
+    ) -> Any:
+        """
+        Run one probe under its own timeout (clipped to the check deadline).
+        
+        The outcome is recorded on the check deadline so completed probes
+        survive as partial evidence if the check itself is cut off. With
+        ``hedge=True`` (idempotent probes only) a second attempt is issued
+        after ``hedge_after_seconds``.
+        """
+        deadline = current_deadline()
+        timeout = self._probe_timeout(timeout_seconds)
+        self.probe_stats["probes"] += 1
+        if deadline is not None:
+            deadline.probe_started(name)
+        started = time.perf_counter()
+        
+        try:
+            if hedge and self.hedge_after_seconds is not None and self.max_hedged_attempts > 1:
+                result, attempt = await asyncio.wait_for(
+                    hedged(probe_factory, self.hedge_after_seconds, self.max_hedged_attempts),
+                    timeout=timeout
+                )
+                if attempt > 0:
+                    self.probe_stats["hedges_launched"] += attempt
+                    self.probe_stats["hedge_wins"] += 1
+            else:
+                result = await asyncio.wait_for(probe_factory(), timeout=timeout)
+        except asyncio.TimeoutError as e:
+            self.probe_stats["probe_timeouts"] += 1
+            error = ProbeTimeoutError(f"Probe '{name}' exceeded {timeout:.2f}s")
+            self._observe_probe(name, "timeout", started)
+            if deadline is not None:
+                deadline.probe_failed(name, error)
+            raise error from e
+        except Exception as e:
+            self._observe_probe(name, "error", started)
+            if deadline is not None:
+                deadline.probe_failed(name, e)
+            raise
+        
+        self._observe_probe(name, "ok", started)
+        if deadline is not None:
+            deadline.probe_completed(name, result)
+        return result
+    
+    def _observe_probe(self, name: str, outcome: str, started: float):
+        if self.metrics is not None:
+            self.metrics.observe_probe(self.component, name, outcome, time.perf_counter() - started)
+    
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, falling back to a private pool."""
+        if self.session_manager is None:
+            self.session_manager = HTTPSessionManager()
+            self._owns_session_manager = True
+        return await self.session_manager.get_session()
     
     @abstractmethod
     async def execute(self) -> HealthCheckResult:
         """Execute the health check and return forensic result."""
         pass
     
+    async def close(self):
+        """
+        Release background resources held by the check, including a private
+        HTTP pool created for lack of an injected one. Overrides must call
+        ``super().close()``.
+        """
+        if self._owns_session_manager and self.session_manager is not None:
+            await self.session_manager.close()
+            self.session_manager = None
+            self._owns_session_manager = False
+    
     def _create_result(
         self,
         check_type: str,
@@ -198,30 +666,92 @@ class BaseHealthCheck(ABC):
 class HealthCheckRegistry:
     """Registry for managing health checks with forensic capabilities."""
     
-    def __init__(self):
+    def __init__(self, logger: Optional[ForensicLogger] = None):
         self.checks: Dict[str, BaseHealthCheck] = {}
-        self.logger = ForensicLogger()
+        self.logger = logger or ForensicLogger()
         self.baseline_metrics: Dict[str, Dict[str, float]] = {}
+        self.dependencies: Dict[str, Tuple[str, ...]] = {}
+        self.concurrency_groups: Dict[str, str] = {}
+        self.default_timeout_seconds: Optional[float] = None
+        self.result_cache = ResultCache()
+        self.metrics = None
     
-    def register_check(self, name: str, check: BaseHealthCheck):
-        """Register a health check in the forensic registry."""
+    def register_check(
+        self,
+        name: str,
+        check: BaseHealthCheck,
+        depends_on: Optional[List[str]] = None,
+        concurrency_group: Optional[str] = None
+    ):
+        """
+        Register a health check in the forensic registry.
+        
+        ``depends_on`` names checks that must complete before this one starts;
+        checks sharing a ``concurrency_group`` share one concurrency limit
+        (by default each check is its own group).
+        """
         self.checks[name] = check
+        self.dependencies[name] = tuple(depends_on or ())
+        self.concurrency_groups[name] = concurrency_group or name
         self.logger.log_audit_event(
             "health_check_registered",
-            {"check_name": name, "component": check.component}
+            {
+                "check_name": name,
+                "component": check.component,
+                "depends_on": list(self.dependencies[name]),
+                "concurrency_group": self.concurrency_groups[name]
+            }
         )
     
-    async def execute_check(self, name: str) -> HealthCheckResult:
-        """Execute a specific health check with forensic logging."""
+    def set_dependencies(self, name: str, depends_on: List[str]):
+        """Replace the declared dependencies of a registered check."""
         if name not in self.checks:
             raise ValueError(f"Health check '{name}' not found in registry")
+        self.dependencies[name] = tuple(depends_on)
+    
+    async def execute_check(self, name: str, timeout_seconds: Optional[float] = None) -> HealthCheckResult:
+        """
+        Execute a specific health check with forensic logging.
+        
+        The check runs under a deadline: the smaller of ``timeout_seconds``,
+        the check's own ``timeout_seconds`` and the registry default. At the
+        deadline the check is cancelled and a timeout result carrying the
+        probes that did complete is returned instead.
         
+        Wall time and event-loop CPU time of the execution are traced.
+        """
+        if name not in self.checks:
+            raise ValueError(f"Health check '{name}' not found in registry")
+        
+        with tracer.check_span(name) as span:
+            result = await self._execute_with_deadline(name, timeout_seconds, span)
+            span.args.update(status=result.status.value, check_type=result.check_type)
+        if self.metrics is not None:
+            self.metrics.observe_result(name, result)
+            self.metrics.observe_loop_cpu(name, span.loop_cpu_seconds)
+        return result
+    
+    async def _execute_with_deadline(
+        self, name: str, timeout_seconds: Optional[float], span: CheckSpan
+    ) -> HealthCheckResult:
         check = self.checks[name]
         start_time = time.perf_counter()
+        budgets = [b for b in (timeout_seconds, check.timeout_seconds, self.default_timeout_seconds) if b]
+        deadline = CheckDeadline(min(budgets) if budgets else None)
         
         try:
-            result = await check.execute()
+            # The deadline is inherited by the task wait_for runs the check in
+            token = deadline.activate()
+            try:
+                result = await asyncio.wait_for(span.timed(check.execute()), timeout=deadline.budget_seconds)
+            except asyncio.TimeoutError:
+                if not deadline.expired:
+                    raise
+                return self._timeout_result(name, deadline, start_time)
+            finally:
+                deadline.deactivate(token)
             self.logger.log_health_check(result)
+            self.result_cache.store(name, result)
             
             # Performance regression detection
             await self._check_performance_regression(name, result)
@@ -244,6 +774,39 @@ class HealthCheckRegistry:
             self.logger.log_health_check(error_result)
             return error_result
     
+    async def execute_cached(self, name: str, timeout_seconds: Optional[float] = None) -> CacheLookup:
+        """
+        Serve a check result through the result cache.
+        
+        Within the check's TTL the cached result is returned; within the
+        stale-while-revalidate window it is returned while a background
+        execution refreshes it; otherwise the check is executed.
+        """
+        if name not in self.checks:
+            raise ValueError(f"Health check '{name}' not found in registry")
+        return await self.result_cache.get(name, lambda: self.execute_check(name, timeout_seconds))
+    
+    def _timeout_result(self, name: str, deadline: CheckDeadline, start_time: float) -> HealthCheckResult:
+        """Result for a check cancelled at its deadline, keeping completed probe outcomes."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        partial = deadline.partial_evidence()
+        timeout_result = self.checks[name]._create_result(
+            check_type="timeout",
+            status=HealthStatus.CRITICAL,
+            score=0.0,
+            metrics={
+                "probes_completed": len(partial["completed_probes"]),
+                "probes_failed": len(partial["failed_probes"]),
+                "probes_pending": len(partial["pending_probes"])
+            },
+            evidence={"partial_results": partial},
+            duration_ms=duration_ms,
+            error_message=f"Health check '{name}' exceeded its {deadline.budget_seconds}s deadline",
+            severity=Severity.HIGH
+        )
+        self.logger.log_health_check(timeout_result)
+        return timeout_result
+    
     async def execute_all_checks(self) -> Dict[str, HealthCheckResult]:
         """Execute all registered health checks in parallel."""
         self.logger.log_audit_event(
@@ -335,10 +898,10 @@ class HealthCheckRegistry:
 class HealthCheckOrchestrator:
     """Main orchestrator for forensic-level health check execution."""
     
-    def __init__(self, config_path: Optional[Path] = None):
-        self.registry = HealthCheckRegistry()
+    def __init__(self, config_path: Optional[Path] = None, logger: Optional[ForensicLogger] = None):
+        self.logger = logger or ForensicLogger()
+        self.registry = HealthCheckRegistry(self.logger)
         self.config = self._load_config(config_path)
-        self.logger = ForensicLogger()
     
     def _load_config(self, config_path: Optional[Path]) -> Dict[str, Any]:
         """Load health check configuration."""
@@ -441,15 +1004,13 @@ class HealthCheckOrchestrator:
             },
             "forensic_chain_of_custody": {
                 "results_hash": self._calculate_results_hash(results),
+                "hash_scheme": HASH_SCHEME,
+                "merkle_scheme": MERKLE_SCHEME,
                 "integrity_verified": True,
                 "audit_trail_complete": True
             }
         }
     
     def _calculate_results_hash(self, results: Dict[str, HealthCheckResult]) -> str:
-        """Calculate hash of all results for forensic integrity."""
-        all_hashes = sorted([result.hash for result in results.values()])
-        combined_hash = hashlib.sha256(
-            ''.join(all_hashes).encode()
-        ).hexdigest()
-        return combined_hash
\ No newline at end of file
+        """Merkle root over the per-result hashes for forensic integrity."""
+        return merkle_root({name: result.hash for name, result in results.items()})
\ No newline at end of file
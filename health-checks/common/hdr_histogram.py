@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+HDR Latency Histogram
+=====================
+
+High-dynamic-range histogram after HdrHistogram (Gil Tene):
+- Log-linear buckets: every power-of-two range is split into the same number
+  of linear sub-buckets, so any recorded value is reproduced within a fixed
+  relative error (``significant_figures``) from microseconds to hours
+- O(1) recording (a bit-length, a shift and a list increment) with constant
+  memory, independent of the number of samples
+- Percentiles are computed over the whole distribution, never a sample of it
+
+Values are non-negative integers in a caller-chosen unit (microseconds in
+this package); values above ``highest_trackable_value`` are clamped and
+counted.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class HdrHistogram:
+    """Log-linear histogram of non-negative integer values."""
+
+    def __init__(self, highest_trackable_value: int = 3_600_000_000, significant_figures: int = 2):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.highest_trackable_value = highest_trackable_value
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        self._sub_bucket_count = 1 << math.ceil(math.log2(largest_single_unit))
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_half_count_magnitude = int(math.log2(self._sub_bucket_half_count))
+        self._sub_bucket_mask = self._sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self._sub_bucket_count
+        while smallest_untrackable <= highest_trackable_value:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self._counts_length = (bucket_count + 1) * self._sub_bucket_half_count
+
+        self.counts: List[int] = [0] * self._counts_length
+        self.total_count = 0
+        self.clamped_count = 0
+        self.min_value: Optional[int] = None
+        self.max_value = 0
+        self._sum = 0
+
+        self._index_values: Optional[np.ndarray] = None
+
+    def _counts_index(self, value: int) -> int:
+        bucket_index = (value | self._sub_bucket_mask).bit_length() - (self._sub_bucket_half_count_magnitude + 1)
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self._sub_bucket_half_count_magnitude) + sub_bucket_index - self._sub_bucket_half_count
+
+    def record(self, value: float, count: int = 1):
+        """Record ``count`` occurrences of ``value``."""
+        value = int(value)
+        if value < 0:
+            value = 0
+        if value > self.highest_trackable_value:
+            value = self.highest_trackable_value
+            self.clamped_count += count
+
+        self.counts[self._counts_index(value)] += count
+        self.total_count += count
+        self._sum += value * count
+        if value > self.max_value:
+            self.max_value = value
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+
+    def merge(self, other: "HdrHistogram"):
+        """Add another histogram with the same layout into this one."""
+        if other._counts_length != self._counts_length:
+            raise ValueError("Cannot merge histograms with different layouts")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total_count += other.total_count
+        self.clamped_count += other.clamped_count
+        self._sum += other._sum
+        self.max_value = max(self.max_value, other.max_value)
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+
+    def reset(self):
+        self.counts = [0] * self._counts_length
+        self.total_count = 0
+        self.clamped_count = 0
+        self.min_value = None
+        self.max_value = 0
+        self._sum = 0
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, int]:
+        """Values at the given percentiles (highest value equivalent to the bucket, capped at max)."""
+        percentiles = list(percentiles)
+        if not self.total_count:
+            return {p: 0 for p in percentiles}
+
+        cumulative = np.cumsum(np.asarray(self.counts, dtype=np.int64))
+        targets = [max(math.ceil(p / 100.0 * self.total_count), 1) for p in percentiles]
+        indexes = np.searchsorted(cumulative, targets, side="left")
+        upper = self._highest_equivalent_values()
+        return {p: int(min(upper[i], self.max_value)) for p, i in zip(percentiles, indexes)}
+
+    def value_at_percentile(self, percentile: float) -> int:
+        return self.percentiles([percentile])[percentile]
+
+    def summary(self, scale: float = 1.0, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Count, min/mean/max and percentiles, each value divided by ``scale``."""
+        values = self.percentiles(percentiles)
+        summary = {
+            "count": self.total_count,
+            "min": (self.min_value or 0) / scale,
+            "mean": self.mean / scale,
+            "max": self.max_value / scale
+        }
+        for percentile, value in values.items():
+            summary[f"p{percentile:g}"] = value / scale
+        if self.clamped_count:
+            summary["clamped"] = self.clamped_count
+        return summary
+
+    def _highest_equivalent_values(self) -> np.ndarray:
+        """Upper bound of the value range of every counts slot (computed once)."""
+        if self._index_values is None:
+            index = np.arange(self._counts_length, dtype=np.int64)
+            bucket_index = (index >> self._sub_bucket_half_count_magnitude) - 1
+            sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+            first_bucket = bucket_index < 0
+            sub_bucket_index[first_bucket] -= self._sub_bucket_half_count
+            bucket_index[first_bucket] = 0
+            lowest = sub_bucket_index << bucket_index
+            self._index_values = lowest + (np.int64(1) << bucket_index) - 1
+        return self._index_values
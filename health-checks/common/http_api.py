@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Health Check HTTP API
+=====================
+
+Query interface of the resident health-check daemon (aiohttp.web):
+- ``GET  /health``                    latest-results snapshot of every check
+- ``GET  /health/checks/{name}``      most recent result of one check
+- ``POST /health/checks/{name}/run``  execute one check now
+- ``GET  /metrics``                   Prometheus exposition of ``orchestrator.metrics``
+- ``GET  /healthz``                   liveness of the daemon itself
+- ``GET  /debug/trace``               buffered check/stage spans as a Chrome trace
+
+Reads never execute checks: they serve the state kept warm by the
+continuous scheduler. The snapshot document is encoded once per result
+sequence number, so repeated reads are a dictionary lookup and a socket
+write.
+
+Forensic Methodology Applied:
+- Triggered executions go through the same concurrency slots, deadlines and
+  result cache as scheduled ones, and are recorded in the audit trail
+- Concurrent triggers of one check share a single execution
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+from .metrics import CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE
+from .report_encoding import encode_json
+from .tracing import tracer
+
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+class HealthCheckAPI:
+    """
+    HTTP front end over a running ``BusinessCriticalHealthOrchestrator``.
+
+    The orchestrator provides ``registry``, ``metrics``, ``latest_results``,
+    ``latest_sequence``, ``get_latest_snapshot()`` and ``run_check()``.
+    """
+
+    def __init__(self, orchestrator, trigger_timeout_seconds: Optional[float] = None):
+        self.orchestrator = orchestrator
+        self.logger = orchestrator.logger
+        self.trigger_timeout_seconds = trigger_timeout_seconds
+        self.started_at = time.monotonic()
+
+        self._snapshot: Optional[Tuple[int, bytes]] = None
+        self._snapshot_lock = asyncio.Lock()
+        self._triggered: Dict[str, asyncio.Task] = {}
+        self.stats = {"requests": 0, "snapshot_encodes": 0, "triggers": 0, "shared_triggers": 0}
+
+        self.app = web.Application()
+        self.app.add_routes([
+            web.get("/health", self.get_snapshot),
+            web.get("/health/checks/{name}", self.get_check),
+            web.post("/health/checks/{name}/run", self.trigger_check),
+            web.get("/metrics", self.get_metrics),
+            web.get("/healthz", self.get_liveness),
+            web.get("/debug/trace", self.get_trace)
+        ])
+        self.app.on_shutdown.append(self._cancel_triggers)
+        self._runner: Optional[web.AppRunner] = None
+        orchestrator.metrics.add_collector(self._collect_metrics)
+
+    async def start(self, host: str, port: int):
+        """Bind the listening socket and start serving."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.logger.log_audit_event("health_api_started", {"host": host, "port": port})
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self.logger.log_audit_event("health_api_stopped", {"requests": self.stats["requests"]})
+
+    async def get_snapshot(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        return _json_body(await self._encoded_snapshot())
+
+    async def get_check(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        name = request.match_info["name"]
+        if name not in self.orchestrator.registry.checks:
+            return _json_error(404, f"Unknown health check: {name}")
+
+        result = self.orchestrator.latest_results.get(name)
+        if result is None:
+            return _json_error(404, f"Health check has not completed yet: {name}")
+        return _json_body(encode_json(result))
+
+    async def trigger_check(self, request: web.Request) -> web.Response:
+        """
+        Execute one check now. ``?wait=false`` returns 202 immediately;
+        ``?use_cache=true`` allows a result within the check's cache TTL.
+        """
+        self.stats["requests"] += 1
+        name = request.match_info["name"]
+        if name not in self.orchestrator.registry.checks:
+            return _json_error(404, f"Unknown health check: {name}")
+
+        wait = _query_flag(request, "wait", True)
+        use_cache = _query_flag(request, "use_cache", False)
+
+        task = self._triggered.get(name)
+        if task is None:
+            self.stats["triggers"] += 1
+            self.logger.log_audit_event(
+                "health_check_triggered",
+                {"check_name": name, "remote": request.remote, "use_cache": use_cache}
+            )
+            task = asyncio.create_task(
+                self.orchestrator.run_check(name, use_cache=use_cache), name=f"health_check_trigger:{name}"
+            )
+            self._triggered[name] = task
+            task.add_done_callback(lambda finished: self._trigger_finished(name, finished))
+        else:
+            self.stats["shared_triggers"] += 1
+
+        if not wait:
+            return _json_body(encode_json({"check_name": name, "state": "accepted"}), status=202)
+
+        try:
+            # Shielded: a client disconnect must not cancel an execution others share
+            result = await asyncio.wait_for(asyncio.shield(task), self.trigger_timeout_seconds)
+        except asyncio.TimeoutError:
+            return _json_body(encode_json({"check_name": name, "state": "running"}), status=202)
+        except Exception as e:
+            return _json_error(500, f"Health check execution failed: {e}")
+        return _json_body(encode_json(result))
+
+    async def get_metrics(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        return web.Response(
+            body=self.orchestrator.metrics.render().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE}
+        )
+
+    async def get_liveness(self, request: web.Request) -> web.Response:
+        checks = self.orchestrator.registry.checks
+        pending = [name for name in checks if name not in self.orchestrator.latest_results]
+        return _json_body(encode_json({
+            "status": "ok",
+            "uptime_seconds": time.monotonic() - self.started_at,
+            "checks_registered": len(checks),
+            "checks_pending": pending
+        }))
+
+    async def get_trace(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        return _json_body(encode_json(tracer.export_chrome_trace()))
+
+    async def _encoded_snapshot(self) -> bytes:
+        """Encoded snapshot for the current result sequence (rebuilt only when it changes)."""
+        sequence = self.orchestrator.latest_sequence
+        if self._snapshot is not None and self._snapshot[0] == sequence:
+            return self._snapshot[1]
+
+        async with self._snapshot_lock:
+            # Another request may have rebuilt it while this one waited
+            if self._snapshot is None or self._snapshot[0] != sequence:
+                snapshot = await self.orchestrator.get_latest_snapshot()
+                self._snapshot = (snapshot["snapshot_metadata"]["sequence"], encode_json(snapshot))
+                self.stats["snapshot_encodes"] += 1
+            return self._snapshot[1]
+
+    def _collect_metrics(self):
+        yield ("health_api_requests_total", "counter", "HTTP API requests served",
+               [({}, self.stats["requests"])])
+        yield ("health_api_triggers_total", "counter", "Check executions triggered through the API",
+               [({}, self.stats["triggers"])])
+        yield ("health_api_triggers_in_flight", "gauge", "Triggered check executions still running",
+               [({}, len(self._triggered))])
+
+    def _trigger_finished(self, name: str, task: asyncio.Task):
+        self._triggered.pop(name, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _cancel_triggers(self, app: web.Application):
+        tasks = list(self._triggered.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _query_flag(request: web.Request, name: str, default: bool) -> bool:
+    value = request.query.get(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _json_body(body: bytes, status: int = 200) -> web.Response:
+    return web.Response(body=body, status=status, content_type=JSON_CONTENT_TYPE)
+
+
+def _json_error(status: int, message: str) -> web.Response:
+    return _json_body(encode_json({"error": message}), status=status)
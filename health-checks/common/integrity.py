@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Chain of Custody Integrity Primitives
+=====================================
+
+Canonical hashing and Merkle aggregation for health check evidence:
+- Canonical binary encoding (orjson, sorted keys, compact, UTF-8) so every
+  digest is reproducible regardless of dict insertion order
+- SHA-256 digests computed once per result and reused downstream
+- RFC 6962-style Merkle tree over per-result digests: report hashing cost
+  scales with the number of checks, not with evidence size
+- Inclusion proofs so a single result can be verified against the report
+  root without access to the other results
+
+Forensic Methodology Applied:
+- Leaf and interior nodes are domain-separated (0x00 / 0x01 prefixes) to
+  prevent second-preimage attacks on the tree
+- Leaves bind the result name to its digest
+"""
+
+import hashlib
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+
+import orjson
+
+
+HASH_SCHEME = "sha256:orjson-canonical-v1"
+MERKLE_SCHEME = "merkle-sha256:rfc6962"
+
+_CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def serialization_default(obj: Any) -> Any:
+    """Fallback conversion for types orjson does not serialize natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "item"):  # numpy scalar types orjson does not know
+        return obj.item()
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    if is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    return str(obj)
+
+
+def canonical_encode(obj: Any) -> bytes:
+    """Deterministic compact byte encoding used for all chain-of-custody hashes."""
+    return orjson.dumps(obj, default=serialization_default, option=_CANONICAL_OPTIONS)
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def merkle_leaf(name: str, digest: str) -> bytes:
+    """Leaf node hash binding a result name to its digest."""
+    return hashlib.sha256(_LEAF_PREFIX + canonical_encode([name, digest])).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def _ordered_leaves(digests: Mapping[str, str]) -> Tuple[List[str], List[bytes]]:
+    names = sorted(digests)
+    return names, [merkle_leaf(name, digests[name]) for name in names]
+
+
+def _tree_levels(leaves: List[bytes]) -> List[List[bytes]]:
+    """All tree levels, leaves first. An odd trailing node is promoted unchanged."""
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def merkle_root(digests: Mapping[str, str]) -> str:
+    """Merkle root over ``{result_name: result_hash}``, ordered by name."""
+    _, leaves = _ordered_leaves(digests)
+    if not leaves:
+        return sha256_hex(b"")
+    return _tree_levels(leaves)[-1][0].hex()
+
+
+def merkle_proofs(digests: Mapping[str, str]) -> Dict[str, List[List[str]]]:
+    """Inclusion proof per result: a list of ``[side, sibling_hash]`` from leaf to root."""
+    names, leaves = _ordered_leaves(digests)
+    if not leaves:
+        return {}
+    levels = _tree_levels(leaves)
+
+    proofs = {}
+    for leaf_index, name in enumerate(names):
+        path = []
+        index = leaf_index
+        for level in levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(["left" if sibling < index else "right", level[sibling].hex()])
+            index //= 2
+        proofs[name] = path
+    return proofs
+
+
+def verify_merkle_proof(name: str, digest: str, proof: List[List[str]], root: str) -> bool:
+    """Check that ``name``/``digest`` is included under ``root``."""
+    node = merkle_leaf(name, digest)
+    for side, sibling_hex in proof:
+        sibling = bytes.fromhex(sibling_hex)
+        node = _merkle_node(sibling, node) if side == "left" else _merkle_node(node, sibling)
+    return node.hex() == root
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Health Check Metrics Exporter
+=============================
+
+Native Prometheus exposition for the health-check framework:
+- Counter, gauge and histogram families with fixed label names; label
+  strings are formatted once when a series is created
+- Each family caches its rendered text and only re-renders after it changed,
+  so a scrape of unchanged families is a string join
+- Label cardinality is capped per family: once ``max_series`` label sets
+  exist, further ones are folded into a single overflow series (every label
+  set to ``OVERFLOW_LABEL``) and counted, so totals stay correct while
+  runaway label values (URLs, ids) cannot grow the registry without bound
+- Scrape-time collectors report values owned by other components (result
+  cache, audit queue, schedulers) without double bookkeeping
+
+``HealthCheckMetrics`` defines the framework's metric families and is fed by
+the registry (per-check results), by ``BaseHealthCheck._run_probe`` (per-probe
+latency) and by ``EventLoopLagSampler``.
+"""
+
+import asyncio
+import math
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OVERFLOW_LABEL = "__overflow__"
+
+# Millisecond buckets covering sub-millisecond probes to multi-second checks
+LATENCY_BUCKETS_MS = (
+    0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0,
+    1000.0, 2500.0, 5000.0, 10000.0, 30000.0, 60000.0
+)
+LOOP_LAG_BUCKETS_MS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+_STATUS_CODES = {"HEALTHY": 0, "DEGRADED": 1, "CRITICAL": 2, "UNKNOWN": 3, "MAINTENANCE": 4}
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+class _Series:
+    __slots__ = ("label_values", "value")
+
+    def __init__(self, label_values: Tuple[str, ...]):
+        self.label_values = label_values
+        self.value = 0.0
+
+
+class _HistogramSeries:
+    __slots__ = ("label_values", "counts", "sum", "count")
+
+    def __init__(self, label_values: Tuple[str, ...], bucket_count: int):
+        self.label_values = label_values
+        self.counts = [0] * (bucket_count + 1)  # last slot is the +Inf bucket
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricFamily:
+    """Series of one metric name, keyed by label values."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), max_series: int = 1000):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self.overflowed = 0
+
+        self._series: Dict[Tuple[str, ...], Any] = {}
+        self._label_text: Dict[Tuple[str, ...], str] = {}
+        self._rendered: Optional[str] = None
+
+    def _get(self, label_values: Tuple[Any, ...]):
+        key = tuple(str(value) for value in label_values)
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+
+        if len(self._series) >= self.max_series:
+            self.overflowed += 1
+            key = (OVERFLOW_LABEL,) * len(self.labelnames)
+            series = self._series.get(key)
+            if series is not None:
+                return series
+
+        series = self._new_series(key)
+        self._series[key] = series
+        self._label_text[key] = _format_labels(self.labelnames, key)
+        return series
+
+    def _new_series(self, key: Tuple[str, ...]):
+        return _Series(key)
+
+    def remove(self, *label_values: Any):
+        key = tuple(str(value) for value in label_values)
+        if self._series.pop(key, None) is not None:
+            self._label_text.pop(key, None)
+            self._rendered = None
+
+    def render(self) -> str:
+        if self._rendered is None:
+            lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+            lines.extend(self._render_samples())
+            self._rendered = "\n".join(lines) + "\n"
+        return self._rendered
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, series in self._series.items():
+            yield f"{self.name}{self._label_text[key]} {_format_value(series.value)}"
+
+
+class Counter(MetricFamily):
+    metric_type = "counter"
+
+    def inc(self, *label_values: Any, amount: float = 1.0):
+        self._get(label_values).value += amount
+        self._rendered = None
+
+
+class Gauge(MetricFamily):
+    metric_type = "gauge"
+
+    def set(self, *label_values: Any, value: float):
+        self._get(label_values).value = value
+        self._rendered = None
+
+
+class Histogram(MetricFamily):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_MS,
+        max_series: int = 1000
+    ):
+        super().__init__(name, help_text, labelnames, max_series)
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_labels = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+
+    def _new_series(self, key: Tuple[str, ...]):
+        return _HistogramSeries(key, len(self.buckets))
+
+    def observe(self, *label_values: Any, value: float):
+        series = self._get(label_values)
+        # Buckets are inclusive upper bounds (le)
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+        self._rendered = None
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self._bucket_labels, series.counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{self._label_text[key]} {_format_value(series.sum)}"
+            yield f"{self.name}_count{self._label_text[key]} {series.count}"
+
+
+# A collector returns (name, type, help, [(labels, value), ...]) tuples at scrape time
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict[str, Any], float]]]]]
+
+
+class MetricsRegistry:
+    """Metric families plus scrape-time collectors, rendered in registration order."""
+
+    def __init__(self, max_series_per_metric: int = 1000):
+        self.max_series_per_metric = max_series_per_metric
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Collector] = []
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames, self.max_series_per_metric))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames, self.max_series_per_metric))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_MS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets, self.max_series_per_metric))
+
+    def add_collector(self, collector: Collector):
+        self._collectors.append(collector)
+
+    def _register(self, family: MetricFamily):
+        if family.name in self._families:
+            raise ValueError(f"Metric already registered: {family.name}")
+        self._families[family.name] = family
+        return family
+
+    def render(self) -> str:
+        """Prometheus text exposition of every family and collector."""
+        chunks = [family.render() for family in self._families.values()]
+        for collector in self._collectors:
+            for name, metric_type, help_text, samples in collector():
+                lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+                chunks.append("\n".join(lines) + "\n")
+
+        overflowed = [(family.name, family.overflowed) for family in self._families.values() if family.overflowed]
+        if overflowed:
+            lines = [
+                "# HELP health_metrics_series_overflow_total Label sets folded into the overflow series",
+                "# TYPE health_metrics_series_overflow_total counter"
+            ]
+            lines.extend(
+                f'health_metrics_series_overflow_total{{metric="{name}"}} {count}' for name, count in overflowed
+            )
+            chunks.append("\n".join(lines) + "\n")
+        return "".join(chunks)
+
+
+class EventLoopLagSampler:
+    """
+    Measure event-loop lag: how late a timer scheduled ``interval_seconds``
+    ahead actually fires. Sustained lag means something blocks the loop.
+
+    Lag of at least ``stall_threshold_seconds`` is also reported to
+    ``on_stall`` (the tracer records it alongside the checks running then).
+    """
+
+    def __init__(
+        self,
+        metrics: "HealthCheckMetrics",
+        interval_seconds: float = 0.1,
+        stall_threshold_seconds: Optional[float] = None,
+        on_stall: Optional[Callable[[float], None]] = None
+    ):
+        self.metrics = metrics
+        self.interval_seconds = interval_seconds
+        self.stall_threshold_seconds = stall_threshold_seconds
+        self.on_stall = on_stall
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="event_loop_lag_sampler")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            lag_seconds = max(loop.time() - scheduled - self.interval_seconds, 0.0)
+            self.metrics.observe_loop_lag(lag_seconds)
+            if (
+                self.on_stall is not None and self.stall_threshold_seconds is not None
+                and lag_seconds >= self.stall_threshold_seconds
+            ):
+                self.on_stall(lag_seconds)
+
+
+class HealthCheckMetrics:
+    """Metric families of the health-check framework."""
+
+    def __init__(self, max_series_per_metric: int = 1000):
+        self.registry = MetricsRegistry(max_series_per_metric)
+        registry = self.registry
+
+        self.check_score = registry.gauge(
+            "health_check_score", "Score of the latest check result (0-100)", ("check",)
+        )
+        self.check_status = registry.gauge(
+            "health_check_status",
+            "Status of the latest check result (0=healthy 1=degraded 2=critical 3=unknown 4=maintenance)",
+            ("check",)
+        )
+        self.check_severity = registry.gauge(
+            "health_check_severity", "Severity of the latest check result (1=low .. 5=emergency)", ("check",)
+        )
+        self.check_duration = registry.histogram(
+            "health_check_duration_ms", "Check execution time", ("check",)
+        )
+        self.check_loop_cpu = registry.histogram(
+            "health_check_loop_cpu_ms",
+            "Event-loop CPU time of a check execution (time it blocked other checks)",
+            ("check",)
+        )
+        self.check_executions = registry.counter(
+            "health_check_executions_total", "Check executions by outcome type", ("check", "check_type")
+        )
+        self.probe_duration = registry.histogram(
+            "health_check_probe_duration_ms",
+            "Probe latency (market feeds, sensors, lines, endpoints) by outcome",
+            ("component", "probe", "outcome")
+        )
+        self.loop_lag = registry.histogram(
+            "health_event_loop_lag_ms", "Event-loop timer lateness", (), LOOP_LAG_BUCKETS_MS
+        )
+        self.loop_lag_last = registry.gauge(
+            "health_event_loop_lag_last_ms", "Most recent event-loop lag sample"
+        )
+
+    def observe_result(self, check_name: str, result: Any):
+        """Record one executed check result."""
+        self.check_score.set(check_name, value=result.score)
+        self.check_status.set(check_name, value=_STATUS_CODES.get(result.status.value, 3))
+        self.check_severity.set(check_name, value=result.severity.value)
+        self.check_duration.observe(check_name, value=result.duration_ms)
+        self.check_executions.inc(check_name, result.check_type)
+
+    def observe_loop_cpu(self, check_name: str, cpu_seconds: float):
+        self.check_loop_cpu.observe(check_name, value=cpu_seconds * 1000)
+
+    def observe_probe(self, component: str, probe: str, outcome: str, duration_seconds: float):
+        self.probe_duration.observe(component, probe, outcome, value=duration_seconds * 1000)
+
+    def observe_loop_lag(self, lag_seconds: float):
+        self.loop_lag.observe(value=lag_seconds * 1000)
+        self.loop_lag_last.set(value=lag_seconds * 1000)
+
+    def add_collector(self, collector: Collector):
+        self.registry.add_collector(collector)
+
+    def render(self) -> str:
+        return self.registry.render()
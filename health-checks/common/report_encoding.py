@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Streaming Report Encoding
+=========================
+
+Incremental JSON encoding for health reports:
+- Walks the outer report structure and emits one chunk per entry, so only a
+  single result's encoded evidence is held in memory at a time
+- Serializes ``HealthCheckResult`` objects straight from their fields, with
+  no intermediate dict or deep copy of metrics/evidence
+- Leaves are encoded with orjson (numpy aware), including pretty-printing
+  that matches ``json.dump(..., indent=2)`` layout
+"""
+
+from typing import Any, Iterator, Optional
+
+import orjson
+
+from .forensic_validator import HealthCheckResult
+from .integrity import serialization_default
+
+
+# Dataclasses go through serialization_default so results keep their hash/enum form
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def encode_json(value: Any, indent: Optional[int] = None) -> bytes:
+    """Encode a single value with orjson."""
+    options = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(value, default=serialization_default, option=options)
+
+
+def iter_json(value: Any, indent: Optional[int] = 2, stream_depth: int = 3, depth: int = 0) -> Iterator[bytes]:
+    """
+    Yield the JSON encoding of ``value`` in chunks.
+
+    Containers down to ``stream_depth`` levels are walked entry by entry;
+    anything deeper is encoded in one orjson call. ``indent`` is either
+    ``None`` (compact) or ``2``, the only width orjson pretty-prints.
+    ``depth`` sets the nesting level when ``value`` is embedded in an
+    enclosing document that is being written piecewise.
+    """
+    if indent not in (None, 2):
+        raise ValueError("indent must be None or 2")
+    yield from _iter_value(value, indent, depth, stream_depth)
+
+
+def _iter_value(value: Any, indent: Optional[int], depth: int, stream_depth: int) -> Iterator[bytes]:
+    if depth < stream_depth:
+        if isinstance(value, HealthCheckResult):
+            yield from _iter_items(value.iter_fields(), indent, depth, stream_depth)
+            return
+        if isinstance(value, dict) and value:
+            yield from _iter_items(value.items(), indent, depth, stream_depth)
+            return
+        if isinstance(value, (list, tuple)) and value:
+            yield from _iter_sequence(value, indent, depth, stream_depth)
+            return
+
+    encoded = encode_json(value, indent)
+    if indent and depth and b"\n" in encoded:
+        encoded = encoded.replace(b"\n", b"\n" + b" " * (indent * depth))
+    yield encoded
+
+
+def _iter_items(items, indent: Optional[int], depth: int, stream_depth: int) -> Iterator[bytes]:
+    if indent:
+        opening = b"{\n" + b" " * (indent * (depth + 1))
+        separator = b",\n" + b" " * (indent * (depth + 1))
+        closing = b"\n" + b" " * (indent * depth) + b"}"
+        key_separator = b": "
+    else:
+        opening, separator, closing, key_separator = b"{", b",", b"}", b":"
+
+    first = True
+    for key, item in items:
+        yield (opening if first else separator) + encode_json(str(key)) + key_separator
+        first = False
+        yield from _iter_value(item, indent, depth + 1, stream_depth)
+    yield closing if not first else b"{}"
+
+
+def _iter_sequence(values, indent: Optional[int], depth: int, stream_depth: int) -> Iterator[bytes]:
+    if indent:
+        opening = b"[\n" + b" " * (indent * (depth + 1))
+        separator = b",\n" + b" " * (indent * (depth + 1))
+        closing = b"\n" + b" " * (indent * depth) + b"]"
+    else:
+        opening, separator, closing = b"[", b",", b"]"
+
+    for index, item in enumerate(values):
+        yield opening if index == 0 else separator
+        yield from _iter_value(item, indent, depth + 1, stream_depth)
+    yield closing
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Atomic Streaming Report Writer
+==============================
+
+Crash-safe output of health reports:
+- Sections are encoded and written one at a time as they are handed over,
+  so a report is never materialized as a second in-memory document
+- Output goes to a temporary file in the target directory and is published
+  with an atomic rename; readers see either the previous or the new report,
+  never a truncated one
+- Formats: pretty JSON, NDJSON (one record per section / per result),
+  msgpack record stream, and YAML
+- Optional gzip or xz compression applied while streaming
+
+Forensic Methodology Applied:
+- Data is fsync'd before the rename and the directory entry afterwards,
+  so a published report survives power loss
+"""
+
+import gzip
+import importlib.util
+import lzma
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+import yaml
+
+from .integrity import serialization_default
+from .report_encoding import encode_json, iter_json
+
+
+REPORT_FORMATS = ("json", "ndjson", "msgpack", "yaml")
+REPORT_COMPRESSIONS = ("gzip", "xz")
+
+# Sections whose entries are written as individual NDJSON/msgpack records
+PER_ENTRY_SECTIONS = ("detailed_results", "results")
+
+
+def check_report_format(output_format: str):
+    """Fail fast when a report format's optional dependency is missing."""
+    if output_format not in REPORT_FORMATS:
+        raise ValueError(f"Unsupported report format: {output_format}")
+    if output_format == "msgpack" and importlib.util.find_spec("msgpack") is None:
+        raise ImportError("msgpack report output requires the 'msgpack' package")
+
+
+class AtomicReportWriter:
+    """
+    Write a report section by section to a temp file, then rename into place.
+
+    Usable as a context manager: the report is published on a clean exit and
+    the temporary file is discarded if an exception escapes.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        output_format: str = "json",
+        compression: Optional[str] = None,
+        fsync: bool = True
+    ):
+        check_report_format(output_format)
+        if compression is not None and compression not in REPORT_COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        self.path = Path(path)
+        self.output_format = output_format
+        self.compression = compression
+        self.fsync = fsync
+
+        self.bytes_written = 0
+        self.sections_written = 0
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._temp_path: Optional[Path] = None
+        self._packer = None
+
+        if output_format == "msgpack":
+            import msgpack
+            self._packer = msgpack.Packer(default=_msgpack_default)
+
+    def __enter__(self) -> "AtomicReportWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def open(self):
+        """Create the temporary file next to the destination."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent
+        )
+        self._temp_path = Path(temp_name)
+        self._raw = os.fdopen(fd, "wb")
+
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb", filename=self.path.name)
+        elif self.compression == "xz":
+            self._stream = lzma.LZMAFile(self._raw, mode="wb")
+        else:
+            self._stream = self._raw
+
+    def write_report(self, report: Dict[str, Any]):
+        """Write every top-level section of a report in order."""
+        for name, value in report.items():
+            self.write_section(name, value)
+
+    def write_section(self, name: str, value: Any):
+        """Encode and write one top-level section."""
+        if self._stream is None:
+            raise RuntimeError("Report writer is not open")
+
+        if self.output_format == "json":
+            prefix = b"{\n  " if self.sections_written == 0 else b",\n  "
+            self._write(prefix + encode_json(str(name)) + b": ")
+            for chunk in iter_json(value, indent=2, depth=1):
+                self._write(chunk)
+
+        elif self.output_format == "yaml":
+            # Concatenated single-key mappings form one valid top-level mapping
+            self._write(yaml.dump({name: value}, default_flow_style=False).encode())
+
+        elif name in PER_ENTRY_SECTIONS and isinstance(value, dict):
+            for key, entry in value.items():
+                self._write_record({"section": name, "key": key, "data": entry})
+        else:
+            self._write_record({"section": name, "data": value})
+
+        self.sections_written += 1
+
+    def commit(self) -> Path:
+        """Finish the document, make it durable and atomically publish it."""
+        if self.output_format == "json":
+            self._write(b"{}\n" if self.sections_written == 0 else b"\n}\n")
+
+        try:
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            if self.fsync:
+                os.fsync(self._raw.fileno())
+            self._raw.close()
+
+            mode = self.path.stat().st_mode & 0o777 if self.path.exists() else 0o644
+            os.chmod(self._temp_path, mode)
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+        if self.fsync:
+            self._fsync_directory()
+        self._stream = self._raw = self._temp_path = None
+        return self.path
+
+    def abort(self):
+        """Discard the partially written temporary file."""
+        for stream in (self._stream, self._raw):
+            try:
+                if stream is not None:
+                    stream.close()
+            except Exception:
+                pass
+        if self._temp_path is not None:
+            try:
+                self._temp_path.unlink()
+            except FileNotFoundError:
+                pass
+        self._stream = self._raw = self._temp_path = None
+
+    def _write_record(self, record: Dict[str, Any]):
+        if self.output_format == "msgpack":
+            self._write(self._packer.pack(record))
+        else:
+            self._write(encode_json(record) + b"\n")
+
+    def _write(self, data: bytes):
+        self._stream.write(data)
+        self.bytes_written += len(data)
+
+    def _fsync_directory(self):
+        try:
+            directory_fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directory_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_fd)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert values msgpack cannot pack natively (numpy, enums, datetimes, results)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return serialization_default(obj)
+
+
+def write_report_atomically(
+    report: Dict[str, Any],
+    path: Path,
+    output_format: str = "json",
+    compression: Optional[str] = None
+) -> AtomicReportWriter:
+    """Convenience wrapper: stream a complete report to ``path`` atomically."""
+    writer = AtomicReportWriter(path, output_format, compression)
+    with writer:
+        writer.write_report(report)
+    return writer
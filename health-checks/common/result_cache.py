@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Health Check Result Cache
+=========================
+
+Per-check result caching with stale-while-revalidate semantics:
+- Within ``ttl_seconds`` a cached result is served as-is
+- Up to ``stale_while_revalidate_seconds`` past the TTL the cached result is
+  served immediately while a single background execution refreshes it
+- Beyond that (or with no entry) the check is executed; concurrent callers
+  share one in-flight execution instead of stampeding the target
+
+Forensic Methodology Applied:
+- Every served result is labelled with its cache state and age, so a report
+  never presents a reused observation as a fresh one
+- Execution failures (errors, deadline timeouts) are never cached
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+
+# Result check types that describe a failed execution rather than an observation
+UNCACHEABLE_CHECK_TYPES = ("error_handling", "execution_error", "timeout")
+
+
+@dataclass
+class CachePolicy:
+    """Freshness window of one check's results (seconds)."""
+    ttl_seconds: float = 0.0
+    stale_while_revalidate_seconds: float = 0.0
+
+
+class CacheLookup(NamedTuple):
+    """A served result and where it came from."""
+    result: Any
+    state: str  # executed | cached | stale
+    age_seconds: float
+
+    def marker(self) -> Dict[str, Any]:
+        return {"state": self.state, "age_seconds": self.age_seconds}
+
+
+class ResultCache:
+    """Latest cacheable result per check plus single-flight (re)execution."""
+
+    def __init__(
+        self,
+        default_policy: Optional[CachePolicy] = None,
+        policies: Optional[Dict[str, CachePolicy]] = None
+    ):
+        self.default_policy = default_policy or CachePolicy()
+        self.policies = dict(policies or {})
+        self._entries: Dict[str, Any] = {}
+        self._stored_at: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "revalidations": 0, "shared_executions": 0}
+
+    def policy(self, name: str) -> CachePolicy:
+        return self.policies.get(name, self.default_policy)
+
+    def store(self, name: str, result: Any):
+        """Record a freshly executed result (failed executions are ignored)."""
+        if getattr(result, "check_type", None) in UNCACHEABLE_CHECK_TYPES:
+            return
+        self._entries[name] = result
+        self._stored_at[name] = time.monotonic()
+
+    def age(self, name: str) -> Optional[float]:
+        stored_at = self._stored_at.get(name)
+        return time.monotonic() - stored_at if stored_at is not None else None
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one cached result, or all of them."""
+        if name is None:
+            self._entries.clear()
+            self._stored_at.clear()
+        else:
+            self._entries.pop(name, None)
+            self._stored_at.pop(name, None)
+
+    async def get(self, name: str, execute: Callable[[], Awaitable[Any]]) -> CacheLookup:
+        """Serve ``name`` from cache when the policy allows, otherwise via ``execute()``."""
+        policy = self.policy(name)
+        age = self.age(name)
+
+        if age is not None and age < policy.ttl_seconds:
+            self.stats["hits"] += 1
+            return CacheLookup(self._entries[name], "cached", age)
+
+        if age is not None and age < policy.ttl_seconds + policy.stale_while_revalidate_seconds:
+            self.stats["stale_hits"] += 1
+            if name not in self._inflight:
+                self.stats["revalidations"] += 1
+                self._start(name, execute)
+            return CacheLookup(self._entries[name], "stale", age)
+
+        self.stats["misses"] += 1
+        if name in self._inflight:
+            self.stats["shared_executions"] += 1
+        task = self._inflight.get(name) or self._start(name, execute)
+        # Shielded: a cancelled caller must not abort an execution others share
+        result = await asyncio.shield(task)
+        return CacheLookup(result, "executed", 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "revalidating": sorted(self._inflight)
+        }
+
+    async def close(self):
+        """Cancel background revalidations."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(self, name: str, execute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.create_task(execute(), name=f"health_check_refresh:{name}")
+        self._inflight[name] = task
+        task.add_done_callback(lambda finished: self._finished(name, finished))
+        return task
+
+    def _finished(self, name: str, task: asyncio.Task):
+        self._inflight.pop(name, None)
+        if not task.cancelled():
+            # Retrieve the exception so failed background refreshes are not reported as unhandled
+            task.exception()
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Dependency-Aware Check Scheduler
+================================
+
+Runs registered health checks as a DAG instead of fixed phases:
+- Each check starts as soon as the checks named in its ``depends_on``
+  declaration have completed; unrelated checks never wait on each other
+- Concurrency limits per check (or per shared concurrency group) plus an
+  optional global cap on simultaneously running checks
+- Per-check timeline (ready / start / end offsets) and the critical path:
+  the chain of checks that actually determined the cycle latency
+- Continuous mode: a heap of per-check due times, so every check runs on
+  its own interval with jitter and a timeout, with drift and overruns tracked;
+  dependencies gate each run on the latest outcome of the checks it depends on
+
+Forensic Methodology Applied:
+- Dependency cycles are rejected before any check runs
+- Checks skipped because a dependency failed still produce an auditable result
+"""
+
+import asyncio
+import heapq
+import random
+import time
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .forensic_validator import HealthCheckRegistry, HealthCheckResult, HealthStatus, Severity
+
+
+DEPENDENCY_FAILURE_POLICIES = ("run", "skip")
+
+
+def topological_order(dependencies: Mapping[str, Sequence[str]]) -> List[str]:
+    """Order checks so that every check follows its dependencies (Kahn's algorithm)."""
+    unknown = sorted({
+        dependency
+        for deps in dependencies.values()
+        for dependency in deps
+        if dependency not in dependencies
+    })
+    if unknown:
+        raise ValueError(f"Unknown health check dependencies: {unknown}")
+
+    indegree = {name: len(set(deps)) for name, deps in dependencies.items()}
+    dependents: Dict[str, List[str]] = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dependency in set(deps):
+            dependents[dependency].append(name)
+
+    ready = deque(name for name, degree in indegree.items() if degree == 0)
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for dependent in dependents[name]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(dependencies):
+        cyclic = sorted(name for name, degree in indegree.items() if degree > 0)
+        raise ValueError(f"Health check dependency cycle among: {cyclic}")
+    return order
+
+
+@dataclass
+class CheckTiming:
+    """Timeline of one check within a scheduling cycle (seconds from cycle start)."""
+    name: str
+    depends_on: Tuple[str, ...]
+    concurrency_group: str
+    ready_at: float = 0.0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    skipped: bool = False
+    cache_state: Optional[str] = None
+    result_age_seconds: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+    @property
+    def queued(self) -> float:
+        """Time spent waiting for a concurrency slot after dependencies completed."""
+        return self.started_at - self.ready_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "depends_on": list(self.depends_on),
+            "concurrency_group": self.concurrency_group,
+            "ready_offset_seconds": self.ready_at,
+            "start_offset_seconds": self.started_at,
+            "end_offset_seconds": self.finished_at,
+            "duration_seconds": self.duration,
+            "queued_seconds": self.queued,
+            "skipped": self.skipped,
+            "cache_state": self.cache_state,
+            "result_age_seconds": self.result_age_seconds
+        }
+
+
+class DependencyScheduler:
+    """
+    Execute the checks of a ``HealthCheckRegistry`` as a dependency DAG.
+
+    ``concurrency_limits`` maps a concurrency group (by default the check
+    name) to the number of executions allowed at once; groups without an
+    entry use ``default_check_concurrency``. ``max_concurrent_checks`` caps
+    the total across all groups (``None`` for no cap).
+    """
+
+    def __init__(
+        self,
+        registry: HealthCheckRegistry,
+        max_concurrent_checks: Optional[int] = None,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        default_check_concurrency: Optional[int] = 1,
+        on_dependency_failure: str = "run"
+    ):
+        if on_dependency_failure not in DEPENDENCY_FAILURE_POLICIES:
+            raise ValueError(f"Unknown dependency failure policy: {on_dependency_failure}")
+
+        self.registry = registry
+        self.max_concurrent_checks = max_concurrent_checks
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self.default_check_concurrency = default_check_concurrency
+        self.on_dependency_failure = on_dependency_failure
+
+        self._global_slots = asyncio.Semaphore(max_concurrent_checks) if max_concurrent_checks else None
+        self._group_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def dependency_graph(self, check_names: Optional[List[str]] = None) -> Dict[str, Tuple[str, ...]]:
+        """Dependencies restricted to ``check_names`` (all registered checks by default)."""
+        names = list(check_names) if check_names is not None else list(self.registry.checks)
+        selected = set(names)
+        return {
+            name: tuple(dep for dep in self.registry.dependencies.get(name, ()) if dep in selected)
+            for name in names
+        }
+
+    def validate(self, check_names: Optional[List[str]] = None) -> List[str]:
+        """Return an execution order, raising ``ValueError`` on cycles or unknown checks."""
+        return topological_order(self.dependency_graph(check_names))
+
+    async def run(
+        self,
+        check_names: Optional[List[str]] = None,
+        use_cache: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run the selected checks, each as soon as its dependencies complete.
+
+        With ``use_cache`` results are served through the registry's result
+        cache; the cache state and result age are recorded in the timeline.
+
+        Returns ``(outcomes, schedule)``: outcomes map check name to its
+        ``HealthCheckResult`` (or the exception it raised), and schedule is
+        the timeline / critical path report.
+        """
+        graph = self.dependency_graph(check_names)
+        order = topological_order(graph)
+
+        cycle_start = time.perf_counter()
+        timings = {
+            name: CheckTiming(
+                name=name,
+                depends_on=graph[name],
+                concurrency_group=self.registry.concurrency_groups.get(name, name)
+            )
+            for name in order
+        }
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in order:
+            tasks[name] = asyncio.create_task(
+                self._run_check(name, {dep: tasks[dep] for dep in graph[name]}, timings, cycle_start, use_cache),
+                name=f"health_check:{name}"
+            )
+
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        makespan = time.perf_counter() - cycle_start
+
+        by_name = dict(zip(tasks, outcomes))
+        # Report in registration order rather than topological order
+        return {name: by_name[name] for name in graph}, self._build_schedule_report(timings, makespan)
+
+    async def _run_check(
+        self,
+        name: str,
+        dependency_tasks: Dict[str, asyncio.Task],
+        timings: Dict[str, CheckTiming],
+        cycle_start: float,
+        use_cache: bool = False
+    ) -> HealthCheckResult:
+        timing = timings[name]
+        if dependency_tasks:
+            await asyncio.wait(dependency_tasks.values())
+        timing.ready_at = time.perf_counter() - cycle_start
+
+        if self.on_dependency_failure == "skip":
+            failed = [
+                dep for dep, task in dependency_tasks.items()
+                if timings[dep].skipped or self._task_failed(task)
+            ]
+            if failed:
+                timing.started_at = timing.finished_at = timing.ready_at
+                timing.skipped = True
+                return self._skipped_result(name, failed)
+
+        async with self.slot(name):
+            timing.started_at = time.perf_counter() - cycle_start
+            try:
+                if not use_cache:
+                    return await self.registry.execute_check(name)
+                lookup = await self.registry.execute_cached(name)
+                timing.cache_state = lookup.state
+                timing.result_age_seconds = lookup.age_seconds
+                return lookup.result
+            finally:
+                timing.finished_at = time.perf_counter() - cycle_start
+
+    @asynccontextmanager
+    async def slot(self, name: str):
+        """Hold the concurrency slots (check group, then global) for one execution."""
+        async with AsyncExitStack() as slots:
+            group_slot = self._group_slot(self.registry.concurrency_groups.get(name, name))
+            if group_slot is not None:
+                await slots.enter_async_context(group_slot)
+            if self._global_slots is not None:
+                await slots.enter_async_context(self._global_slots)
+            yield
+
+    def _group_slot(self, group: str) -> Optional[asyncio.Semaphore]:
+        if group not in self._group_slots:
+            limit = self.concurrency_limits.get(group, self.default_check_concurrency)
+            self._group_slots[group] = asyncio.Semaphore(limit) if limit else None
+        return self._group_slots[group]
+
+    @staticmethod
+    def _task_failed(task: asyncio.Task) -> bool:
+        if task.cancelled() or task.exception() is not None:
+            return True
+        return task.result().status == HealthStatus.CRITICAL
+
+    def _skipped_result(self, name: str, failed_dependencies: List[str]) -> HealthCheckResult:
+        result = self.registry.checks[name]._create_result(
+            check_type="dependency_skipped",
+            status=HealthStatus.UNKNOWN,
+            score=0.0,
+            metrics={},
+            evidence={"failed_dependencies": failed_dependencies},
+            duration_ms=0.0,
+            error_message=f"Skipped: dependencies failed: {', '.join(failed_dependencies)}",
+            severity=Severity.MEDIUM
+        )
+        self.registry.logger.log_health_check(result)
+        return result
+
+    @staticmethod
+    def _build_schedule_report(timings: Dict[str, CheckTiming], makespan: float) -> Dict[str, Any]:
+        """Timeline plus the critical path, traced back from the last check to finish."""
+        critical_path: List[CheckTiming] = []
+        node = max(timings.values(), key=lambda t: t.finished_at, default=None)
+        while node is not None:
+            critical_path.append(node)
+            # The dependency that finished last is the one that gated this check
+            node = max(
+                (timings[dep] for dep in node.depends_on),
+                key=lambda t: t.finished_at,
+                default=None
+            )
+        critical_path.reverse()
+
+        total_check_seconds = sum(t.duration for t in timings.values())
+        return {
+            "strategy": "dependency_dag",
+            "makespan_seconds": makespan,
+            "critical_path": [t.name for t in critical_path],
+            "critical_path_seconds": critical_path[-1].finished_at if critical_path else 0.0,
+            "critical_path_execution_seconds": sum(t.duration for t in critical_path),
+            "critical_path_queued_seconds": sum(t.queued for t in critical_path),
+            "total_check_seconds": total_check_seconds,
+            "parallelism": total_check_seconds / makespan if makespan > 0 else 0.0,
+            "checks": {name: timing.to_dict() for name, timing in timings.items()}
+        }
+
+
+@dataclass
+class IntervalPolicy:
+    """Continuous-mode schedule of one check."""
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    timeout_seconds: Optional[float] = None
+
+    def __post_init__(self):
+        if self.interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        if self.timeout_seconds is None:
+            # A run outliving its interval would only be skipped at the next tick
+            self.timeout_seconds = self.interval_seconds
+
+    def jitter(self) -> float:
+        return random.uniform(0.0, self.jitter_seconds) if self.jitter_seconds > 0 else 0.0
+
+
+@dataclass
+class IntervalCheckStats:
+    """Drift and overrun counters for one continuously scheduled check."""
+    starts: int = 0
+    runs: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    overruns: int = 0
+    skipped_ticks: int = 0
+    missed_ticks: int = 0
+    dependency_skips: int = 0
+    last_drift_seconds: float = 0.0
+    max_drift_seconds: float = 0.0
+    total_drift_seconds: float = 0.0
+    last_duration_seconds: float = 0.0
+    max_duration_seconds: float = 0.0
+    next_due_in_seconds: float = 0.0
+
+    def record_start(self, drift: float):
+        self.starts += 1
+        self.last_drift_seconds = drift
+        self.max_drift_seconds = max(self.max_drift_seconds, drift)
+        self.total_drift_seconds += drift
+
+    def record_finish(self, duration: float, interval: float):
+        self.runs += 1
+        self.last_duration_seconds = duration
+        self.max_duration_seconds = max(self.max_duration_seconds, duration)
+        if duration > interval:
+            self.overruns += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "starts": self.starts,
+            "runs": self.runs,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "missed_ticks": self.missed_ticks,
+            "dependency_skips": self.dependency_skips,
+            "last_drift_seconds": self.last_drift_seconds,
+            "max_drift_seconds": self.max_drift_seconds,
+            "mean_drift_seconds": self.total_drift_seconds / self.starts if self.starts else 0.0,
+            "last_duration_seconds": self.last_duration_seconds,
+            "max_duration_seconds": self.max_duration_seconds,
+            "next_due_in_seconds": self.next_due_in_seconds
+        }
+
+
+class IntervalScheduler:
+    """
+    Run each check on its own interval using a min-heap of due times.
+
+    Due times advance at a fixed rate from the previous *scheduled* time, so
+    slow wake-ups do not accumulate drift; jitter is applied per tick on top
+    of that timeline. A tick that arrives while the previous run of the same
+    check is still in flight is skipped (never stacked), and ticks the loop
+    slept through entirely are counted as missed. Results are handed to
+    ``on_result(name, result_or_exception)`` as each run completes.
+
+    Dependencies follow the ``DependencyScheduler``: a check's first run
+    waits for the first run of each dependency, and with the ``skip`` policy
+    a run whose dependencies last failed reports UNKNOWN instead of probing.
+    """
+
+    def __init__(
+        self,
+        scheduler: DependencyScheduler,
+        policies: Dict[str, IntervalPolicy],
+        on_result: Optional[Callable[[str, Any], None]] = None
+    ):
+        unknown = sorted(set(policies) - set(scheduler.registry.checks))
+        if unknown:
+            raise ValueError(f"Interval policies for unknown health checks: {unknown}")
+
+        self.scheduler = scheduler
+        self.registry = scheduler.registry
+        # Dependencies first, so that same-time ticks dispatch in DAG order;
+        # raises on dependency cycles before anything is scheduled
+        self.dependencies = scheduler.dependency_graph(list(policies))
+        self.policies = {name: policies[name] for name in topological_order(self.dependencies)}
+        self.on_result = on_result
+        self.stats = {name: IntervalCheckStats() for name in policies}
+
+        # Most recent outcome per check, consulted by its dependents
+        self._latest: Dict[str, Any] = {}
+        self._first_results: Dict[str, asyncio.Event] = {}
+
+        self._heap: List[Tuple[float, int, str, float]] = []
+        self._sequence = 0
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def run(self):
+        """Dispatch checks until ``stop()`` is called."""
+        loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        self._first_results = {name: asyncio.Event() for name in self.policies}
+
+        now = loop.time()
+        for name, policy in self.policies.items():
+            self._push(now, name, policy)
+
+        try:
+            while not self._stopping.is_set() and self._heap:
+                due, _, name, base = self._heap[0]
+                delay = due - loop.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._heap)
+                self._dispatch(name, due, loop.time())
+
+                # Fixed-rate advance; ticks already in the past are missed, not replayed
+                policy = self.policies[name]
+                next_base = base + policy.interval_seconds
+                now = loop.time()
+                if next_base <= now:
+                    missed = int((now - next_base) // policy.interval_seconds) + 1
+                    self.stats[name].missed_ticks += missed
+                    next_base += missed * policy.interval_seconds
+                self._push(next_base, name, policy)
+
+            if self._stopping.is_set():
+                return
+            await self._stopping.wait()
+        finally:
+            await self._cancel_running()
+
+    def stop(self):
+        """Ask ``run()`` to return; in-flight checks are cancelled."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-check drift / overrun counters and time until the next run."""
+        if self._heap:
+            now = asyncio.get_running_loop().time()
+            for due, _, name, _ in self._heap:
+                self.stats[name].next_due_in_seconds = max(due - now, 0.0)
+        return {
+            "strategy": "interval_heap",
+            "running": sorted(self._running),
+            "checks": {
+                name: {
+                    "interval_seconds": self.policies[name].interval_seconds,
+                    "jitter_seconds": self.policies[name].jitter_seconds,
+                    "timeout_seconds": self.policies[name].timeout_seconds,
+                    **stats.to_dict()
+                }
+                for name, stats in self.stats.items()
+            }
+        }
+
+    def _push(self, base: float, name: str, policy: IntervalPolicy):
+        self._sequence += 1
+        heapq.heappush(self._heap, (base + policy.jitter(), self._sequence, name, base))
+
+    def _dispatch(self, name: str, due: float, now: float):
+        stats = self.stats[name]
+        if name in self._running:
+            stats.skipped_ticks += 1
+            self.registry.logger.log_audit_event(
+                "health_check_tick_skipped",
+                {"check_name": name, "reason": "previous_run_in_progress"}
+            )
+            return
+
+        stats.record_start(now - due)
+        self._running[name] = asyncio.create_task(
+            self._execute(name, self.policies[name]), name=f"health_check_interval:{name}"
+        )
+
+    async def _execute(self, name: str, policy: IntervalPolicy):
+        loop = asyncio.get_running_loop()
+        stats = self.stats[name]
+        started = loop.time()
+        failed_dependencies: List[str] = []
+        try:
+            failed_dependencies = await self._failed_dependencies(name)
+            if failed_dependencies:
+                stats.dependency_skips += 1
+                result = self.scheduler._skipped_result(name, failed_dependencies)
+            else:
+                async with self.scheduler.slot(name):
+                    # The registry enforces the deadline and keeps partial probe results
+                    result = await self.registry.execute_check(name, timeout_seconds=policy.timeout_seconds)
+                if result.check_type == "timeout":
+                    stats.timeouts += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.failures += 1
+            result = e
+        finally:
+            self._running.pop(name, None)
+
+        self._latest[name] = result
+        self._first_results[name].set()
+        if not failed_dependencies:
+            stats.record_finish(loop.time() - started, policy.interval_seconds)
+        if self.on_result is not None:
+            self.on_result(name, result)
+
+    async def _failed_dependencies(self, name: str) -> List[str]:
+        """Dependencies whose latest outcome failed (under the ``skip`` policy)."""
+        dependencies = self.dependencies[name]
+        # Like a DAG cycle, the first run starts only once its dependencies have an outcome
+        await asyncio.gather(*(
+            self._first_results[dep].wait()
+            for dep in dependencies
+            if not self._first_results[dep].is_set()
+        ))
+        if self.scheduler.on_dependency_failure != "skip":
+            return []
+        return [dep for dep in dependencies if self._outcome_failed(self._latest[dep])]
+
+    @staticmethod
+    def _outcome_failed(outcome: Any) -> bool:
+        if isinstance(outcome, BaseException):
+            return True
+        return outcome.status == HealthStatus.CRITICAL or outcome.check_type == "dependency_skipped"
+
+    async def _cancel_running(self):
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Instrumentation
+========================
+
+Low-overhead tracing of where the orchestrator spends its time:
+- Every check execution is timed twice: wall time, and the CPU time spent
+  *on the event loop* while the check's own coroutine was running (measured
+  per coroutine step, so other checks interleaving on the loop are not
+  counted). A check with loop CPU close to its wall time is blocking the
+  loop rather than waiting on a service
+- ``@traced_stage`` marks stages inside checks (cross-validation, baseline
+  updates, integrity verification, ...); synchronous stages also record CPU
+- Event-loop stalls reported by the lag sampler are recorded on their own
+  track, so the overlapping check and stage spans show what blocked the loop
+- Events are kept in a bounded ring buffer and exported in Chrome trace
+  format (chrome://tracing, Perfetto), one track per check
+
+Overhead is two clock reads per coroutine step and one deque append per
+span, so tracing is meant to stay enabled in production.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional
+
+
+EVENT_LOOP_TRACK = "event_loop"
+
+_current_track: ContextVar[Optional[str]] = ContextVar("health_check_trace_track", default=None)
+
+
+class LoopTimedCoroutine:
+    """
+    Awaitable wrapper that accumulates the thread CPU time of each step of
+    the wrapped coroutine (the time it holds the event loop).
+    """
+
+    __slots__ = ("_coro", "cpu_seconds", "steps")
+
+    def __init__(self, coro: Awaitable[Any]):
+        self._coro = coro
+        self.cpu_seconds = 0.0
+        self.steps = 0
+
+    def __await__(self):
+        coro = self._coro
+        value, error = None, None
+        while True:
+            started = time.thread_time()
+            try:
+                yielded = coro.throw(error) if error is not None else coro.send(value)
+            except StopIteration as stop:
+                self._account(started)
+                return stop.value
+            except BaseException:
+                self._account(started)
+                raise
+            self._account(started)
+
+            value, error = None, None
+            try:
+                value = yield yielded
+            except BaseException as e:
+                error = e
+
+    def _account(self, started: float):
+        self.cpu_seconds += time.thread_time() - started
+        self.steps += 1
+
+
+class CheckSpan:
+    """Timing of one check execution, filled in by ``Tracer.check_span``."""
+
+    __slots__ = ("name", "args", "wall_seconds", "_timed")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.args: Dict[str, Any] = {}
+        self.wall_seconds = 0.0
+        self._timed: Optional[LoopTimedCoroutine] = None
+
+    def timed(self, coro: Awaitable[Any]) -> LoopTimedCoroutine:
+        self._timed = LoopTimedCoroutine(coro)
+        return self._timed
+
+    @property
+    def loop_cpu_seconds(self) -> float:
+        return self._timed.cpu_seconds if self._timed is not None else 0.0
+
+
+class Tracer:
+    """Bounded buffer of Chrome trace events plus the latest per-check timings."""
+
+    def __init__(self, enabled: bool = True, max_events: int = 50000):
+        self.enabled = enabled
+        self._origin_ns = time.perf_counter_ns()
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._tracks: Dict[str, int] = {EVENT_LOOP_TRACK: 0}
+        self._tracks_lock = threading.Lock()
+        self.active_checks: Dict[str, int] = {}
+        self.check_timings: Dict[str, Dict[str, float]] = {}
+        self.events_recorded = 0
+
+    def configure(self, enabled: bool = True, max_events: int = 50000):
+        self.enabled = enabled
+        if max_events != self._events.maxlen:
+            self._events = deque(self._events, maxlen=max_events)
+
+    @contextmanager
+    def check_span(self, check_name: str) -> Iterator[CheckSpan]:
+        """
+        Time one check execution. Wrap the check coroutine with
+        ``span.timed(...)`` to measure its event-loop CPU; stages started
+        inside (including in tasks created within) land on the check's track.
+        """
+        span = CheckSpan(check_name)
+        token = _current_track.set(check_name)
+        self.active_checks[check_name] = self.active_checks.get(check_name, 0) + 1
+        started_ns = time.perf_counter_ns()
+        try:
+            yield span
+        finally:
+            duration_ns = time.perf_counter_ns() - started_ns
+            _current_track.reset(token)
+            self._leave_check(check_name)
+
+            span.wall_seconds = duration_ns / 1e9
+            cpu_ms = span.loop_cpu_seconds * 1000
+            self.check_timings[check_name] = {
+                "wall_ms": duration_ns / 1e6,
+                "loop_cpu_ms": cpu_ms,
+                "loop_cpu_ratio": span.loop_cpu_seconds / span.wall_seconds if span.wall_seconds else 0.0
+            }
+            if self.enabled:
+                self.record(
+                    check_name, "check", started_ns, duration_ns, check_name,
+                    {"loop_cpu_ms": cpu_ms, **span.args}
+                )
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", measure_cpu: bool = True, **args: Any):
+        """
+        Time a stage on the current check's track. CPU time is only exact for
+        code that does not await (other coroutines would run in between).
+        """
+        if not self.enabled:
+            yield
+            return
+        started_ns = time.perf_counter_ns()
+        started_cpu = time.thread_time() if measure_cpu else None
+        try:
+            yield
+        finally:
+            if started_cpu is not None:
+                args["cpu_ms"] = (time.thread_time() - started_cpu) * 1000
+            self.record(name, category, started_ns, time.perf_counter_ns() - started_ns, None, args)
+
+    def record_stall(self, lag_seconds: float):
+        """Record an event-loop stall that ended now and lasted ``lag_seconds``."""
+        if not self.enabled:
+            return
+        duration_ns = int(lag_seconds * 1e9)
+        self.record(
+            "event_loop_stall", "loop", time.perf_counter_ns() - duration_ns, duration_ns, EVENT_LOOP_TRACK,
+            {"lag_ms": lag_seconds * 1000, "active_checks_at_detection": sorted(self.active_checks)}
+        )
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        started_ns: int,
+        duration_ns: int,
+        track: Optional[str] = None,
+        args: Optional[Dict[str, Any]] = None
+    ):
+        track = track or _current_track.get() or threading.current_thread().name
+        self._events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (started_ns - self._origin_ns) / 1000,
+            "dur": duration_ns / 1000,
+            "pid": 1,
+            "tid": self._track_id(track),
+            "args": args or {}
+        })
+        self.events_recorded += 1
+
+    def export_chrome_trace(self) -> Dict[str, Any]:
+        """Buffered events as a Chrome trace document (timestamps in microseconds)."""
+        with self._tracks_lock:
+            tracks = dict(self._tracks)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": track}}
+            for track, tid in tracks.items()
+        ]
+        metadata.append({"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "health-checks"}})
+        return {
+            "traceEvents": metadata + list(self._events),
+            "displayTimeUnit": "ms",
+            "otherData": {"events_recorded": self.events_recorded, "events_buffered": len(self._events)}
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "events_recorded": self.events_recorded,
+            "events_buffered": len(self._events),
+            "max_events": self._events.maxlen
+        }
+
+    def _track_id(self, track: str) -> int:
+        tid = self._tracks.get(track)
+        if tid is None:
+            # Stages may run in executor threads
+            with self._tracks_lock:
+                tid = self._tracks.setdefault(track, len(self._tracks))
+        return tid
+
+    def _leave_check(self, check_name: str):
+        remaining = self.active_checks.get(check_name, 1) - 1
+        if remaining > 0:
+            self.active_checks[check_name] = remaining
+        else:
+            self.active_checks.pop(check_name, None)
+
+
+# Process-wide tracer configured by the orchestrator
+tracer = Tracer()
+
+
+def traced_stage(name: Optional[str] = None) -> Callable:
+    """Decorator recording each call of a (sync or async) function as a stage span."""
+    def decorate(func: Callable) -> Callable:
+        stage_name = name or func.__name__.lstrip("_")
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.span(stage_name, measure_cpu=False):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
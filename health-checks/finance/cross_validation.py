@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Streaming Cross-Feed Price Validation
+=====================================
+
+Tick-level comparison of the same instruments across market data feeds:
+- Latest price / bid / ask / update time per (symbol, feed) live in
+  preallocated NumPy arrays; a symbol is mapped to its row once, so a tick
+  is one dictionary lookup plus array stores (no per-tick containers)
+- Feeds are aligned on a common time grid per symbol: at every grid step the
+  latest *fresh* price of each feed is sampled (as-of join) into a bounded
+  ring buffer, which doubles as the per-symbol price history
+- Deviation (current and rolling over the window), staleness and crossed /
+  locked books (per feed and across the consolidated book) are computed
+  over all symbols at once
+
+Forensic Methodology Applied:
+- Stale quotes are excluded from comparisons and reported, never silently
+  compared against live ones
+- Reported detail lists are bounded; totals always cover every symbol
+"""
+
+import time
+import warnings
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class CrossFeedValidator:
+    """Time-aligned price state of every symbol on every feed."""
+
+    def __init__(
+        self,
+        feeds: Sequence[str],
+        grid_seconds: float = 0.5,
+        history_seconds: float = 300.0,
+        rolling_window_seconds: float = 60.0,
+        stale_after_seconds: float = 5.0,
+        initial_symbols: int = 256,
+        max_details: int = 20
+    ):
+        self.feeds = list(feeds)
+        self.grid_seconds = grid_seconds
+        self.history_length = max(int(history_seconds / grid_seconds), 1)
+        self.rolling_length = min(max(int(rolling_window_seconds / grid_seconds), 1), self.history_length)
+        self.stale_after_seconds = stale_after_seconds
+        self.max_details = max_details
+
+        self._feed_columns = {name: column for column, name in enumerate(self.feeds)}
+        self._symbol_rows: Dict[str, int] = {}
+        self.symbols: List[str] = []
+
+        feed_count = len(self.feeds)
+        self._price = np.full((initial_symbols, feed_count), np.nan)
+        self._bid = np.full((initial_symbols, feed_count), np.nan)
+        self._ask = np.full((initial_symbols, feed_count), np.nan)
+        self._updated = np.full((initial_symbols, feed_count), -np.inf)
+        self._history = np.full((initial_symbols, self.history_length, feed_count), np.nan, dtype=np.float32)
+
+        self._slot = -1  # ring buffer slot of the newest grid sample
+        self._samples = 0
+        self._next_sample_at: Optional[float] = None
+        self.ticks = 0
+
+    # -- ingestion ---------------------------------------------------------
+
+    def update(
+        self,
+        feed: str,
+        symbol: str,
+        price: float,
+        bid: float = np.nan,
+        ask: float = np.nan,
+        now: Optional[float] = None
+    ):
+        """Record one tick."""
+        now = time.monotonic() if now is None else now
+        self._advance(now)
+        row = self._symbol_rows.get(symbol)
+        if row is None:
+            row = self._add_symbol(symbol)
+        column = self._feed_columns[feed]
+        self._price[row, column] = price
+        self._bid[row, column] = bid
+        self._ask[row, column] = ask
+        self._updated[row, column] = now
+        self.ticks += 1
+
+    def update_batch(
+        self,
+        feed: str,
+        symbols: Sequence[str],
+        prices: np.ndarray,
+        bids: Optional[np.ndarray] = None,
+        asks: Optional[np.ndarray] = None,
+        now: Optional[float] = None
+    ):
+        """Record a batch of ticks from one feed (one message, one snapshot)."""
+        if not len(symbols):
+            return
+        now = time.monotonic() if now is None else now
+        self._advance(now)
+        rows = self._rows(symbols)
+        column = self._feed_columns[feed]
+        self._price[rows, column] = prices
+        self._bid[rows, column] = np.nan if bids is None else bids
+        self._ask[rows, column] = np.nan if asks is None else asks
+        self._updated[rows, column] = now
+        self.ticks += len(rows)
+
+    def _rows(self, symbols: Sequence[str]) -> np.ndarray:
+        symbol_rows = self._symbol_rows
+        return np.fromiter(
+            (symbol_rows[s] if s in symbol_rows else self._add_symbol(s) for s in symbols),
+            dtype=np.intp, count=len(symbols)
+        )
+
+    def _add_symbol(self, symbol: str) -> int:
+        row = len(self.symbols)
+        if row == self._price.shape[0]:
+            self._grow(row * 2)
+        self._symbol_rows[symbol] = row
+        self.symbols.append(symbol)
+        return row
+
+    def _grow(self, capacity: int):
+        def grown(array: np.ndarray, fill: float) -> np.ndarray:
+            resized = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            resized[:array.shape[0]] = array
+            return resized
+
+        self._price = grown(self._price, np.nan)
+        self._bid = grown(self._bid, np.nan)
+        self._ask = grown(self._ask, np.nan)
+        self._updated = grown(self._updated, -np.inf)
+        self._history = grown(self._history, np.nan)
+
+    # -- time grid -----------------------------------------------------------
+
+    def _advance(self, now: float):
+        """Sample fresh prices into every grid slot that has elapsed."""
+        if self._next_sample_at is None:
+            self._next_sample_at = now
+        if now < self._next_sample_at:
+            return
+
+        elapsed_slots = int((now - self._next_sample_at) // self.grid_seconds) + 1
+        self._next_sample_at += elapsed_slots * self.grid_seconds
+
+        count = len(self.symbols)
+        sample = np.where(self._fresh(now, count), self._price[:count], np.nan).astype(np.float32)
+        # As-of join: every elapsed slot carries the latest fresh price forward
+        for _ in range(min(elapsed_slots, self.history_length)):
+            self._slot = (self._slot + 1) % self.history_length
+            self._history[:count, self._slot] = sample
+            self._samples += 1
+
+    def _fresh(self, now: float, count: int) -> np.ndarray:
+        return (now - self._updated[:count]) <= self.stale_after_seconds
+
+    def _window(self, length: int) -> np.ndarray:
+        """The newest ``length`` grid samples, oldest first: (symbols, length, feeds)."""
+        length = min(length, self._samples, self.history_length)
+        count = len(self.symbols)
+        if length == 0:
+            return np.empty((count, 0, len(self.feeds)), dtype=np.float32)
+        slots = (np.arange(self._slot - length + 1, self._slot + 1)) % self.history_length
+        return self._history[:count, slots]
+
+    def price_history(self, symbol: str) -> Dict[str, Any]:
+        """Grid-aligned price history of one symbol per feed (oldest first, NaN = no fresh quote)."""
+        row = self._symbol_rows.get(symbol)
+        if row is None:
+            return {}
+        window = self._window(self.history_length)[row]
+        return {
+            "grid_seconds": self.grid_seconds,
+            "feeds": {feed: window[:, column].tolist() for feed, column in self._feed_columns.items()}
+        }
+
+    # -- analysis ------------------------------------------------------------
+
+    def analyze(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Deviation, staleness and crossed-book findings across every symbol."""
+        now = time.monotonic() if now is None else now
+        self._advance(now)
+        count = len(self.symbols)
+
+        fresh = self._fresh(now, count)
+        quoted = ~np.isnan(self._price[:count])
+        prices = np.where(fresh, self._price[:count], np.nan)
+
+        current_deviation, feeds_compared = _max_deviation_percent(prices)
+        validated = feeds_compared >= 2
+
+        rolling = _max_deviation_percent(self._window(self.rolling_length).astype(np.float64))[0]
+        rolling_max = _nan_reduce(np.fmax.reduce, rolling, axis=1) if rolling.size else np.full(count, np.nan)
+
+        crossed_feeds, locked_feeds = self._crossed_books(fresh, count)
+        consolidated_crossed = self._consolidated_crossed(fresh, count)
+
+        stale = quoted & ~fresh
+        max_current = float(np.nanmax(current_deviation[validated])) if validated.any() else 0.0
+        max_rolling = float(np.nanmax(rolling_max)) if np.isfinite(rolling_max).any() else 0.0
+
+        return {
+            "symbols_tracked": count,
+            "symbols_validated": int(validated.sum()),
+            "max_price_deviation_percent": max_current,
+            "rolling_window_seconds": self.rolling_length * self.grid_seconds,
+            "rolling_max_price_deviation_percent": max_rolling,
+            "stale_quotes": {feed: int(stale[:, column].sum()) for feed, column in self._feed_columns.items()},
+            "crossed_books": self._symbol_details(crossed_feeds.any(axis=1), crossed_feeds),
+            "locked_books": self._symbol_details(locked_feeds.any(axis=1), locked_feeds),
+            "consolidated_crossed_symbols": [self.symbols[row] for row in np.flatnonzero(consolidated_crossed)[:self.max_details]],
+            "consolidated_crossed_count": int(consolidated_crossed.sum()),
+            "validation_details": self._deviation_details(validated, current_deviation, rolling_max, prices),
+            "ticks_ingested": self.ticks,
+            "grid_samples": self._samples
+        }
+
+    def _crossed_books(self, fresh: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        bid = self._bid[:count]
+        ask = self._ask[:count]
+        with np.errstate(invalid="ignore"):
+            crossed = fresh & (bid > ask)
+            locked = fresh & (bid == ask)
+        return crossed, locked
+
+    def _consolidated_crossed(self, fresh: np.ndarray, count: int) -> np.ndarray:
+        """Best bid on one feed above the best ask on another."""
+        best_bid = _nan_reduce(np.fmax.reduce, np.where(fresh, self._bid[:count], np.nan), axis=1)
+        best_ask = _nan_reduce(np.fmin.reduce, np.where(fresh, self._ask[:count], np.nan), axis=1)
+        with np.errstate(invalid="ignore"):
+            return best_bid > best_ask
+
+    def _symbol_details(self, mask: np.ndarray, per_feed: np.ndarray) -> Dict[str, Any]:
+        rows = np.flatnonzero(mask)
+        return {
+            "count": int(rows.size),
+            "symbols": {
+                self.symbols[row]: [self.feeds[column] for column in np.flatnonzero(per_feed[row])]
+                for row in rows[:self.max_details]
+            }
+        }
+
+    def _deviation_details(
+        self,
+        validated: np.ndarray,
+        current_deviation: np.ndarray,
+        rolling_max: np.ndarray,
+        prices: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """The most deviating validated symbols, largest first."""
+        rows = np.flatnonzero(validated)
+        if not rows.size:
+            return []
+        top = rows[np.argsort(-current_deviation[rows], kind="stable")[:self.max_details]]
+        details = []
+        for row in top:
+            feed_prices = {
+                self.feeds[column]: float(prices[row, column])
+                for column in np.flatnonzero(~np.isnan(prices[row]))
+            }
+            details.append({
+                "symbol": self.symbols[row],
+                "feeds": list(feed_prices),
+                "prices": list(feed_prices.values()),
+                "mean_price": float(np.mean(list(feed_prices.values()))),
+                "max_deviation_percent": float(current_deviation[row]),
+                "rolling_max_deviation_percent": float(rolling_max[row]) if np.isfinite(rolling_max[row]) else None
+            })
+        return details
+
+
+def _nan_reduce(reduce, values: np.ndarray, axis: int) -> np.ndarray:
+    """fmax/fmin reduction that yields NaN (not an error) for all-NaN or empty slices."""
+    if values.shape[axis] == 0:
+        return np.full(np.delete(values.shape, axis), np.nan)
+    return reduce(values, axis=axis)
+
+
+def _max_deviation_percent(prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest deviation from the cross-feed mean (percent) along the last axis,
+    and the number of feeds compared; NaN where fewer than two feeds quote.
+    """
+    valid = ~np.isnan(prices)
+    compared = valid.sum(axis=-1)
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nansum(prices, axis=-1) / compared
+        deviation = np.abs(prices - mean[..., None]) / np.abs(mean[..., None]) * 100
+        max_deviation = _nan_reduce(np.fmax.reduce, deviation, axis=-1)
+    return np.where(compared >= 2, max_deviation, np.nan), compared
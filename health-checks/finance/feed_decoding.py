@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Market Data Feed Decoding
+=========================
+
+Fast path from a feed payload to quote arrays:
+- Payloads are parsed once, from bytes, with orjson
+- Each feed declares its message format in ``market_data_feeds``; the
+  format is compiled once into a decoder with a fixed key path and
+  ``operator.itemgetter`` field accessors, so extraction does no shape
+  probing and no per-quote ``float()`` calls
+- Symbols, prices, bids and asks are pulled straight into NumPy arrays
+  (``np.fromiter`` per field for record layouts, a single conversion per
+  column for columnar layouts), ready for ``CrossFeedValidator.update_batch``
+- Feeds without a declared format fall back to the generic extractor, which
+  accepts ``{"quotes": [...]}``, ``{"data": [...]}`` or a single quote
+
+Format config::
+
+    format:
+      layout: records       # records (list of quote objects) | columns (parallel arrays)
+      path: "data.quotes"   # dotted key path to the quotes; "" = the message itself
+      symbol: "s"
+      price: "p"            # optional when bid and ask are given (mid price)
+      bid: "b"
+      ask: "a"
+"""
+
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+
+
+FEED_LAYOUTS = ("records", "columns")
+
+# (symbols, prices, bids, asks); bids / asks are NaN where a feed does not quote them
+Quotes = Tuple[Sequence[str], np.ndarray, np.ndarray, np.ndarray]
+
+_NO_QUOTES: Quotes = ([], np.empty(0), np.empty(0), np.empty(0))
+
+
+def decode_payload(payload: Any) -> Any:
+    """Parse a JSON payload (bytes or str); raises ``ValueError`` on malformed input."""
+    return orjson.loads(payload)
+
+
+class FeedDecoder:
+    """Generic decoder for feeds that do not declare a message format."""
+
+    def decode(self, payload: Any) -> Any:
+        return decode_payload(payload)
+
+    def extract(self, data: Any) -> Quotes:
+        """Quote arrays of one decoded message; a quote without a price is priced at its mid."""
+        if isinstance(data, dict) and isinstance(data.get("quotes"), list):
+            quotes = data["quotes"]
+        elif isinstance(data, dict) and isinstance(data.get("data"), list):
+            quotes = data["data"]
+        elif isinstance(data, dict) and "symbol" in data:
+            quotes = [data]
+        else:
+            return _NO_QUOTES
+
+        symbols = []
+        values = []
+        for quote in quotes:
+            if not isinstance(quote, dict) or "symbol" not in quote:
+                continue
+            bid = quote.get("bid")
+            ask = quote.get("ask")
+            price = quote.get("price")
+            if price is None and bid is not None and ask is not None:
+                price = (float(bid) + float(ask)) / 2
+            if price is None:
+                continue
+            symbols.append(quote["symbol"])
+            values.append((price, np.nan if bid is None else bid, np.nan if ask is None else ask))
+
+        columns = np.array(values, dtype=np.float64).reshape(-1, 3)
+        return symbols, columns[:, 0], columns[:, 1], columns[:, 2]
+
+
+class SchemaFeedDecoder(FeedDecoder):
+    """Decoder compiled from a feed's declared message format."""
+
+    def __init__(
+        self,
+        layout: str = "records",
+        path: str = "quotes",
+        symbol: str = "symbol",
+        price: Optional[str] = "price",
+        bid: Optional[str] = None,
+        ask: Optional[str] = None
+    ):
+        if layout not in FEED_LAYOUTS:
+            raise ValueError(f"Unsupported feed layout: {layout}")
+        if price is None and (bid is None or ask is None):
+            raise ValueError("A feed format needs a price field or both bid and ask fields")
+
+        self.layout = layout
+        self._path: List[str] = [key for key in path.split(".") if key] if path else []
+        self._symbol = itemgetter(symbol)
+        self._price = itemgetter(price) if price else None
+        self._bid = itemgetter(bid) if bid else None
+        self._ask = itemgetter(ask) if ask else None
+
+    def extract(self, data: Any) -> Quotes:
+        for key in self._path:
+            data = data[key]
+        if self.layout == "columns":
+            return self._extract_columns(data)
+        return self._extract_records(data)
+
+    def _extract_records(self, quotes: List[Dict[str, Any]]) -> Quotes:
+        count = len(quotes)
+        if not count:
+            return _NO_QUOTES
+
+        def column(getter) -> np.ndarray:
+            if getter is None:
+                return np.full(count, np.nan)
+            return np.fromiter(map(getter, quotes), dtype=np.float64, count=count)
+
+        symbols = list(map(self._symbol, quotes))
+        bids = column(self._bid)
+        asks = column(self._ask)
+        prices = column(self._price) if self._price is not None else (bids + asks) / 2
+        return symbols, prices, bids, asks
+
+    def _extract_columns(self, columns: Dict[str, List[Any]]) -> Quotes:
+        symbols = self._symbol(columns)
+        count = len(symbols)
+        if not count:
+            return _NO_QUOTES
+
+        def column(getter) -> np.ndarray:
+            if getter is None:
+                return np.full(count, np.nan)
+            return np.asarray(getter(columns), dtype=np.float64)
+
+        bids = column(self._bid)
+        asks = column(self._ask)
+        prices = column(self._price) if self._price is not None else (bids + asks) / 2
+        return symbols, prices, bids, asks
+
+
+def build_feed_decoder(feed: Dict[str, Any]) -> FeedDecoder:
+    """Compile the decoder for one ``market_data_feeds`` entry."""
+    feed_format = feed.get("format")
+    if not feed_format:
+        return FeedDecoder()
+    return SchemaFeedDecoder(**feed_format)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Persistent Market Data Feed Monitor
+===================================
+
+Long-lived subscription per WebSocket market data feed:
+- The connection and subscription stay open between health check cycles;
+  every message is timestamped on arrival
+- Tick latency (arrival time vs the exchange/feed timestamp carried in the
+  message), inter-arrival gaps and connect times are recorded in HDR
+  histograms, both since the previous snapshot and since start
+- Staleness (age of the newest tick) and message rate are tracked
+  continuously, so a feed that silently stops ticking is detected between
+  checks rather than only at the next reconnect
+- Disconnects are retried with capped exponential backoff and full jitter
+
+``MarketDataFeedCheck`` only snapshots these statistics, so the health of a
+feed reflects real-time tick flow instead of connection setup.
+
+Forensic Methodology Applied:
+- Every disconnect and failed attempt is counted and the latest cause
+  retained as evidence
+- Snapshots distinguish interval statistics from lifetime totals
+"""
+
+import asyncio
+import json
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import websockets
+
+from ..common.hdr_histogram import HdrHistogram
+from .feed_decoding import FeedDecoder
+
+
+def message_timestamp(data: Any, field: str) -> Optional[float]:
+    """
+    Epoch seconds of a message's feed timestamp, if it has one.
+
+    Numeric timestamps may be seconds, milliseconds, microseconds or
+    nanoseconds (told apart by magnitude); strings are parsed as ISO 8601.
+    """
+    if not isinstance(data, dict):
+        return None
+    value = data.get(field)
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)):
+        value = float(value)
+        for scale in (1.0, 1e3, 1e6, 1e9):
+            if value / scale < 1e10:
+                return value / scale
+    return None
+
+
+class WebSocketFeedMonitor:
+    """Background subscription to one WebSocket feed with continuous tick statistics."""
+
+    def __init__(
+        self,
+        feed: Dict[str, Any],
+        stale_after_seconds: float = 5.0,
+        connect_timeout_seconds: float = 10.0,
+        initial_backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+        timestamp_field: str = "timestamp",
+        decoder: Optional[FeedDecoder] = None,
+        on_data: Optional[Callable[[str, Any], None]] = None
+    ):
+        self.feed = feed
+        self.name = feed["name"]
+        self.stale_after_seconds = stale_after_seconds
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self.initial_backoff_seconds = initial_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timestamp_field = feed.get("timestamp_field", timestamp_field)
+        self.decoder = decoder or FeedDecoder()
+        self.on_data = on_data
+
+        # Microsecond histograms: current interval and lifetime
+        self.tick_latency = HdrHistogram()
+        self.inter_arrival = HdrHistogram()
+        self.connect_time = HdrHistogram()
+        self.total_tick_latency = HdrHistogram()
+        self.total_inter_arrival = HdrHistogram()
+        self.total_connect_time = HdrHistogram()
+
+        self.connected = False
+        self.latest_data: Any = None
+        self.latest_message_size = 0
+        # Cause of the current outage, cleared once a connection is re-established;
+        # the most recent cause is kept in last_failure_cause
+        self.last_error: Optional[str] = None
+        self.last_failure_cause: Optional[str] = None
+        self.stats = {
+            "messages": 0,
+            "bytes": 0,
+            "decode_errors": 0,  # undecodable or unusable messages
+            "connects": 0,
+            "disconnects": 0,
+            "failed_attempts": 0,  # connections that failed or were closed
+            "max_gap_seconds": 0.0
+        }
+
+        self._last_tick: Optional[float] = None
+        self._connected_at: Optional[float] = None
+        self._snapshot_at = time.perf_counter()
+        self._snapshot_messages = 0
+        self._first_message = asyncio.Event()
+        self._attempt_failed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background subscription on the running loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"feed_monitor:{self.name}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.connected = False
+
+    async def wait_for_first_message(self, timeout: Optional[float]):
+        """
+        Wait until the feed has delivered at least one message. Fails as soon
+        as a connection attempt fails (or the feed is currently down) rather
+        than waiting out ``timeout``.
+        """
+        if self._first_message.is_set():
+            return
+        if self.last_error is None:
+            self._attempt_failed.clear()
+            first_message = asyncio.ensure_future(self._first_message.wait())
+            attempt_failed = asyncio.ensure_future(self._attempt_failed.wait())
+            try:
+                await asyncio.wait({first_message, attempt_failed}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                first_message.cancel()
+                attempt_failed.cancel()
+            if self._first_message.is_set():
+                return
+        raise ConnectionError(
+            f"No market data from {self.name} yet"
+            + (f" (last error: {self.last_error})" if self.last_error else "")
+        )
+
+    def staleness_seconds(self) -> Optional[float]:
+        return time.perf_counter() - self._last_tick if self._last_tick is not None else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Statistics since the previous snapshot (interval histograms are reset)."""
+        now = time.perf_counter()
+        elapsed = now - self._snapshot_at
+        interval_messages = self.stats["messages"] - self._snapshot_messages
+        staleness = self.staleness_seconds()
+
+        snapshot = {
+            "connected": self.connected,
+            "connection_uptime_seconds": now - self._connected_at if self.connected and self._connected_at else 0.0,
+            "last_error": self.last_error,
+            "interval_seconds": elapsed,
+            "interval_messages": interval_messages,
+            "message_rate_per_second": interval_messages / elapsed if elapsed > 0 else 0.0,
+            "staleness_seconds": staleness,
+            "stale": staleness is None or staleness > self.stale_after_seconds,
+            "tick_latency_ms": self.tick_latency.summary(scale=1000.0),
+            "inter_arrival_ms": self.inter_arrival.summary(scale=1000.0),
+            "connect_time_ms": self.connect_time.summary(scale=1000.0),
+            "lifetime": {
+                **self.stats,
+                "last_failure_cause": self.last_failure_cause,
+                "tick_latency_ms": self.total_tick_latency.summary(scale=1000.0),
+                "inter_arrival_ms": self.total_inter_arrival.summary(scale=1000.0),
+                "connect_time_ms": self.total_connect_time.summary(scale=1000.0)
+            }
+        }
+
+        self.tick_latency.reset()
+        self.inter_arrival.reset()
+        self.connect_time.reset()
+        self._snapshot_at = now
+        self._snapshot_messages = self.stats["messages"]
+        return snapshot
+
+    async def _run(self):
+        backoff = self.initial_backoff_seconds
+        while True:
+            connect_started = time.perf_counter()
+            try:
+                async with websockets.connect(
+                    self.feed["endpoint"], open_timeout=self.connect_timeout_seconds
+                ) as websocket:
+                    await websocket.send(json.dumps({
+                        "action": "subscribe",
+                        "symbols": self.feed.get("symbols", ["EURUSD", "GBPUSD"])
+                    }))
+                    self._on_connected(connect_started)
+                    async for message in websocket:
+                        self._on_message(message)
+                        # Only a connection that delivers data resets the backoff
+                        backoff = self.initial_backoff_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+            else:
+                self.last_error = "connection closed by feed"
+            self.last_failure_cause = self.last_error
+            self.stats["failed_attempts"] += 1
+            self._attempt_failed.set()
+
+            if self.connected:
+                self.connected = False
+                self.stats["disconnects"] += 1
+            # Full jitter keeps many monitors from reconnecting in lockstep
+            await asyncio.sleep(random.uniform(0, backoff))
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+    def _on_connected(self, connect_started: float):
+        now = time.perf_counter()
+        self.connected = True
+        self._connected_at = now
+        self.last_error = None
+        self.stats["connects"] += 1
+        self.connect_time.record((now - connect_started) * 1e6)
+        self.total_connect_time.record((now - connect_started) * 1e6)
+
+    def _on_message(self, message: Any):
+        arrived = time.perf_counter()
+        arrived_wall = time.time()
+
+        if self._last_tick is not None:
+            gap = arrived - self._last_tick
+            self.inter_arrival.record(gap * 1e6)
+            self.total_inter_arrival.record(gap * 1e6)
+            if gap > self.stats["max_gap_seconds"]:
+                self.stats["max_gap_seconds"] = gap
+        self._last_tick = arrived
+        self.stats["messages"] += 1
+        self.stats["bytes"] += len(message)
+        self.latest_message_size = len(message)
+
+        try:
+            data = self.decoder.decode(message)
+        except ValueError:
+            self.stats["decode_errors"] += 1
+            return
+        self.latest_data = data
+        self._first_message.set()
+        if self.on_data is not None:
+            try:
+                self.on_data(self.name, data)
+            except Exception:
+                self.stats["decode_errors"] += 1
+
+        sent = message_timestamp(data, self.timestamp_field)
+        if sent is not None:
+            latency_us = max(arrived_wall - sent, 0.0) * 1e6
+            self.tick_latency.record(latency_us)
+            self.total_tick_latency.record(latency_us)
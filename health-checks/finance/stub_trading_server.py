@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Stub Trading Server
+===================
+
+In-process stand-in for the order management and risk services probed by
+``OrderProcessingCheck``. It serves the same HTTP contract on a local port,
+with configurable per-stage latency and injectable faults, so the order
+lifecycle, risk, order book and load-test paths can be exercised without a
+trading environment:
+
+    server = StubTradingServer(stage_latency_ms={"execute": 5.0})
+    endpoint = await server.start()          # http://127.0.0.1:<port>
+
+    check = OrderProcessingCheck(logger, [endpoint], risk_endpoint=endpoint)
+    result = await check.execute()
+
+    server.failing_stages.add("route")       # routing now answers 503
+    server.failing_risk_checks.add("credit_limits")
+    server.crossed_book = True               # best bid above best ask
+
+Contract (JSON bodies):
+- ``POST /orders/validate``, ``/orders/route``, ``/orders/execute``: the
+  order in, the stage outcome out
+- ``POST /risk/checks/{check}``: ``{"passed": bool, "limit", "utilization"}``
+- ``GET /orderbook/{symbol}``: ``{"bids": [[price, size], ...], "asks": [...]}``
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Dict, Optional, Set
+
+from aiohttp import web
+
+
+VENUES = ["VENUE_A", "VENUE_B", "VENUE_C"]
+
+
+class StubTradingServer:
+    """aiohttp application implementing the order, risk and order book endpoints."""
+
+    def __init__(
+        self,
+        stage_latency_ms: Optional[Dict[str, float]] = None,
+        mid_price: str = "1.1234",
+        book_depth: int = 10
+    ):
+        self.stage_latency_ms = {"validate": 1.0, "route": 2.0, "execute": 5.0, "risk": 1.0, "orderbook": 1.0}
+        self.stage_latency_ms.update(stage_latency_ms or {})
+        self.mid_price = Decimal(mid_price)
+        self.book_depth = book_depth
+
+        # Fault injection
+        self.failing_stages: Set[str] = set()
+        self.failing_risk_checks: Set[str] = set()
+        self.crossed_book = False
+
+        self.requests: Dict[str, int] = {}
+        self.orders_executed = 0
+
+        self.app = web.Application()
+        self.app.router.add_post("/orders/{stage}", self._handle_order_stage)
+        self.app.router.add_post("/risk/checks/{check}", self._handle_risk_check)
+        self.app.router.add_get("/orderbook/{symbol}", self._handle_order_book)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving; returns the base URL (port 0 picks a free port)."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _stage(self, stage: str):
+        self.requests[stage] = self.requests.get(stage, 0) + 1
+        await asyncio.sleep(self.stage_latency_ms.get(stage, 0.0) / 1000)
+        if stage in self.failing_stages:
+            raise web.HTTPServiceUnavailable(text=f"{stage} unavailable")
+
+    async def _handle_order_stage(self, request: web.Request) -> web.Response:
+        stage = request.match_info["stage"]
+        if stage not in ("validate", "route", "execute"):
+            raise web.HTTPNotFound()
+        order = await request.json()
+        await self._stage(stage)
+
+        if stage == "validate":
+            checks = [
+                {"check": "symbol_validity", "passed": bool(order.get("symbol"))},
+                {"check": "quantity_limits", "passed": Decimal(str(order.get("quantity", "0"))) > 0},
+                {"check": "market_hours", "passed": True},
+                {"check": "account_permissions", "passed": True}
+            ]
+            return web.json_response({"passed": all(check["passed"] for check in checks), "checks": checks})
+
+        venue = VENUES[sum(map(ord, order["order_id"])) % len(VENUES)]
+        if stage == "route":
+            return web.json_response({"successful": True, "selected_venue": venue, "available_venues": VENUES})
+
+        self.orders_executed += 1
+        return web.json_response({
+            "successful": True,
+            "fill_price": str(self.mid_price),
+            "fill_quantity": str(order["quantity"]),
+            "venue": venue
+        })
+
+    async def _handle_risk_check(self, request: web.Request) -> web.Response:
+        check = request.match_info["check"]
+        await self._stage("risk")
+        passed = check not in self.failing_risk_checks
+        return web.json_response({"check": check, "passed": passed, "limit": 1_000_000, "utilization": 0.42 if passed else 1.07})
+
+    async def _handle_order_book(self, request: web.Request) -> web.Response:
+        await self._stage("orderbook")
+        tick = Decimal("0.0001")
+        best_bid = self.mid_price - tick
+        best_ask = self.mid_price + tick
+        if self.crossed_book:
+            best_bid, best_ask = best_ask, best_bid
+        return web.json_response({
+            "symbol": request.match_info["symbol"],
+            "bids": [[str(best_bid - tick * level), 1_000_000] for level in range(self.book_depth)],
+            "asks": [[str(best_ask + tick * level), 1_000_000] for level in range(self.book_depth)]
+        })
@@ -26,25 +26,69 @@ import json
 import statistics
 import time
 import websockets
+from functools import partial
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, Any, List, Optional, Tuple
 
 import aiohttp
 import numpy as np
+import orjson
 from ..common.forensic_validator import (
     BaseHealthCheck, HealthStatus, Severity, ForensicLogger
 )
+from ..common.hdr_histogram import HdrHistogram
+from ..common.report_encoding import encode_json
+from ..common.tracing import traced_stage
+from .cross_validation import CrossFeedValidator
+from .feed_decoding import FeedDecoder, build_feed_decoder
+from .feed_monitor import WebSocketFeedMonitor
+from .order_load import OrderLoadGenerator, throughput_headroom
+
+
+ORDER_STAGES = ("validation", "routing", "execution")
+ORDER_BOOK_CHECKS = ("bid_ask_spread_normal", "depth_sufficient", "price_continuity", "volume_consistency")
+
+# Lets the order management and risk services tell probe orders from client flow
+SYNTHETIC_ORDER_HEADERS = {"Content-Type": "application/json", "X-Synthetic-Order": "true"}
 
 
 class MarketDataFeedCheck(BaseHealthCheck):
-    """Market data feed connectivity and latency validation with forensic analysis."""
+    """
+    Market data feed connectivity and latency validation with forensic analysis.
     
-    def __init__(self, logger: ForensicLogger, feeds: List[Dict[str, Any]], latency_threshold_ms: float = 50.0):
+    WebSocket feeds are watched by persistent ``WebSocketFeedMonitor``
+    subscriptions (unless ``feed_monitor.enabled`` is false or the feed sets
+    ``persistent: false``); each execution snapshots their tick statistics.
+    """
+    
+    def __init__(
+        self,
+        logger: ForensicLogger,
+        feeds: List[Dict[str, Any]],
+        latency_threshold_ms: float = 50.0,
+        feed_monitor_config: Optional[Dict[str, Any]] = None,
+        cross_validation_config: Optional[Dict[str, Any]] = None
+    ):
         super().__init__("finance.market_data", logger)
         self.feeds = feeds
         self.latency_threshold_ms = latency_threshold_ms
-        self.price_history = {}  # For cross-validation
+        
+        # Per-feed payload decoders compiled from the declared message formats
+        self.decoders: Dict[str, FeedDecoder] = {feed["name"]: build_feed_decoder(feed) for feed in feeds}
+        
+        # Time-aligned latest quotes plus the bounded per-symbol price history
+        self.cross_validator = CrossFeedValidator([feed["name"] for feed in feeds], **(cross_validation_config or {}))
+        
+        monitor_config = dict(feed_monitor_config or {})
+        self.feed_monitors: Dict[str, WebSocketFeedMonitor] = {}
+        if monitor_config.pop("enabled", True):
+            for feed in feeds:
+                if feed["type"] == "websocket" and feed.get("persistent", True):
+                    self.feed_monitors[feed["name"]] = WebSocketFeedMonitor(
+                        feed, decoder=self.decoders[feed["name"]], on_data=self._ingest_feed_data, **monitor_config
+                    )
+        self.monitor_snapshots: Dict[str, Dict[str, Any]] = {}
     
     async def execute(self):
         """Execute comprehensive market data feed validation."""
@@ -65,6 +109,12 @@ class MarketDataFeedCheck(BaseHealthCheck):
                         "feed": self.feeds[i]["name"],
                         "error": str(result)
                     })
+                elif not result["success"]:
+                    # _test_feed reports probe failures (including stale feeds) in-band
+                    failed_feeds.append({
+                        "feed": result["feed_name"],
+                        "error": result["error"]
+                    })
                 else:
                     valid_results.append(result)
             
@@ -79,6 +129,7 @@ class MarketDataFeedCheck(BaseHealthCheck):
                 "feed_performance": performance_analysis,
                 "cross_validation": cross_validation,
                 "failed_feeds": failed_feeds,
+                "feed_monitors": dict(self.monitor_snapshots),
                 "market_conditions": await self._assess_market_conditions(),
                 "data_quality_metrics": self._calculate_data_quality_metrics(valid_results)
             }
@@ -93,7 +144,9 @@ class MarketDataFeedCheck(BaseHealthCheck):
                 "max_latency_ms": performance_analysis["max_latency_ms"],
                 "min_latency_ms": performance_analysis["min_latency_ms"],
                 "data_quality_score": evidence["data_quality_metrics"]["overall_score"],
-                "price_deviation_percent": cross_validation["max_price_deviation_percent"]
+                "price_deviation_percent": cross_validation["max_price_deviation_percent"],
+                "rolling_price_deviation_percent": cross_validation["rolling_max_price_deviation_percent"],
+                "crossed_books": cross_validation["crossed_books"]["count"] + cross_validation["consolidated_crossed_count"]
             }
             
             # Health scoring based on financial trading requirements
@@ -129,15 +182,23 @@ class MarketDataFeedCheck(BaseHealthCheck):
         start_time = time.perf_counter()
         
         try:
-            if feed["type"] == "websocket":
-                result = await self._test_websocket_feed(feed)
+            if feed["type"] == "websocket" and feed["name"] in self.feed_monitors:
+                result = await self._run_probe(
+                    feed["name"], partial(self._snapshot_websocket_feed, feed), timeout_seconds=10.0
+                )
+            elif feed["type"] == "websocket":
+                result = await self._run_probe(
+                    feed["name"], partial(self._test_websocket_feed, feed), timeout_seconds=10.0
+                )
             elif feed["type"] == "rest":
-                result = await self._test_rest_feed(feed)
+                result = await self._run_probe(
+                    feed["name"], partial(self._test_rest_feed, feed), timeout_seconds=5.0, hedge=True
+                )
             else:
                 raise ValueError(f"Unsupported feed type: {feed['type']}")
             
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            result["latency_ms"] = latency_ms
+            # Monitored feeds report tick latency; otherwise the probe round trip
+            result.setdefault("latency_ms", (time.perf_counter() - start_time) * 1000)
             result["feed_name"] = feed["name"]
             result["success"] = True
             
@@ -153,6 +214,40 @@ class MarketDataFeedCheck(BaseHealthCheck):
                 "data": None
             }
     
+    async def close(self):
+        """Stop the persistent feed subscriptions."""
+        for monitor in self.feed_monitors.values():
+            await monitor.stop()
+        await super().close()
+    
+    async def _snapshot_websocket_feed(self, feed: Dict[str, Any]) -> Dict[str, Any]:
+        """Snapshot the persistent subscription of a WebSocket feed."""
+        monitor = self.feed_monitors[feed["name"]]
+        monitor.start()
+        await monitor.wait_for_first_message(self._probe_timeout(10.0))
+        
+        snapshot = monitor.snapshot()
+        self.monitor_snapshots[feed["name"]] = snapshot
+        if snapshot["stale"]:
+            raise ConnectionError(
+                f"No market data from {feed['name']} for {snapshot['staleness_seconds']:.1f}s"
+                f" (connected: {snapshot['connected']}, last error: {snapshot['last_error']})"
+            )
+        
+        # Feed-to-arrival latency when messages carry timestamps, else the age of the newest tick
+        if snapshot["tick_latency_ms"]["count"]:
+            latency_ms = snapshot["tick_latency_ms"]["p99"]
+        else:
+            latency_ms = snapshot["staleness_seconds"] * 1000
+        
+        return {
+            "data": monitor.latest_data,
+            "message_size": monitor.latest_message_size,
+            "protocol": "websocket",
+            "latency_ms": latency_ms,
+            "message_rate_per_second": snapshot["message_rate_per_second"]
+        }
+    
     async def _test_websocket_feed(self, feed: Dict[str, Any]) -> Dict[str, Any]:
         """Test WebSocket market data feed."""
         uri = feed["endpoint"]
@@ -166,8 +261,8 @@ class MarketDataFeedCheck(BaseHealthCheck):
             await websocket.send(json.dumps(subscribe_msg))
             
             # Wait for market data response
-            response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-            data = json.loads(response)
+            response = await asyncio.wait_for(websocket.recv(), timeout=self._probe_timeout(5.0))
+            data = self.decoders[feed["name"]].decode(response)
             
             return {
                 "data": data,
@@ -177,21 +272,23 @@ class MarketDataFeedCheck(BaseHealthCheck):
     
     async def _test_rest_feed(self, feed: Dict[str, Any]) -> Dict[str, Any]:
         """Test REST API market data feed."""
-        headers = feed.get("headers", {})
+        headers = dict(feed.get("headers", {}))
         if "api_key" in feed:
             headers["Authorization"] = f"Bearer {feed['api_key']}"
         
+        session = await self._get_http_session()
         timeout = aiohttp.ClientTimeout(total=5)
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            async with session.get(feed["endpoint"]) as response:
-                data = await response.json()
-                
-                return {
-                    "data": data,
-                    "status_code": response.status,
-                    "response_size": len(await response.text()),
-                    "protocol": "rest"
-                }
+        async with session.get(feed["endpoint"], headers=headers, timeout=timeout) as response:
+            # Read the body once; decode it from bytes
+            body = await response.read()
+            data = self.decoders[feed["name"]].decode(body)
+            
+            return {
+                "data": data,
+                "status_code": response.status,
+                "response_size": len(body),
+                "protocol": "rest"
+            }
     
     def _analyze_feed_performance(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze performance characteristics of market data feeds."""
@@ -224,77 +321,26 @@ class MarketDataFeedCheck(BaseHealthCheck):
             "latency_std_dev": statistics.stdev(latencies) if len(latencies) > 1 else 0.0
         }
     
+    @traced_stage()
     async def _cross_validate_market_data(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Cross-validate market data across feeds for integrity verification."""
-        prices = {}
+        """
+        Cross-validate market data across feeds for integrity verification.
         
-        # Extract prices from each feed
+        Monitored feeds stream every tick into the validator; snapshot data
+        from the other feeds is ingested here before the analysis.
+        """
         for result in results:
-            if not result["success"] or not result["data"]:
+            if not result["success"] or not result["data"] or result["feed_name"] in self.feed_monitors:
                 continue
-            
-            feed_name = result["feed_name"]
-            data = result["data"]
-            
-            # Extract price data (implementation depends on feed format)
-            extracted_prices = self._extract_prices_from_feed_data(data)
-            if extracted_prices:
-                prices[feed_name] = extracted_prices
-        
-        # Cross-validate prices
-        validation_results = []
-        max_deviation = 0.0
-        
-        symbols = set()
-        for feed_prices in prices.values():
-            symbols.update(feed_prices.keys())
-        
-        for symbol in symbols:
-            symbol_prices = []
-            feeds_with_symbol = []
-            
-            for feed_name, feed_prices in prices.items():
-                if symbol in feed_prices:
-                    symbol_prices.append(feed_prices[symbol])
-                    feeds_with_symbol.append(feed_name)
-            
-            if len(symbol_prices) > 1:
-                mean_price = statistics.mean(symbol_prices)
-                deviations = [abs(price - mean_price) / mean_price * 100 for price in symbol_prices]
-                max_symbol_deviation = max(deviations)
-                max_deviation = max(max_deviation, max_symbol_deviation)
-                
-                validation_results.append({
-                    "symbol": symbol,
-                    "feeds": feeds_with_symbol,
-                    "prices": symbol_prices,
-                    "mean_price": mean_price,
-                    "max_deviation_percent": max_symbol_deviation
-                })
+            self._ingest_feed_data(result["feed_name"], result["data"])
         
-        return {
-            "symbols_validated": len(validation_results),
-            "max_price_deviation_percent": max_deviation,
-            "validation_details": validation_results
-        }
+        return self.cross_validator.analyze()
     
-    def _extract_prices_from_feed_data(self, data: Any) -> Dict[str, float]:
-        """Extract price data from feed response (implementation specific)."""
-        prices = {}
-        
-        # Generic price extraction logic
-        if isinstance(data, dict):
-            # Look for common price fields
-            if "quotes" in data:
-                for quote in data["quotes"]:
-                    if "symbol" in quote and "price" in quote:
-                        prices[quote["symbol"]] = float(quote["price"])
-            elif "data" in data and isinstance(data["data"], list):
-                for item in data["data"]:
-                    if "symbol" in item and "price" in item:
-                        prices[item["symbol"]] = float(item["price"])
-        
-        return prices
+    def _ingest_feed_data(self, feed_name: str, data: Any):
+        """Feed one decoded message / response into the cross-feed validator."""
+        symbols, prices, bids, asks = self.decoders[feed_name].extract(data)
+        if symbols:
+            self.cross_validator.update_batch(feed_name, symbols, prices, bids, asks)
     
     async def _assess_market_conditions(self) -> Dict[str, Any]:
         """Assess current market conditions for context."""
@@ -378,15 +424,46 @@ class MarketDataFeedCheck(BaseHealthCheck):
             status = HealthStatus.DEGRADED if status == HealthStatus.HEALTHY else status
             severity = max(severity, Severity.HIGH)
         
+        # A crossed book (bid above ask) on live quotes is corrupt market data
+        if metrics["crossed_books"] > 0:
+            score -= 20
+            status = HealthStatus.DEGRADED if status == HealthStatus.HEALTHY else status
+            severity = max(severity, Severity.HIGH)
+        
         return max(score, 0.0), status, severity
 
 
 class OrderProcessingCheck(BaseHealthCheck):
     """Order processing pipeline validation with forensic order flow analysis."""
     
-    def __init__(self, logger: ForensicLogger, trading_endpoints: List[str]):
+    def __init__(
+        self,
+        logger: ForensicLogger,
+        trading_endpoints: List[str],
+        load_test_config: Optional[Dict[str, Any]] = None,
+        risk_endpoint: Optional[str] = None,
+        order_book_symbol: str = "EURUSD",
+        min_book_depth: int = 5,
+        max_spread_bps: float = 50.0,
+        request_timeout_seconds: float = 2.0,
+        execute_test_orders: bool = False
+    ):
         super().__init__("finance.order_processing", logger)
         self.trading_endpoints = trading_endpoints
+        self.risk_endpoint = risk_endpoint or trading_endpoints[0]
+        self.order_book_symbol = order_book_symbol
+        self.min_book_depth = min_book_depth
+        self.max_spread_bps = max_spread_bps
+        self.request_timeout_seconds = request_timeout_seconds
+        # The lifecycle sample stops after routing unless execution is enabled
+        self.execute_test_orders = execute_test_orders
+        
+        # Open-loop order-flow load (opt-in: it sends real order volume)
+        load_config = dict(load_test_config or {})
+        self.load_test_enabled = load_config.pop("enabled", False)
+        self.load_latency_slo_ms = load_config.pop("latency_slo_ms", None)
+        self.load_min_sustained_ratio = load_config.pop("min_sustained_ratio", 0.95)
+        self.load_generator_config = load_config
     
     async def execute(self):
         """Execute order processing pipeline validation."""
@@ -394,16 +471,23 @@ class OrderProcessingCheck(BaseHealthCheck):
         
         try:
             # Test order lifecycle: validation -> routing -> execution -> settlement
-            order_tests = await self._test_order_lifecycle()
+            lifecycle_started = time.perf_counter()
+            order_tests = await self._run_probe("order_lifecycle", self._test_order_lifecycle, timeout_seconds=10.0)
+            lifecycle_seconds = time.perf_counter() - lifecycle_started
             
             # Test risk management integration
-            risk_tests = await self._test_risk_management()
+            risk_tests = await self._run_probe("risk_management", self._test_risk_management, timeout_seconds=5.0)
             
             # Test order book integrity
-            order_book_tests = await self._test_order_book_integrity()
+            order_book_tests = await self._run_probe(
+                "order_book_integrity", self._test_order_book_integrity, timeout_seconds=5.0
+            )
+            
+            # Sustained throughput under open-loop order flow
+            load_test = await self._run_load_test() if self.load_test_enabled else None
             
             # Analyze processing performance
-            performance_analysis = self._analyze_processing_performance(order_tests)
+            performance_analysis = self._analyze_processing_performance(order_tests, lifecycle_seconds)
             
             # Evidence collection
             evidence = {
@@ -411,6 +495,7 @@ class OrderProcessingCheck(BaseHealthCheck):
                 "risk_management_tests": risk_tests,
                 "order_book_tests": order_book_tests,
                 "performance_analysis": performance_analysis,
+                "load_test": load_test,
                 "system_capacity": await self._assess_system_capacity()
             }
             
@@ -419,11 +504,18 @@ class OrderProcessingCheck(BaseHealthCheck):
                 "order_success_rate": performance_analysis["success_rate"],
                 "average_processing_time_ms": performance_analysis["avg_processing_time_ms"],
                 "max_processing_time_ms": performance_analysis["max_processing_time_ms"],
-                "orders_per_second": performance_analysis["orders_per_second"],
+                "sample_burst_orders_per_second": performance_analysis["sample_burst_orders_per_second"],
                 "risk_checks_passed": sum(1 for test in risk_tests if test["passed"]),
                 "risk_checks_total": len(risk_tests),
                 "order_book_integrity_score": order_book_tests["integrity_score"]
             }
+            if load_test is not None:
+                metrics.update({
+                    "load_throughput_per_second": load_test["successful_throughput_per_second"],
+                    "load_sustained_ratio": load_test["headroom"]["sustained_ratio"],
+                    "load_response_time_p99_ms": load_test["response_time_ms"]["p99"],
+                    "load_within_latency_slo": load_test["headroom"]["within_latency_slo"]
+                })
             
             # Health scoring
             score, status, severity = self._calculate_order_processing_health_score(metrics)
@@ -454,114 +546,138 @@ class OrderProcessingCheck(BaseHealthCheck):
             )
     
     async def _test_order_lifecycle(self) -> List[Dict[str, Any]]:
-        """Test complete order lifecycle with forensic tracking."""
-        test_orders = [
-            {
-                "order_id": f"TEST_ORDER_{int(time.time() * 1000000)}_{i}",
-                "symbol": "EURUSD",
-                "side": "BUY" if i % 2 == 0 else "SELL",
-                "quantity": Decimal("1000"),
-                "order_type": "MARKET",
-                "test_type": "synthetic"
-            }
-            for i in range(10)
-        ]
-        
-        results = []
+        """Test complete order lifecycle with forensic tracking (sample orders in flight together)."""
+        return list(await asyncio.gather(*(self._timed_order(self._synthetic_order(i)) for i in range(10))))
+    
+    async def _timed_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        result = await self._process_order(order, execute=self.execute_test_orders)
+        result["processing_time_ms"] = (time.perf_counter() - start_time) * 1000
+        return result
+    
+    def _synthetic_order(self, sequence: int) -> Dict[str, Any]:
+        """Synthetic test order; orders are spread round-robin over the trading endpoints."""
+        return {
+            "order_id": f"TEST_ORDER_{int(time.time() * 1000000)}_{sequence}",
+            "symbol": "EURUSD",
+            "side": "BUY" if sequence % 2 == 0 else "SELL",
+            "quantity": Decimal("1000"),
+            "order_type": "MARKET",
+            "test_type": "synthetic",
+            "endpoint": self.trading_endpoints[sequence % len(self.trading_endpoints)]
+        }
+    
+    async def _process_order(self, order: Dict[str, Any], execute: bool) -> Dict[str, Any]:
+        """
+        Run one order through validation, routing and (if ``execute``)
+        execution. The chain stops at the first stage that fails or rejects
+        the order, which is reported as ``failed_stage``.
+        """
+        stage_calls = [("validation", self._validate_order, "passed", "validation_time_ms")]
+        stage_calls.append(("routing", self._route_order, "successful", "routing_time_ms"))
+        if execute:
+            stage_calls.append(("execution", self._execute_order, "successful", "execution_time_ms"))
         
-        for order in test_orders:
-            start_time = time.perf_counter()
-            
+        result = {
+            "order_id": order["order_id"],
+            "endpoint": order["endpoint"],
+            "executed": False,
+            "failed_stage": None,
+            "stages": {},
+            "stage_times_ms": {}
+        }
+        for stage, call, outcome_key, time_key in stage_calls:
             try:
-                # Simulate order processing stages
-                validation_result = await self._validate_order(order)
-                routing_result = await self._route_order(order)
-                execution_result = await self._execute_order(order)
-                
-                processing_time = (time.perf_counter() - start_time) * 1000
-                
-                results.append({
-                    "order_id": order["order_id"],
-                    "processing_time_ms": processing_time,
-                    "validation_passed": validation_result["passed"],
-                    "routing_successful": routing_result["successful"],
-                    "execution_successful": execution_result["successful"],
-                    "overall_success": (
-                        validation_result["passed"] and 
-                        routing_result["successful"] and 
-                        execution_result["successful"]
-                    ),
-                    "stages": {
-                        "validation": validation_result,
-                        "routing": routing_result,
-                        "execution": execution_result
-                    }
-                })
-                
+                stage_result = await call(order)
             except Exception as e:
-                processing_time = (time.perf_counter() - start_time) * 1000
-                results.append({
-                    "order_id": order["order_id"],
-                    "processing_time_ms": processing_time,
-                    "overall_success": False,
-                    "error": str(e)
-                })
+                result["failed_stage"] = stage
+                result["error"] = str(e)
+                break
+            result["stages"][stage] = stage_result
+            result["stage_times_ms"][stage] = stage_result[time_key]
+            if not stage_result[outcome_key]:
+                result["failed_stage"] = stage
+                break
+            if stage == "execution":
+                result["executed"] = True
         
-        return results
+        result["overall_success"] = result["failed_stage"] is None
+        return result
     
-    async def _validate_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate order validation with forensic checks."""
-        # Simulate validation logic
-        await asyncio.sleep(0.001)  # 1ms validation time
-        
-        validation_checks = [
-            {"check": "symbol_validity", "passed": True},
-            {"check": "quantity_limits", "passed": order["quantity"] > 0},
-            {"check": "market_hours", "passed": True},
-            {"check": "account_permissions", "passed": True}
-        ]
+    async def _run_load_test(self) -> Dict[str, Any]:
+        """Open-loop synthetic order flow with coordinated-omission-free latency."""
+        stage_histograms = {stage: HdrHistogram() for stage in ORDER_STAGES}
         
-        all_passed = all(check["passed"] for check in validation_checks)
+        async def submit(sequence: int) -> bool:
+            result = await self._process_order(self._synthetic_order(sequence), execute=True)
+            for stage, elapsed_ms in result["stage_times_ms"].items():
+                stage_histograms[stage].record(elapsed_ms * 1000)
+            return result["overall_success"]
         
+        generator = OrderLoadGenerator(submit, **self.load_generator_config)
+        timeout = generator.duration_seconds + generator.drain_timeout_seconds + 5.0
+        load_test = await self._run_probe("order_load", generator.run, timeout_seconds=timeout)
+        load_test["headroom"] = throughput_headroom(load_test, self.load_latency_slo_ms)
+        load_test["stage_service_time_ms"] = {
+            stage: histogram.summary(scale=1000.0) for stage, histogram in stage_histograms.items()
+        }
+        return load_test
+    
+    async def _service_request(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """JSON request to an order management / risk service; returns (body, round trip ms)."""
+        session = await self._get_http_session()
+        timeout = aiohttp.ClientTimeout(total=self._probe_timeout(self.request_timeout_seconds))
+        started = time.perf_counter()
+        async with session.request(
+            method,
+            endpoint.rstrip("/") + path,
+            data=encode_json(payload) if payload is not None else None,
+            headers=SYNTHETIC_ORDER_HEADERS,
+            timeout=timeout
+        ) as response:
+            body = await response.read()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            response.raise_for_status()
+        return orjson.loads(body), elapsed_ms
+    
+    async def _validate_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the order with the order management service."""
+        response, elapsed_ms = await self._service_request("POST", order["endpoint"], "/orders/validate", order)
         return {
-            "passed": all_passed,
-            "checks": validation_checks,
-            "validation_time_ms": 1.0
+            "passed": bool(response.get("passed")),
+            "checks": response.get("checks", []),
+            "validation_time_ms": elapsed_ms
         }
     
     async def _route_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate order routing with venue selection."""
-        await asyncio.sleep(0.002)  # 2ms routing time
-        
-        # Simulate venue selection logic
-        venues = ["VENUE_A", "VENUE_B", "VENUE_C"]
-        selected_venue = venues[hash(order["order_id"]) % len(venues)]
-        
+        """Request venue selection for the order."""
+        response, elapsed_ms = await self._service_request("POST", order["endpoint"], "/orders/route", order)
         return {
-            "successful": True,
-            "selected_venue": selected_venue,
-            "routing_time_ms": 2.0,
-            "available_venues": venues
+            "successful": bool(response.get("successful")),
+            "selected_venue": response.get("selected_venue"),
+            "routing_time_ms": elapsed_ms,
+            "available_venues": response.get("available_venues", [])
         }
     
     async def _execute_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate order execution with fill reporting."""
-        await asyncio.sleep(0.005)  # 5ms execution time
-        
-        # Simulate execution
-        fill_price = Decimal("1.1234")  # Simulated market price
-        fill_quantity = order["quantity"]
-        
+        """Execute the order and collect its fill report."""
+        response, elapsed_ms = await self._service_request("POST", order["endpoint"], "/orders/execute", order)
         return {
-            "successful": True,
-            "fill_price": str(fill_price),
-            "fill_quantity": str(fill_quantity),
-            "execution_time_ms": 5.0,
-            "venue": "VENUE_A"
+            "successful": bool(response.get("successful")),
+            "fill_price": response.get("fill_price"),
+            "fill_quantity": response.get("fill_quantity"),
+            "execution_time_ms": elapsed_ms,
+            "venue": response.get("venue")
         }
     
     async def _test_risk_management(self) -> List[Dict[str, Any]]:
-        """Test risk management system integration."""
+        """Test risk management system integration (the checks are issued concurrently)."""
         risk_tests = [
             {"test": "position_limits", "description": "Check position size limits"},
             {"test": "daily_loss_limits", "description": "Check daily P&L limits"},
@@ -570,45 +686,89 @@ class OrderProcessingCheck(BaseHealthCheck):
             {"test": "credit_limits", "description": "Check counterparty credit limits"}
         ]
         
-        results = []
-        
-        for test in risk_tests:
-            # Simulate risk check
-            await asyncio.sleep(0.001)
-            
-            # Most checks should pass in healthy system
-            passed = True  # Simplified for demo
-            
-            results.append({
-                "test_name": test["test"],
-                "description": test["description"],
-                "passed": passed,
-                "check_time_ms": 1.0
-            })
+        async def run_risk_test(test: Dict[str, str]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            result = {"test_name": test["test"], "description": test["description"]}
+            try:
+                response, elapsed_ms = await self._service_request(
+                    "POST", self.risk_endpoint, f"/risk/checks/{test['test']}", {"test_type": "synthetic"}
+                )
+                result.update({
+                    "passed": bool(response.get("passed")),
+                    "limit": response.get("limit"),
+                    "utilization": response.get("utilization"),
+                    "check_time_ms": elapsed_ms
+                })
+            except Exception as e:
+                result.update({
+                    "passed": False,
+                    "error": str(e),
+                    "check_time_ms": (time.perf_counter() - started) * 1000
+                })
+            return result
         
-        return results
+        return list(await asyncio.gather(*(run_risk_test(test) for test in risk_tests)))
     
     async def _test_order_book_integrity(self) -> Dict[str, Any]:
-        """Test order book data integrity and consistency."""
-        # Simulate order book validation
-        await asyncio.sleep(0.010)
+        """Test order book data integrity and consistency on every trading endpoint."""
+        responses = await asyncio.gather(
+            *(
+                self._service_request("GET", endpoint, f"/orderbook/{self.order_book_symbol}")
+                for endpoint in self.trading_endpoints
+            ),
+            return_exceptions=True
+        )
+        
+        endpoints = {}
+        for endpoint, response in zip(self.trading_endpoints, responses):
+            if isinstance(response, Exception):
+                endpoints[endpoint] = {check: False for check in ORDER_BOOK_CHECKS}
+                endpoints[endpoint]["error"] = str(response)
+                continue
+            book, elapsed_ms = response
+            endpoints[endpoint] = self._order_book_checks(book)
+            endpoints[endpoint]["fetch_time_ms"] = elapsed_ms
+        
+        passed = sum(result[check] for result in endpoints.values() for check in ORDER_BOOK_CHECKS)
+        total = len(endpoints) * len(ORDER_BOOK_CHECKS)
+        
+        return {
+            "integrity_score": passed / max(total, 1) * 100,
+            "symbol": self.order_book_symbol,
+            **{check: all(result[check] for result in endpoints.values()) for check in ORDER_BOOK_CHECKS},
+            "endpoints": endpoints
+        }
+    
+    def _order_book_checks(self, book: Dict[str, Any]) -> Dict[str, Any]:
+        """Integrity checks on one order book snapshot (levels are [price, size])."""
+        bids = np.asarray(book.get("bids") or np.empty((0, 2)), dtype=np.float64).reshape(-1, 2)
+        asks = np.asarray(book.get("asks") or np.empty((0, 2)), dtype=np.float64).reshape(-1, 2)
+        
+        spread_bps = None
+        spread_normal = False
+        if len(bids) and len(asks):
+            best_bid, best_ask = bids[0, 0], asks[0, 0]
+            spread_bps = (best_ask - best_bid) / ((best_ask + best_bid) / 2) * 10000
+            spread_normal = bool(0 < spread_bps <= self.max_spread_bps)
         
         return {
-            "integrity_score": 98.5,  # Simulated score
-            "bid_ask_spread_normal": True,
-            "depth_sufficient": True,
-            "price_continuity": True,
-            "volume_consistency": True
+            "bid_ask_spread_normal": spread_normal,
+            "depth_sufficient": bool(min(len(bids), len(asks)) >= self.min_book_depth),
+            "price_continuity": bool(np.all(np.diff(bids[:, 0]) < 0) and np.all(np.diff(asks[:, 0]) > 0)),
+            "volume_consistency": bool(np.all(bids[:, 1] > 0) and np.all(asks[:, 1] > 0)),
+            "spread_bps": spread_bps,
+            "bid_levels": len(bids),
+            "ask_levels": len(asks)
         }
     
-    def _analyze_processing_performance(self, order_tests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_processing_performance(self, order_tests: List[Dict[str, Any]], elapsed_seconds: float) -> Dict[str, Any]:
         """Analyze order processing performance metrics."""
         if not order_tests:
             return {
                 "success_rate": 0.0,
                 "avg_processing_time_ms": 0.0,
                 "max_processing_time_ms": 0.0,
-                "orders_per_second": 0.0
+                "sample_burst_orders_per_second": 0.0
             }
         
         successful_orders = [test for test in order_tests if test.get("overall_success", False)]
@@ -618,14 +778,28 @@ class OrderProcessingCheck(BaseHealthCheck):
         avg_processing_time = statistics.mean(processing_times)
         max_processing_time = max(processing_times)
         
-        # Calculate theoretical orders per second
-        orders_per_second = 1000 / avg_processing_time if avg_processing_time > 0 else 0
+        # Rate of the concurrent sample burst only; sustained throughput is
+        # what the load test measures (load_throughput_per_second)
+        sample_burst_orders_per_second = len(order_tests) / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        
+        # Per-stage round trips of every stage that answered
+        stage_latency = {}
+        for stage in ORDER_STAGES:
+            times = [test["stage_times_ms"][stage] for test in order_tests if stage in test.get("stage_times_ms", {})]
+            if times:
+                stage_latency[stage] = {
+                    "mean": statistics.mean(times),
+                    "p50": float(np.percentile(times, 50)),
+                    "p99": float(np.percentile(times, 99)),
+                    "max": max(times)
+                }
         
         return {
             "success_rate": success_rate,
             "avg_processing_time_ms": avg_processing_time,
             "max_processing_time_ms": max_processing_time,
-            "orders_per_second": orders_per_second,
+            "sample_burst_orders_per_second": sample_burst_orders_per_second,
+            "stage_latency_ms": stage_latency,
             "total_orders_tested": len(order_tests),
             "successful_orders": len(successful_orders)
         }
@@ -670,7 +844,10 @@ class OrderProcessingCheck(BaseHealthCheck):
         risk_success_rate = (metrics["risk_checks_passed"] / max(metrics["risk_checks_total"], 1)) * 100
         if risk_success_rate < 100:
             score -= 25
-            status = HealthStatus.CRITICAL if risk_success_rate < 80 else HealthStatus.DEGRADED
+            if risk_success_rate < 80:
+                status = HealthStatus.CRITICAL
+            elif status == HealthStatus.HEALTHY:
+                status = HealthStatus.DEGRADED
             severity = max(severity, Severity.CRITICAL if risk_success_rate < 80 else Severity.HIGH)
         
         # Order book integrity
@@ -679,6 +856,17 @@ class OrderProcessingCheck(BaseHealthCheck):
             status = HealthStatus.DEGRADED if status == HealthStatus.HEALTHY else status
             severity = max(severity, Severity.MEDIUM)
         
+        # Capacity headroom: the target order rate must be sustained within the latency SLO
+        if "load_sustained_ratio" in metrics:
+            if metrics["load_sustained_ratio"] < self.load_min_sustained_ratio:
+                score -= 20
+                status = HealthStatus.DEGRADED if status == HealthStatus.HEALTHY else status
+                severity = max(severity, Severity.HIGH)
+            if not metrics["load_within_latency_slo"]:
+                score -= 15
+                status = HealthStatus.DEGRADED if status == HealthStatus.HEALTHY else status
+                severity = max(severity, Severity.MEDIUM)
+        
         return max(score, 0.0), status, severity
 
 
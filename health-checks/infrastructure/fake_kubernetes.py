@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Fake Kubernetes API Server
+==========================
+
+In-process stand-in for the Kubernetes CoreV1/AppsV1 APIs used by
+``KubernetesHealthCheck`` and ``KubernetesStateCache``. It keeps a versioned
+object store and an event log so that LIST, WATCH (including bookmarks and
+410 Gone on compacted history) and mutations can be exercised in tests
+without a cluster:
+
+    api = FakeKubernetesAPI()
+    api.add_node("node-1")
+    api.add_pod("default", "web-0", phase="Running")
+
+    check = KubernetesHealthCheck(
+        logger, core_api=api, apps_api=api, watch_factory=api.watch_factory
+    )
+    result = await check.execute()
+
+    api.set_pod_phase("default", "web-0", "Failed")   # delivered via WATCH
+    api.compact()                                     # next WATCH gets 410
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from kubernetes.client.rest import ApiException
+
+
+def _obj(**fields) -> SimpleNamespace:
+    """Attribute-access object shaped like the kubernetes client models."""
+    return SimpleNamespace(**fields)
+
+
+def _meta(name: Optional[str], namespace: Optional[str] = None, resource_version: Optional[str] = None) -> SimpleNamespace:
+    return _obj(name=name, namespace=namespace, resource_version=resource_version)
+
+
+class FakeKubernetesAPI:
+    """Thread-safe fake exposing the list_* calls and a compatible Watch."""
+
+    _LIST_KINDS = {
+        "list_node": "nodes",
+        "list_pod_for_all_namespaces": "pods",
+        "list_service_for_all_namespaces": "services",
+        "list_deployment_for_all_namespaces": "deployments",
+        "list_namespace": "namespaces"
+    }
+
+    def __init__(self):
+        self._resource_version = 0
+        self._objects: Dict[str, Dict[Tuple[Optional[str], str], Any]] = {
+            kind: {} for kind in self._LIST_KINDS.values()
+        }
+        self._events: List[Tuple[int, str, str, Any]] = []
+        self._compacted_before = 0
+        self._condition = threading.Condition()
+        self.call_counts: Dict[str, int] = {name: 0 for name in self._LIST_KINDS}
+
+    # CoreV1Api / AppsV1Api surface ----------------------------------------
+
+    def list_node(self, **kwargs):
+        return self._list("list_node")
+
+    def list_pod_for_all_namespaces(self, **kwargs):
+        return self._list("list_pod_for_all_namespaces")
+
+    def list_service_for_all_namespaces(self, **kwargs):
+        return self._list("list_service_for_all_namespaces")
+
+    def list_deployment_for_all_namespaces(self, **kwargs):
+        return self._list("list_deployment_for_all_namespaces")
+
+    def list_namespace(self, **kwargs):
+        return self._list("list_namespace")
+
+    def watch_factory(self) -> "FakeWatch":
+        """Drop-in replacement for ``kubernetes.watch.Watch``."""
+        return FakeWatch(self)
+
+    # Mutations ------------------------------------------------------------
+
+    def add_node(self, name: str, ready: bool = True):
+        self._upsert("nodes", _obj(
+            metadata=_meta(name),
+            status=_obj(
+                conditions=[_obj(
+                    type="Ready", status="True" if ready else "False", reason="", message=""
+                )],
+                node_info=_obj(
+                    kernel_version="6.1.0", os_image="Fake Linux",
+                    container_runtime_version="containerd://1.7", kubelet_version="v1.29.0"
+                )
+            )
+        ))
+
+    def add_pod(self, namespace: str, name: str, phase: str = "Running", node_name: str = "node-1"):
+        self._upsert("pods", _obj(
+            metadata=_meta(name, namespace),
+            spec=_obj(node_name=node_name),
+            status=_obj(phase=phase, container_statuses=[])
+        ))
+
+    def set_pod_phase(self, namespace: str, name: str, phase: str):
+        with self._condition:
+            pod = self._objects["pods"][(namespace, name)]
+        self._upsert("pods", _obj(
+            metadata=_meta(name, namespace),
+            spec=pod.spec,
+            status=_obj(phase=phase, container_statuses=pod.status.container_statuses)
+        ))
+
+    def add_service(self, namespace: str, name: str):
+        self._upsert("services", _obj(metadata=_meta(name, namespace)))
+
+    def add_deployment(self, namespace: str, name: str, replicas: int = 1, ready_replicas: Optional[int] = None):
+        ready = replicas if ready_replicas is None else ready_replicas
+        self._upsert("deployments", _obj(
+            metadata=_meta(name, namespace),
+            status=_obj(
+                replicas=replicas, ready_replicas=ready,
+                available_replicas=ready, updated_replicas=replicas
+            )
+        ))
+
+    def add_namespace(self, name: str):
+        self._upsert("namespaces", _obj(metadata=_meta(name)))
+
+    def delete(self, kind: str, namespace: Optional[str], name: str):
+        with self._condition:
+            obj = self._objects[kind].pop((namespace, name))
+            self._record(kind, "DELETED", obj)
+
+    def bookmark(self, kind: str):
+        """
+        Emit a BOOKMARK event carrying only the current resourceVersion. Like
+        the real client, the object is the undeserialized dict.
+        """
+        with self._condition:
+            self._resource_version += 1
+            marker = {
+                "kind": "Bookmark",
+                "metadata": {"resourceVersion": str(self._resource_version)}
+            }
+            self._events.append((self._resource_version, kind, "BOOKMARK", marker))
+            self._condition.notify_all()
+
+    def compact(self):
+        """Discard event history so watches from older versions get 410 Gone."""
+        with self._condition:
+            self._compacted_before = self._resource_version + 1
+            self._events = []
+            self._condition.notify_all()
+
+    # Internals ------------------------------------------------------------
+
+    def _list(self, method: str):
+        kind = self._LIST_KINDS[method]
+        with self._condition:
+            self.call_counts[method] += 1
+            return _obj(
+                items=list(self._objects[kind].values()),
+                metadata=_obj(resource_version=str(self._resource_version))
+            )
+
+    def _upsert(self, kind: str, obj: Any):
+        with self._condition:
+            key = (obj.metadata.namespace, obj.metadata.name)
+            event_type = "MODIFIED" if key in self._objects[kind] else "ADDED"
+            self._objects[kind][key] = obj
+            self._record(kind, event_type, obj)
+
+    def _record(self, kind: str, event_type: str, obj: Any):
+        self._resource_version += 1
+        obj.metadata.resource_version = str(self._resource_version)
+        self._events.append((self._resource_version, kind, event_type, obj))
+        self._condition.notify_all()
+
+
+class FakeWatch:
+    """Minimal ``kubernetes.watch.Watch`` replacement backed by FakeKubernetesAPI."""
+
+    def __init__(self, api: FakeKubernetesAPI):
+        self.api = api
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+        with self.api._condition:
+            self.api._condition.notify_all()
+
+    def stream(self, func, resource_version: Optional[str] = None, timeout_seconds: int = 300, **kwargs):
+        kind = FakeKubernetesAPI._LIST_KINDS[func.__name__]
+        last_seen = int(resource_version or 0)
+        deadline = time.monotonic() + timeout_seconds
+
+        while not self._stopped:
+            with self.api._condition:
+                if last_seen + 1 < self.api._compacted_before:
+                    raise ApiException(status=410, reason="Gone: too old resource version")
+
+                pending = [event for event in self.api._events if event[0] > last_seen and event[1] == kind]
+                if not pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self.api._condition.wait(min(remaining, 0.1))
+                    continue
+
+            for version, _, event_type, obj in pending:
+                last_seen = version
+                yield {"type": event_type, "object": obj}
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Kubernetes State Cache
+======================
+
+Informer-style local cache of cluster state for infrastructure health checks:
+- One initial LIST per resource kind, then a long-lived WATCH stream
+- resourceVersion tracking with automatic re-list on 410 Gone
+- In-memory indexes (namespace, pod phase) for O(1) aggregate queries
+- Watch streams run in background threads so the event loop never blocks
+  on API calls or JSON deserialisation
+
+Forensic Methodology Applied:
+- Evidence is read from a continuously reconciled local view of the cluster
+- Cache freshness (resourceVersion, last event age, re-list count) is
+  recorded alongside every finding
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+Indexer = Callable[[Any], Optional[str]]
+
+
+def namespace_indexer(obj: Any) -> Optional[str]:
+    """Index objects by namespace (cluster-scoped objects are skipped)."""
+    return obj.metadata.namespace
+
+
+def pod_phase_indexer(obj: Any) -> Optional[str]:
+    """Index pods by lifecycle phase."""
+    return obj.status.phase if obj.status else None
+
+
+class ResourceInformer:
+    """
+    List-then-watch informer for a single Kubernetes resource kind.
+
+    Objects are stored by ``(namespace, name)``; configured indexers maintain
+    reverse indexes that are updated incrementally on every watch event.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        list_func: Callable[..., Any],
+        indexers: Optional[Dict[str, Indexer]] = None,
+        watch_factory: Callable[[], Any] = watch.Watch,
+        watch_timeout_seconds: int = 300,
+        retry_backoff_seconds: float = 5.0
+    ):
+        self.kind = kind
+        self.list_func = list_func
+        self.indexers = indexers or {}
+        self.watch_factory = watch_factory
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+        self.resource_version: Optional[str] = None
+        self._objects: Dict[Tuple[Optional[str], str], Any] = {}
+        self._indices: Dict[str, Dict[str, Set[Tuple[Optional[str], str]]]] = {
+            name: defaultdict(set) for name in self.indexers
+        }
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stopping = threading.Event()
+        self._watch = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "relists": 0,
+            "events_applied": 0,
+            "watch_restarts": 0,
+            "errors": 0,
+            "last_error": None,
+            "last_event_monotonic": None
+        }
+
+    # Lifecycle -------------------------------------------------------------
+
+    def start(self):
+        """Start the background list/watch thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"k8s-informer-{self.kind}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Stop watching; the cache keeps its last known state."""
+        self._stopping.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def relist(self):
+        """Replace the store with a fresh LIST and record its resourceVersion."""
+        response = self.list_func()
+        with self._lock:
+            self._objects = {}
+            self._indices = {name: defaultdict(set) for name in self.indexers}
+            for obj in response.items:
+                self._store(obj)
+            self.resource_version = response.metadata.resource_version
+            self.stats["relists"] += 1
+            self.stats["last_event_monotonic"] = time.monotonic()
+        self._synced.set()
+
+    # Read API --------------------------------------------------------------
+
+    def list(self) -> List[Any]:
+        with self._lock:
+            return list(self._objects.values())
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._objects)
+
+    def count_by_index(self, index_name: str, value: str) -> int:
+        with self._lock:
+            return len(self._indices[index_name].get(value, ()))
+
+    def list_by_index(self, index_name: str, value: str) -> List[Any]:
+        with self._lock:
+            return [self._objects[key] for key in self._indices[index_name].get(value, ())]
+
+    def index_counts(self, index_name: str) -> Dict[str, int]:
+        with self._lock:
+            return {value: len(keys) for value, keys in self._indices[index_name].items() if keys}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["resource_version"] = self.resource_version
+            stats["object_count"] = len(self._objects)
+        last_event = stats.pop("last_event_monotonic")
+        stats["synced"] = self.has_synced()
+        stats["seconds_since_last_event"] = (
+            time.monotonic() - last_event if last_event is not None else None
+        )
+        return stats
+
+    # Internals -------------------------------------------------------------
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+
+                self._watch = self.watch_factory()
+                for event in self._watch.stream(
+                    self.list_func,
+                    resource_version=self.resource_version,
+                    timeout_seconds=self.watch_timeout_seconds,
+                    allow_watch_bookmarks=True
+                ):
+                    if self._stopping.is_set():
+                        break
+                    self._apply_event(event)
+
+                with self._lock:
+                    self.stats["watch_restarts"] += 1
+
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old - start over with a fresh LIST
+                    self.resource_version = None
+                    continue
+                self._record_error(e)
+            except Exception as e:
+                self._record_error(e)
+
+    def _record_error(self, error: Exception):
+        with self._lock:
+            self.stats["errors"] += 1
+            self.stats["last_error"] = str(error)
+        self._stopping.wait(self.retry_backoff_seconds)
+
+    def _apply_event(self, event: Dict[str, Any]):
+        event_type = event["type"]
+        obj = event["object"]
+
+        if event_type == "ERROR":
+            code = obj.get("code") if isinstance(obj, dict) else None
+            raise ApiException(status=code or 500, reason=str(obj))
+
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                self._store(obj)
+            elif event_type == "DELETED":
+                self._remove(self._key(obj))
+
+            # BOOKMARK events only advance the resourceVersion; the client
+            # does not deserialize them, so their object is the raw dict
+            if isinstance(obj, dict):
+                self.resource_version = obj["metadata"]["resourceVersion"]
+            else:
+                self.resource_version = obj.metadata.resource_version
+            self.stats["events_applied"] += 1
+            self.stats["last_event_monotonic"] = time.monotonic()
+
+    @staticmethod
+    def _key(obj: Any) -> Tuple[Optional[str], str]:
+        return obj.metadata.namespace, obj.metadata.name
+
+    def _store(self, obj: Any):
+        key = self._key(obj)
+        self._remove(key)
+        self._objects[key] = obj
+        for name, indexer in self.indexers.items():
+            value = indexer(obj)
+            if value is not None:
+                self._indices[name][value].add(key)
+
+    def _remove(self, key: Tuple[Optional[str], str]):
+        previous = self._objects.pop(key, None)
+        if previous is None:
+            return
+        for name, indexer in self.indexers.items():
+            value = indexer(previous)
+            if value is not None:
+                self._indices[name][value].discard(key)
+
+
+class KubernetesStateCache:
+    """Local, continuously reconciled view of nodes, pods, services and deployments."""
+
+    def __init__(
+        self,
+        core_api: Any,
+        apps_api: Any,
+        watch_factory: Callable[[], Any] = watch.Watch,
+        watch_timeout_seconds: int = 300,
+        use_watch: bool = True
+    ):
+        self.use_watch = use_watch
+        informer_options = {
+            "watch_factory": watch_factory,
+            "watch_timeout_seconds": watch_timeout_seconds
+        }
+        self.nodes = ResourceInformer("nodes", core_api.list_node, **informer_options)
+        self.pods = ResourceInformer(
+            "pods",
+            core_api.list_pod_for_all_namespaces,
+            indexers={"namespace": namespace_indexer, "phase": pod_phase_indexer},
+            **informer_options
+        )
+        self.services = ResourceInformer(
+            "services",
+            core_api.list_service_for_all_namespaces,
+            indexers={"namespace": namespace_indexer},
+            **informer_options
+        )
+        self.deployments = ResourceInformer(
+            "deployments",
+            apps_api.list_deployment_for_all_namespaces,
+            indexers={"namespace": namespace_indexer},
+            **informer_options
+        )
+
+    @property
+    def informers(self) -> Iterable[ResourceInformer]:
+        return (self.nodes, self.pods, self.services, self.deployments)
+
+    def has_synced(self) -> bool:
+        return all(informer.has_synced() for informer in self.informers)
+
+    async def ensure_synced(self, timeout: float = 30.0) -> bool:
+        """
+        Make the cache ready for reads without blocking the event loop.
+
+        In watch mode the informers are started once and this only waits for
+        the initial LIST. Without watches every call re-lists in a worker.
+        """
+        loop = asyncio.get_running_loop()
+
+        if not self.use_watch:
+            await asyncio.gather(*(
+                loop.run_in_executor(None, informer.relist) for informer in self.informers
+            ))
+            return True
+
+        for informer in self.informers:
+            informer.start()
+        if self.has_synced():
+            return True
+
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, informer.wait_for_sync, timeout)
+            for informer in self.informers
+        ))
+        return all(results)
+
+    def stop(self):
+        for informer in self.informers:
+            informer.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "watch" if self.use_watch else "relist",
+            "informers": {informer.kind: informer.get_stats() for informer in self.informers}
+        }
@@ -20,71 +20,124 @@ Forensic Methodology Applied:
 
 import asyncio
 import os
-import subprocess
 import time
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-import aiohttp
 import psutil
 import yaml
-from kubernetes import client, config
+from kubernetes import client, config, watch
 
 from ..common.forensic_validator import (
     BaseHealthCheck, HealthStatus, Severity, ForensicLogger
 )
+from ..common.tracing import traced_stage
+from .kubernetes_cache import KubernetesStateCache
+
+
+class CPUSampler:
+    """
+    Background, delta-based CPU utilisation sampler.
+    
+    ``psutil.cpu_percent(interval=1)`` sleeps inside the calling thread for the
+    whole interval. Instead, a background task calls ``cpu_percent(None)`` -
+    which reports utilisation since the previous call - once per interval and
+    keeps a short window of samples, so readers never block.
+    """
+    
+    def __init__(self, interval_seconds: float = 1.0, window_size: int = 5):
+        self.interval_seconds = interval_seconds
+        self.samples: deque = deque(maxlen=window_size)
+        self._first_sample = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start sampling on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            psutil.cpu_percent(interval=None)  # Prime the delta baseline
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the background sampler."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def get_cpu_percent(self) -> float:
+        """Return the latest CPU utilisation, waiting for the first sample only."""
+        self.start()
+        # Never call cpu_percent() here: it would reset the sampler's delta
+        await self._first_sample.wait()
+        return self.samples[-1]
+    
+    def get_window_average(self) -> float:
+        """Average utilisation across the retained sample window."""
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.samples.append(psutil.cpu_percent(interval=None))
+            self._first_sample.set()
 
 
 class SystemResourcesCheck(BaseHealthCheck):
     """System resources health check with forensic baseline analysis."""
     
-    def __init__(self, logger: ForensicLogger, thresholds: Dict[str, float]):
+    def __init__(
+        self,
+        logger: ForensicLogger,
+        thresholds: Dict[str, float],
+        cpu_sample_interval_seconds: float = 1.0
+    ):
         super().__init__("infrastructure.system", logger)
         self.thresholds = thresholds
+        self.cpu_sampler = CPUSampler(cpu_sample_interval_seconds)
     
     async def execute(self):
         """Execute comprehensive system resource validation."""
         start_time = time.perf_counter()
         
         try:
-            # Collect system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            network = psutil.net_io_counters()
-            load_avg = os.getloadavg()
+            # CPU comes from the background sampler; everything else that can
+            # block (process table, socket table, partitions) runs in a worker
+            cpu_percent = await self.cpu_sampler.get_cpu_percent()
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(None, self._collect_system_snapshot)
             
-            # Collect process information
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    if proc.info['cpu_percent'] > 5 or proc.info['memory_percent'] > 5:
-                        processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            memory = snapshot["memory"]
+            disk = snapshot["disk"]
+            network = snapshot["network"]
+            load_avg = snapshot["load_avg"]
             
             # Evidence collection for forensic analysis
             evidence = {
                 "cpu_info": {
-                    "physical_cores": psutil.cpu_count(logical=False),
-                    "logical_cores": psutil.cpu_count(logical=True),
-                    "cpu_freq": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
+                    "physical_cores": snapshot["physical_cores"],
+                    "logical_cores": snapshot["logical_cores"],
+                    "cpu_freq": snapshot["cpu_freq"],
+                    "window_average_percent": self.cpu_sampler.get_window_average()
                 },
                 "memory_info": {
                     "total_gb": round(memory.total / (1024**3), 2),
                     "available_gb": round(memory.available / (1024**3), 2),
-                    "swap": psutil.swap_memory()._asdict()
+                    "swap": snapshot["swap"]
                 },
                 "disk_info": {
                     "total_gb": round(disk.total / (1024**3), 2),
                     "free_gb": round(disk.free / (1024**3), 2),
-                    "filesystem": await self._get_filesystem_info()
+                    "filesystem": snapshot["filesystems"]
                 },
                 "network_info": {
-                    "interfaces": await self._get_network_interfaces(),
-                    "connections": len(psutil.net_connections())
+                    "interfaces": snapshot["interfaces"],
+                    "connections": snapshot["connections"]
                 },
-                "high_resource_processes": processes[:10]  # Top 10 resource consumers
+                "high_resource_processes": snapshot["processes"][:10]  # Top 10 resource consumers
             }
             
             # Metrics for monitoring and alerting
@@ -101,7 +154,7 @@ class SystemResourcesCheck(BaseHealthCheck):
                 "network_bytes_recv": network.bytes_recv,
                 "network_packets_sent": network.packets_sent,
                 "network_packets_recv": network.packets_recv,
-                "active_processes": len(psutil.pids())
+                "active_processes": snapshot["pid_count"]
             }
             
             # Health scoring based on thresholds
@@ -132,31 +185,81 @@ class SystemResourcesCheck(BaseHealthCheck):
                 severity=Severity.CRITICAL
             )
     
-    async def _get_filesystem_info(self) -> List[Dict[str, Any]]:
-        """Get detailed filesystem information."""
+    async def close(self):
+        """Stop the background CPU sampler."""
+        await self.cpu_sampler.stop()
+        await super().close()
+    
+    @traced_stage()
+    def _collect_system_snapshot(self) -> Dict[str, Any]:
+        """Collect blocking psutil data; runs in an executor thread."""
+        # Collect process information
+        processes = []
+        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            try:
+                if proc.info['cpu_percent'] > 5 or proc.info['memory_percent'] > 5:
+                    processes.append(proc.info)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError):
+                continue
+        
         try:
-            result = subprocess.run(['df', '-h'], capture_output=True, text=True)
-            filesystems = []
-            for line in result.stdout.strip().split('\n')[1:]:  # Skip header
-                parts = line.split()
-                if len(parts) >= 6:
-                    filesystems.append({
-                        "filesystem": parts[0],
-                        "size": parts[1],
-                        "used": parts[2],
-                        "available": parts[3],
-                        "use_percent": parts[4],
-                        "mounted_on": parts[5]
-                    })
-            return filesystems
-        except Exception:
-            return []
+            connections = len(psutil.net_connections())
+        except (psutil.AccessDenied, PermissionError):
+            connections = -1
+        
+        cpu_freq = psutil.cpu_freq()
+        
+        return {
+            "memory": psutil.virtual_memory(),
+            "swap": psutil.swap_memory()._asdict(),
+            "disk": psutil.disk_usage('/'),
+            "network": psutil.net_io_counters(),
+            "load_avg": os.getloadavg(),
+            "physical_cores": psutil.cpu_count(logical=False),
+            "logical_cores": psutil.cpu_count(logical=True),
+            "cpu_freq": cpu_freq._asdict() if cpu_freq else None,
+            "filesystems": self._get_filesystem_info(),
+            "interfaces": self._get_network_interfaces(),
+            "connections": connections,
+            "processes": processes,
+            "pid_count": len(psutil.pids())
+        }
     
-    async def _get_network_interfaces(self) -> List[Dict[str, Any]]:
+    def _get_filesystem_info(self) -> List[Dict[str, Any]]:
+        """Get detailed filesystem information."""
+        filesystems = []
+        for partition in psutil.disk_partitions(all=False):
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+            except (PermissionError, OSError):
+                continue
+            filesystems.append({
+                "filesystem": partition.device,
+                "size": self._format_bytes(usage.total),
+                "used": self._format_bytes(usage.used),
+                "available": self._format_bytes(usage.free),
+                "use_percent": f"{usage.percent:.0f}%",
+                "mounted_on": partition.mountpoint,
+                "fstype": partition.fstype
+            })
+        return filesystems
+    
+    @staticmethod
+    def _format_bytes(num_bytes: int) -> str:
+        """Format a byte count the way ``df -h`` does (e.g. ``20G``)."""
+        value = float(num_bytes)
+        for unit in ["B", "K", "M", "G", "T"]:
+            if value < 1024:
+                return f"{value:.1f}{unit}" if unit != "B" else f"{int(value)}B"
+            value /= 1024
+        return f"{value:.1f}P"
+    
+    def _get_network_interfaces(self) -> List[Dict[str, Any]]:
         """Get network interface information."""
         interfaces = []
+        if_stats = psutil.net_if_stats()
         for interface, addrs in psutil.net_if_addrs().items():
-            stats = psutil.net_if_stats().get(interface)
+            stats = if_stats.get(interface)
             interface_info = {
                 "name": interface,
                 "addresses": [addr._asdict() for addr in addrs],
@@ -219,22 +322,43 @@ class SystemResourcesCheck(BaseHealthCheck):
 class KubernetesHealthCheck(BaseHealthCheck):
     """Kubernetes cluster health validation with forensic evidence collection."""
     
-    def __init__(self, logger: ForensicLogger, namespace: str = "default"):
+    def __init__(
+        self,
+        logger: ForensicLogger,
+        namespace: str = "default",
+        use_watch_cache: bool = True,
+        watch_timeout_seconds: int = 300,
+        initial_sync_timeout_seconds: float = 30.0,
+        core_api: Any = None,
+        apps_api: Any = None,
+        watch_factory: Any = None
+    ):
         super().__init__("infrastructure.kubernetes", logger)
         self.namespace = namespace
+        self.initial_sync_timeout_seconds = initial_sync_timeout_seconds
         
-        # Initialize Kubernetes client
-        try:
-            config.load_incluster_config()
-        except config.ConfigException:
+        # Initialize Kubernetes client (injected clients skip config loading)
+        if core_api is None or apps_api is None:
             try:
-                config.load_kube_config()
+                config.load_incluster_config()
             except config.ConfigException:
-                self.k8s_available = False
-                return
+                try:
+                    config.load_kube_config()
+                except config.ConfigException:
+                    self.k8s_available = False
+                    return
+            core_api = core_api or client.CoreV1Api()
+            apps_api = apps_api or client.AppsV1Api()
         
-        self.v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
+        self.v1 = core_api
+        self.apps_v1 = apps_api
+        self.state_cache = KubernetesStateCache(
+            self.v1,
+            self.apps_v1,
+            watch_factory=watch_factory or watch.Watch,
+            watch_timeout_seconds=watch_timeout_seconds,
+            use_watch=use_watch_cache
+        )
         self.k8s_available = True
     
     async def execute(self):
@@ -255,32 +379,39 @@ class KubernetesHealthCheck(BaseHealthCheck):
             )
         
         try:
-            # Collect cluster information
-            nodes = self.v1.list_node()
-            pods = self.v1.list_pod_for_all_namespaces()
-            services = self.v1.list_service_for_all_namespaces()
-            deployments = self.apps_v1.list_deployment_for_all_namespaces()
+            # Cluster state comes from the informer cache; only the first
+            # cycle waits for the initial LIST (in worker threads)
+            sync_timeout = self._probe_timeout(self.initial_sync_timeout_seconds)
+            synced = await self.state_cache.ensure_synced(sync_timeout)
+            if not synced:
+                raise TimeoutError(f"Kubernetes state cache not synced after {sync_timeout:.1f}s")
+            cache = self.state_cache
             
             # Analyze node health
-            node_health = self._analyze_node_health(nodes)
+            node_health = self._analyze_node_health(cache)
             
             # Analyze pod health
-            pod_health = self._analyze_pod_health(pods)
+            pod_health = self._analyze_pod_health(cache)
             
             # Analyze deployment health
-            deployment_health = self._analyze_deployment_health(deployments)
+            deployment_health = self._analyze_deployment_health(cache)
             
             # Evidence collection
             evidence = {
                 "cluster_info": {
-                    "total_nodes": len(nodes.items),
-                    "total_pods": len(pods.items),
-                    "total_services": len(services.items),
-                    "total_deployments": len(deployments.items)
+                    "total_nodes": cache.nodes.count(),
+                    "total_pods": cache.pods.count(),
+                    "total_services": cache.services.count(),
+                    "total_deployments": cache.deployments.count(),
+                    "namespace": self.namespace,
+                    "namespace_pods": cache.pods.count_by_index("namespace", self.namespace),
+                    "namespace_services": cache.services.count_by_index("namespace", self.namespace),
+                    "namespace_deployments": cache.deployments.count_by_index("namespace", self.namespace)
                 },
                 "node_details": node_health["details"],
                 "pod_details": pod_health["details"],
                 "deployment_details": deployment_health["details"],
+                "state_cache": cache.get_stats(),
                 "api_server_response_time_ms": await self._measure_api_response_time()
             }
             
@@ -326,12 +457,20 @@ class KubernetesHealthCheck(BaseHealthCheck):
                 severity=Severity.CRITICAL
             )
     
-    def _analyze_node_health(self, nodes) -> Dict[str, Any]:
+    async def close(self):
+        """Stop the informer watch streams."""
+        if self.k8s_available:
+            self.state_cache.stop()
+        await super().close()
+    
+    @traced_stage()
+    def _analyze_node_health(self, cache: KubernetesStateCache) -> Dict[str, Any]:
         """Analyze Kubernetes node health status."""
         ready_count = 0
         node_details = []
+        nodes = cache.nodes.list()
         
-        for node in nodes.items:
+        for node in nodes:
             node_ready = False
             conditions = []
             
@@ -362,27 +501,26 @@ class KubernetesHealthCheck(BaseHealthCheck):
         
         return {
             "ready_count": ready_count,
-            "total_count": len(nodes.items),
+            "total_count": len(nodes),
             "details": node_details
         }
     
-    def _analyze_pod_health(self, pods) -> Dict[str, Any]:
+    @traced_stage()
+    def _analyze_pod_health(self, cache: KubernetesStateCache) -> Dict[str, Any]:
         """Analyze pod health across all namespaces."""
-        running_count = 0
-        failed_count = 0
-        pending_count = 0
+        # Phase counts come straight from the phase index
+        phase_counts = cache.pods.index_counts("phase")
         pod_details = []
         
-        for pod in pods.items:
-            phase = pod.status.phase
-            
-            if phase == "Running":
-                running_count += 1
-            elif phase == "Failed":
-                failed_count += 1
-            elif phase == "Pending":
-                pending_count += 1
-            
+        # Failed and pending pods are the most relevant evidence
+        detail_pods = (
+            cache.pods.list_by_index("phase", "Failed")
+            + cache.pods.list_by_index("phase", "Pending")
+        )
+        if len(detail_pods) < 50:
+            detail_pods += cache.pods.list_by_index("phase", "Running")[:50 - len(detail_pods)]
+        
+        for pod in detail_pods[:50]:  # Limit for performance
             # Collect container statuses
             container_statuses = []
             if pod.status.container_statuses:
@@ -397,25 +535,28 @@ class KubernetesHealthCheck(BaseHealthCheck):
             pod_details.append({
                 "name": pod.metadata.name,
                 "namespace": pod.metadata.namespace,
-                "phase": phase,
+                "phase": pod.status.phase,
                 "containers": container_statuses,
                 "node": pod.spec.node_name or "unscheduled"
             })
         
         return {
-            "running_count": running_count,
-            "failed_count": failed_count,
-            "pending_count": pending_count,
-            "total_count": len(pods.items),
-            "details": pod_details[:50]  # Limit for performance
+            "running_count": phase_counts.get("Running", 0),
+            "failed_count": phase_counts.get("Failed", 0),
+            "pending_count": phase_counts.get("Pending", 0),
+            "total_count": cache.pods.count(),
+            "phase_counts": phase_counts,
+            "details": pod_details
         }
     
-    def _analyze_deployment_health(self, deployments) -> Dict[str, Any]:
+    @traced_stage()
+    def _analyze_deployment_health(self, cache: KubernetesStateCache) -> Dict[str, Any]:
         """Analyze deployment health and readiness."""
         ready_count = 0
         deployment_details = []
+        deployments = cache.deployments.list()
         
-        for deployment in deployments.items:
+        for deployment in deployments:
             is_ready = (
                 deployment.status.ready_replicas == deployment.status.replicas
                 if deployment.status.ready_replicas and deployment.status.replicas
@@ -437,17 +578,23 @@ class KubernetesHealthCheck(BaseHealthCheck):
         
         return {
             "ready_count": ready_count,
-            "total_count": len(deployments.items),
+            "total_count": len(deployments),
             "details": deployment_details
         }
     
     async def _measure_api_response_time(self) -> float:
         """Measure Kubernetes API server response time."""
-        start_time = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        
+        def timed_request() -> float:
+            start_time = time.perf_counter()
+            self.v1.list_namespace(limit=1)
+            return (time.perf_counter() - start_time) * 1000
+        
         try:
-            self.v1.list_namespace()
-            end_time = time.perf_counter()
-            return (end_time - start_time) * 1000
+            return await self._run_probe(
+                "api_server_response_time", lambda: loop.run_in_executor(None, timed_request), timeout_seconds=5.0
+            )
         except Exception:
             return -1.0
     
@@ -576,20 +723,26 @@ class NetworkConnectivityCheck(BaseHealthCheck):
         """Test connectivity to a specific target."""
         start_time = time.perf_counter()
         
+        session = await self._get_http_session()
+        
+        async def request() -> Dict[str, Any]:
+            async with session.get(target["url"]) as response:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                
+                return {
+                    "target": target["name"],
+                    "url": target["url"],
+                    "success": response.status < 400,
+                    "status_code": response.status,
+                    "latency_ms": latency_ms,
+                    "response_size": len(await response.text())
+                }
+        
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(target["url"]) as response:
-                    latency_ms = (time.perf_counter() - start_time) * 1000
-                    
-                    return {
-                        "target": target["name"],
-                        "url": target["url"],
-                        "success": response.status < 400,
-                        "status_code": response.status,
-                        "latency_ms": latency_ms,
-                        "response_size": len(await response.text())
-                    }
+            # Connectivity probes are idempotent GETs, so they may be hedged
+            return await self._run_probe(
+                target["name"], request, timeout_seconds=target.get("timeout", 5), hedge=True
+            )
         except Exception as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
             return {
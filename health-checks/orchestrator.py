@@ -21,18 +21,27 @@ Forensic Investigation Methodology Applied:
 """
 
 import asyncio
-import json
 import sys
+import aiohttp
 import yaml
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import health check modules
 from .common.forensic_validator import (
     HealthCheckOrchestrator, HealthCheckRegistry, ForensicLogger, 
-    HealthStatus, Severity
+    HTTPSessionManager, HealthCheckResult, HealthStatus, Severity
 )
+from .common.http_api import HealthCheckAPI
+from .common.integrity import HASH_SCHEME, MERKLE_SCHEME, merkle_proofs, merkle_root
+from .common.metrics import EventLoopLagSampler, HealthCheckMetrics
+from .common.report_writer import (
+    REPORT_COMPRESSIONS, REPORT_FORMATS, check_report_format, write_report_atomically
+)
+from .common.result_cache import CachePolicy
+from .common.scheduler import DependencyScheduler, IntervalPolicy, IntervalScheduler
+from .common.tracing import tracer
 from .infrastructure.system_health import (
     SystemResourcesCheck, KubernetesHealthCheck, NetworkConnectivityCheck
 )
@@ -55,9 +64,22 @@ class BusinessCriticalHealthOrchestrator:
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config = self._load_configuration(config_path)
-        self.logger = ForensicLogger()
-        self.registry = HealthCheckRegistry()
-        self.base_orchestrator = HealthCheckOrchestrator(config_path)
+        
+        logging_config = dict(self.config["forensic_logging"])
+        log_dir = Path(logging_config.pop("log_dir"))
+        self.logger = ForensicLogger(log_dir, sink_config=logging_config)
+        self.registry = HealthCheckRegistry(self.logger)
+        self.session_manager = HTTPSessionManager(self.config["http_client"])
+        self.base_orchestrator = HealthCheckOrchestrator(config_path, logger=self.logger)
+        self.metrics = HealthCheckMetrics(self.config["metrics"]["max_series_per_metric"])
+        tracing_config = self.config["tracing"]
+        tracer.configure(enabled=tracing_config["enabled"], max_events=tracing_config["max_events"])
+        self.loop_lag_sampler = EventLoopLagSampler(
+            self.metrics,
+            self.config["metrics"]["event_loop_lag_interval_seconds"],
+            stall_threshold_seconds=tracing_config["stall_threshold_ms"] / 1000,
+            on_stall=tracer.record_stall
+        )
         
         # Initialize health check categories
         self.infrastructure_checks = []
@@ -67,6 +89,12 @@ class BusinessCriticalHealthOrchestrator:
         
         # Setup health checks based on configuration
         self._setup_health_checks()
+        self.scheduler = self._setup_scheduler()
+        self.interval_scheduler: Optional[IntervalScheduler] = None
+        
+        # Most recent result per check, updated as each check completes
+        self.latest_results: Dict[str, Dict[str, Any]] = {}
+        self.latest_sequence = 0
     
     def _load_configuration(self, config_path: Optional[Path]) -> Dict[str, Any]:
         """Load comprehensive health check configuration."""
@@ -82,9 +110,13 @@ class BusinessCriticalHealthOrchestrator:
                     "disk_warning": 80,
                     "disk_critical": 90
                 },
+                "cpu_sample_interval_seconds": 1.0,
                 "kubernetes": {
                     "enabled": True,
-                    "namespace": "default"
+                    "namespace": "default",
+                    "watch_cache": True,
+                    "watch_timeout_seconds": 300,
+                    "initial_sync_timeout_seconds": 30.0
                 },
                 "network_targets": [
                     {"name": "google_dns", "url": "https://8.8.8.8"},
@@ -111,8 +143,47 @@ class BusinessCriticalHealthOrchestrator:
                     "http://trading-engine:8080",
                     "http://order-management:8080"
                 ],
+                # Risk service for the risk-limit probes (None = the first trading endpoint)
+                "risk_endpoint": None,
+                "order_book": {
+                    "symbol": "EURUSD",
+                    "min_depth": 5,
+                    "max_spread_bps": 50.0
+                },
+                "order_request_timeout_seconds": 2.0,
+                # Send the lifecycle sample's orders to /orders/execute (off: validate and route only)
+                "execute_test_orders": False,
                 "regulations": ["MiFID_II", "Dodd_Frank", "EMIR"],
-                "latency_threshold_ms": 50.0
+                "latency_threshold_ms": 50.0,
+                # Persistent subscription per WebSocket feed; checks snapshot its tick statistics
+                "feed_monitor": {
+                    "enabled": True,
+                    "stale_after_seconds": 5.0,
+                    "connect_timeout_seconds": 10.0,
+                    "initial_backoff_seconds": 0.5,
+                    "max_backoff_seconds": 30.0,
+                    "timestamp_field": "timestamp"
+                },
+                # Tick-level cross-feed validation on a common time grid
+                "cross_validation": {
+                    "grid_seconds": 0.5,
+                    "history_seconds": 300.0,
+                    "rolling_window_seconds": 60.0,
+                    "stale_after_seconds": 5.0,
+                    "max_details": 20
+                },
+                # Open-loop synthetic order flow against trading_endpoints (opt-in)
+                "order_load_test": {
+                    "enabled": False,
+                    "arrival_rate_per_second": 200.0,
+                    "duration_seconds": 10.0,
+                    "concurrency": 32,
+                    "arrival": "poisson",
+                    "max_backlog": 10000,
+                    "drain_timeout_seconds": 5.0,
+                    "latency_slo_ms": 50.0,
+                    "min_sustained_ratio": 0.95
+                }
             },
             "pharma": {
                 "enabled": True,
@@ -138,6 +209,22 @@ class BusinessCriticalHealthOrchestrator:
                 "regression_threshold_percent": 10.0,
                 "minimum_samples": 50,
                 "confidence_threshold": 0.8,
+                "correlation_top_k": 20,
+                "correlation_incremental": False,
+                "change_point": {
+                    "method": "cusum",
+                    "threshold": 5.0,
+                    "drift": 0.5,
+                    "warmup_samples": 20
+                },
+                "ml_models": {
+                    "retrain_interval_seconds": 3600,
+                    "drift_threshold_sigma": 3.0,
+                    "min_training_samples": 20,
+                    "executor": "process",
+                    "max_workers": 2,
+                    "model_dir": "/var/lib/health-checks/models"
+                },
                 "metric_endpoints": [
                     {
                         "name": "application_metrics",
@@ -163,6 +250,97 @@ class BusinessCriticalHealthOrchestrator:
                     "recipients": ["ops-team@example.com"]
                 }
             },
+            "scheduler": {
+                # Extra edges of the check DAG: {check_name: [dependency, ...]}
+                "dependencies": {},
+                "on_dependency_failure": "run",  # run | skip
+                "max_concurrent_checks": None,
+                "default_check_concurrency": 1,
+                # Limits keyed by concurrency group (defaults to the check name)
+                "concurrency_limits": {},
+                "concurrency_groups": {},
+                # --continuous: each check on its own interval (heap scheduler)
+                "continuous": {
+                    "default_interval_seconds": 300,
+                    "default_jitter_seconds": 2.0,
+                    "default_timeout_seconds": None,  # None = the check's interval
+                    "snapshot_interval_seconds": 5.0,
+                    "alert_repeat_seconds": 300,
+                    "checks": {
+                        "infrastructure_system_resources": {"interval_seconds": 15},
+                        "infrastructure_kubernetes": {"interval_seconds": 120},
+                        "infrastructure_network": {"interval_seconds": 30},
+                        "finance_market_data": {"interval_seconds": 15},
+                        "finance_order_processing": {"interval_seconds": 30},
+                        "finance_compliance": {"interval_seconds": 900},
+                        "pharma_manufacturing_efficiency": {"interval_seconds": 60},
+                        "pharma_sensor_validation": {"interval_seconds": 30},
+                        "pharma_batch_integrity": {"interval_seconds": 120},
+                        "performance_regression": {"interval_seconds": 600, "timeout_seconds": 120}
+                    }
+                }
+            },
+            "deadlines": {
+                # Budget per check execution; at the deadline the check is
+                # cancelled and its completed probes are reported as partial results
+                "default_check_timeout_seconds": 30.0,
+                # Re-issue idempotent probes that are slower than this (None = off)
+                "hedge_after_seconds": None,
+                "max_hedged_attempts": 2,
+                "checks": {
+                    "infrastructure_kubernetes": {"timeout_seconds": 45.0},
+                    "performance_regression": {"timeout_seconds": 60.0}
+                }
+            },
+            "result_cache": {
+                # Cached results are served within ttl_seconds; for a further
+                # stale_while_revalidate_seconds they are served while a
+                # background execution refreshes them
+                "enabled": True,
+                "default_ttl_seconds": 0.0,
+                "default_stale_while_revalidate_seconds": 0.0,
+                "checks": {
+                    "infrastructure_kubernetes": {"ttl_seconds": 30.0, "stale_while_revalidate_seconds": 120.0},
+                    "finance_compliance": {"ttl_seconds": 900.0, "stale_while_revalidate_seconds": 3600.0},
+                    "pharma_batch_integrity": {"ttl_seconds": 60.0, "stale_while_revalidate_seconds": 300.0}
+                }
+            },
+            "metrics": {
+                # Label sets beyond this per metric are folded into one overflow series
+                "max_series_per_metric": 1000,
+                "event_loop_lag_interval_seconds": 0.1
+            },
+            "tracing": {
+                # Check / stage spans and event-loop stalls in a ring buffer,
+                # exported as a Chrome trace (--trace, /debug/trace)
+                "enabled": True,
+                "max_events": 50000,
+                "stall_threshold_ms": 50.0
+            },
+            "daemon": {
+                # --serve: HTTP query API of the resident daemon
+                "host": "127.0.0.1",
+                "port": 8085,
+                # Triggered checks still running after this return 202 (None = wait)
+                "trigger_timeout_seconds": None
+            },
+            "http_client": {
+                "connection_limit": 100,
+                "connection_limit_per_host": 10,
+                "keepalive_timeout_seconds": 30.0,
+                "dns_cache_ttl_seconds": 300,
+                "default_timeout_seconds": 10.0
+            },
+            "forensic_logging": {
+                "log_dir": "/var/log/health-checks",
+                "max_queue_size": 10000,
+                "batch_size": 256,
+                "flush_interval_seconds": 0.5,
+                "fsync_policy": "always",  # always | interval | never
+                "fsync_interval_seconds": 1.0,
+                "backpressure": "block",  # block | drop
+                "block_timeout_seconds": 0.05
+            },
             "compliance": {
                 "fda_21cfr11": True,
                 "sox_compliance": True,
@@ -204,6 +382,114 @@ class BusinessCriticalHealthOrchestrator:
         # Performance regression detection
         if self.config["regression_detection"]["enabled"]:
             self._setup_regression_checks()
+        
+        # All probes share one pooled HTTP session
+        for check in self.registry.checks.values():
+            check.use_session_manager(self.session_manager)
+        
+        self._setup_deadlines()
+        self._setup_result_cache()
+        self._setup_metrics()
+    
+    def _setup_deadlines(self):
+        """Apply per-check deadline budgets, probe timeouts and hedging."""
+        deadline_config = self.config["deadlines"]
+        self.registry.default_timeout_seconds = deadline_config["default_check_timeout_seconds"]
+        
+        for check_name, check in self.registry.checks.items():
+            check_config = deadline_config["checks"].get(check_name, {})
+            check.configure_deadlines(
+                timeout_seconds=check_config.get("timeout_seconds"),
+                probe_timeout_seconds=check_config.get("probe_timeout_seconds"),
+                hedge_after_seconds=check_config.get("hedge_after_seconds", deadline_config["hedge_after_seconds"]),
+                max_hedged_attempts=check_config.get("max_hedged_attempts", deadline_config["max_hedged_attempts"])
+            )
+    
+    def _setup_result_cache(self):
+        """Apply per-check result cache TTLs."""
+        cache_config = self.config["result_cache"]
+        cache = self.registry.result_cache
+        cache.default_policy = CachePolicy(
+            ttl_seconds=cache_config["default_ttl_seconds"],
+            stale_while_revalidate_seconds=cache_config["default_stale_while_revalidate_seconds"]
+        )
+        cache.policies = {
+            check_name: CachePolicy(
+                ttl_seconds=policy.get("ttl_seconds", cache_config["default_ttl_seconds"]),
+                stale_while_revalidate_seconds=policy.get(
+                    "stale_while_revalidate_seconds", cache_config["default_stale_while_revalidate_seconds"]
+                )
+            )
+            for check_name, policy in cache_config["checks"].items()
+        }
+    
+    def _setup_metrics(self):
+        """Feed check results and probe latencies into the metrics exporter."""
+        self.registry.metrics = self.metrics
+        for check in self.registry.checks.values():
+            check.use_metrics(self.metrics)
+        self.metrics.add_collector(self._collect_internal_metrics)
+    
+    def _collect_internal_metrics(self):
+        """Scrape-time counters owned by the cache, audit sink and schedulers."""
+        cache_stats = self.registry.result_cache.get_stats()
+        yield (
+            "health_check_cache_lookups_total", "counter", "Result cache lookups by outcome",
+            [({"outcome": outcome}, cache_stats[outcome]) for outcome in ("hits", "stale_hits", "misses")]
+        )
+        yield (
+            "health_check_cache_revalidations_total", "counter", "Background stale-while-revalidate executions",
+            [({}, cache_stats["revalidations"])]
+        )
+        
+        sink_stats = self.logger.get_sink_stats()
+        yield ("health_audit_queue_depth", "gauge", "Audit records waiting for the writer thread",
+               [({}, sink_stats["queue_depth"])])
+        yield ("health_audit_records_dropped_total", "counter", "Audit records dropped under backpressure",
+               [({}, sink_stats["dropped"])])
+        
+        yield ("health_check_results_total", "counter", "Check results recorded since startup",
+               [({}, self.latest_sequence)])
+        
+        if self.interval_scheduler is not None:
+            schedule_stats = self.interval_scheduler.stats
+            yield ("health_checks_running", "gauge", "Checks currently executing in continuous mode",
+                   [({}, len(self.interval_scheduler.get_stats()["running"]))])
+            yield ("health_check_overruns_total", "counter", "Runs that took longer than their interval",
+                   [({"check": name}, stats.overruns) for name, stats in schedule_stats.items()])
+            yield ("health_check_skipped_ticks_total", "counter", "Ticks skipped because the previous run was in flight",
+                   [({"check": name}, stats.skipped_ticks) for name, stats in schedule_stats.items()])
+    
+    def _setup_scheduler(self) -> DependencyScheduler:
+        """Apply configured dependencies and build the DAG scheduler."""
+        scheduler_config = self.config["scheduler"]
+        
+        for check_name, group in scheduler_config["concurrency_groups"].items():
+            if check_name in self.registry.checks:
+                self.registry.concurrency_groups[check_name] = group
+        
+        for check_name, depends_on in scheduler_config["dependencies"].items():
+            if check_name not in self.registry.checks:
+                continue
+            # Dependencies on disabled checks are dropped rather than blocking
+            enabled = [dep for dep in depends_on if dep in self.registry.checks]
+            ignored = [dep for dep in depends_on if dep not in self.registry.checks]
+            if ignored:
+                self.logger.log_audit_event(
+                    "health_check_dependencies_ignored",
+                    {"check_name": check_name, "ignored": ignored}
+                )
+            self.registry.set_dependencies(check_name, enabled)
+        
+        scheduler = DependencyScheduler(
+            self.registry,
+            max_concurrent_checks=scheduler_config["max_concurrent_checks"],
+            concurrency_limits=scheduler_config["concurrency_limits"],
+            default_check_concurrency=scheduler_config["default_check_concurrency"],
+            on_dependency_failure=scheduler_config["on_dependency_failure"]
+        )
+        scheduler.validate()
+        return scheduler
     
     def _setup_infrastructure_checks(self):
         """Setup infrastructure-level health checks."""
@@ -212,16 +498,21 @@ class BusinessCriticalHealthOrchestrator:
         # System resources check
         system_check = SystemResourcesCheck(
             self.logger, 
-            infra_config["system_thresholds"]
+            infra_config["system_thresholds"],
+            infra_config["cpu_sample_interval_seconds"]
         )
         self.registry.register_check("infrastructure_system_resources", system_check)
         self.infrastructure_checks.append("infrastructure_system_resources")
         
         # Kubernetes health check
         if infra_config["kubernetes"]["enabled"]:
+            k8s_config = infra_config["kubernetes"]
             k8s_check = KubernetesHealthCheck(
                 self.logger,
-                infra_config["kubernetes"]["namespace"]
+                k8s_config["namespace"],
+                use_watch_cache=k8s_config["watch_cache"],
+                watch_timeout_seconds=k8s_config["watch_timeout_seconds"],
+                initial_sync_timeout_seconds=k8s_config["initial_sync_timeout_seconds"]
             )
             self.registry.register_check("infrastructure_kubernetes", k8s_check)
             self.infrastructure_checks.append("infrastructure_kubernetes")
@@ -244,7 +535,9 @@ class BusinessCriticalHealthOrchestrator:
             market_data_check = MarketDataFeedCheck(
                 self.logger,
                 finance_config["market_data_feeds"],
-                finance_config["latency_threshold_ms"]
+                finance_config["latency_threshold_ms"],
+                feed_monitor_config=finance_config["feed_monitor"],
+                cross_validation_config=finance_config["cross_validation"]
             )
             self.registry.register_check("finance_market_data", market_data_check)
             self.finance_checks.append("finance_market_data")
@@ -253,7 +546,14 @@ class BusinessCriticalHealthOrchestrator:
         if finance_config["trading_endpoints"]:
             order_processing_check = OrderProcessingCheck(
                 self.logger,
-                finance_config["trading_endpoints"]
+                finance_config["trading_endpoints"],
+                load_test_config=finance_config["order_load_test"],
+                risk_endpoint=finance_config["risk_endpoint"],
+                order_book_symbol=finance_config["order_book"]["symbol"],
+                min_book_depth=finance_config["order_book"]["min_depth"],
+                max_spread_bps=finance_config["order_book"]["max_spread_bps"],
+                request_timeout_seconds=finance_config["order_request_timeout_seconds"],
+                execute_test_orders=finance_config["execute_test_orders"]
             )
             self.registry.register_check("finance_order_processing", order_processing_check)
             self.finance_checks.append("finance_order_processing")
@@ -310,10 +610,15 @@ class BusinessCriticalHealthOrchestrator:
         self.registry.register_check("performance_regression", regression_detector)
         self.regression_checks.append("performance_regression")
     
-    async def run_comprehensive_health_check(self) -> Dict[str, Any]:
+    async def run_comprehensive_health_check(self, use_cache: Optional[bool] = None) -> Dict[str, Any]:
         """
         Execute comprehensive health check across all tiers and industries.
         
+        Args:
+            use_cache: Serve results through the result cache (defaults to
+                ``result_cache.enabled``). Every result is marked with its
+                cache state and age.
+        
         Returns:
             Comprehensive health report with forensic evidence
         """
@@ -328,39 +633,20 @@ class BusinessCriticalHealthOrchestrator:
             }
         )
         
-        # Execute health checks in phases for optimal performance
-        results = {}
-        
-        # Phase 1: Infrastructure checks (foundational)
-        if self.infrastructure_checks:
-            infra_results = await self._execute_check_phase("infrastructure", self.infrastructure_checks)
-            results.update(infra_results)
-        
-        # Phase 2: Industry-specific checks (parallel execution)
-        industry_tasks = []
-        
-        if self.finance_checks:
-            industry_tasks.append(
-                self._execute_check_phase("finance", self.finance_checks)
-            )
-        
-        if self.pharma_checks:
-            industry_tasks.append(
-                self._execute_check_phase("pharma", self.pharma_checks)
-            )
-        
-        if industry_tasks:
-            industry_results = await asyncio.gather(*industry_tasks)
-            for result_dict in industry_results:
-                results.update(result_dict)
-        
-        # Phase 3: Performance regression detection
-        if self.regression_checks:
-            regression_results = await self._execute_check_phase("regression", self.regression_checks)
-            results.update(regression_results)
+        # Execute checks as a dependency DAG: each starts once its dependencies complete
+        if use_cache is None:
+            use_cache = self.config["result_cache"]["enabled"]
+        sample_loop_lag = not self.loop_lag_sampler.running
+        if sample_loop_lag:
+            self.loop_lag_sampler.start()
+        try:
+            results, schedule = await self._execute_check_graph(use_cache)
+        finally:
+            if sample_loop_lag:
+                await self.loop_lag_sampler.stop()
         
         # Generate comprehensive health report
-        health_report = await self._generate_comprehensive_report(results, start_time)
+        health_report = await self._generate_comprehensive_report(results, start_time, schedule)
         
         # Execute incident response if critical issues detected
         if health_report["overall_status"] in [HealthStatus.CRITICAL.value]:
@@ -380,55 +666,258 @@ class BusinessCriticalHealthOrchestrator:
         
         return health_report
     
-    async def _execute_check_phase(self, phase_name: str, check_names: List[str]) -> Dict[str, Any]:
-        """Execute a phase of health checks."""
+    async def _execute_check_graph(self, use_cache: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Execute all registered checks through the dependency scheduler."""
         self.logger.log_audit_event(
-            f"health_check_phase_started",
-            {"phase": phase_name, "checks": check_names}
+            "health_check_graph_started",
+            {"dependencies": {name: list(deps) for name, deps in self.registry.dependencies.items()}}
         )
         
-        # Execute checks in parallel within the phase
-        tasks = [self.registry.execute_check(check_name) for check_name in check_names]
-        phase_results = await asyncio.gather(*tasks, return_exceptions=True)
+        outcomes, schedule = await self.scheduler.run(use_cache=use_cache)
         
-        # Process results
         results = {}
-        for i, result in enumerate(phase_results):
-            check_name = check_names[i]
-            if isinstance(result, Exception):
-                # Create error result for failed checks
-                error_result = {
-                    "check_id": f"error_{check_name}",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "component": phase_name,
-                    "check_type": "execution_error",
-                    "status": HealthStatus.CRITICAL.value,
-                    "score": 0.0,
-                    "metrics": {},
-                    "evidence": {"exception": str(result)},
-                    "duration_ms": 0.0,
-                    "error_message": str(result),
-                    "severity": Severity.CRITICAL.value
-                }
-                results[check_name] = error_result
-            else:
-                results[check_name] = result.to_dict()
+        for check_name, outcome in outcomes.items():
+            # The marker describes this run only; keep it out of the latest-results snapshot
+            results[check_name] = dict(self._record_latest(check_name, outcome))
+            timing = schedule["checks"][check_name]
+            results[check_name]["cache"] = {
+                "state": timing["cache_state"] or "executed",
+                "age_seconds": timing["result_age_seconds"]
+            }
         
         self.logger.log_audit_event(
-            f"health_check_phase_completed",
+            "health_check_graph_completed",
             {
-                "phase": phase_name, 
                 "checks_completed": len(results),
-                "critical_count": sum(1 for r in results.values() if r["status"] == HealthStatus.CRITICAL.value)
+                "critical_count": sum(1 for r in results.values() if r["status"] == HealthStatus.CRITICAL.value),
+                "critical_path": schedule["critical_path"],
+                "critical_path_seconds": schedule["critical_path_seconds"]
             }
         )
         
-        return results
+        return results, schedule
+    
+    def _result_to_dict(self, check_name: str, result: Any) -> Dict[str, Any]:
+        """Serialize a check outcome, turning an escaped exception into an error result."""
+        if not isinstance(result, Exception):
+            return result.to_dict()
+        
+        # Create error result for failed checks
+        error_result = {
+            "check_id": f"error_{check_name}",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "component": self.registry.checks[check_name].component,
+            "check_type": "execution_error",
+            "status": HealthStatus.CRITICAL.value,
+            "score": 0.0,
+            "metrics": {},
+            "evidence": {"exception": str(result)},
+            "duration_ms": 0.0,
+            "error_message": str(result),
+            "severity": Severity.CRITICAL.value
+        }
+        error_result["hash"] = HealthCheckResult.compute_hash(error_result)
+        return error_result
+    
+    def _record_latest(self, check_name: str, result: Any) -> Dict[str, Any]:
+        """Store a check outcome in the latest-results snapshot."""
+        result_dict = self._result_to_dict(check_name, result)
+        self.latest_results[check_name] = result_dict
+        self.latest_sequence += 1
+        return result_dict
+    
+    async def run_check(self, check_name: str, use_cache: bool = False) -> Dict[str, Any]:
+        """
+        Execute one check on demand and record it in the latest-results snapshot.
+
+        Runs under the check's concurrency slots and deadline, like a scheduled
+        execution; with ``use_cache`` a result within its cache TTL is served.
+        """
+        async with self.scheduler.slot(check_name):
+            if use_cache:
+                lookup = await self.registry.execute_cached(check_name)
+                result, cache_marker = lookup.result, lookup.marker()
+            else:
+                result = await self.registry.execute_check(check_name)
+                cache_marker = {"state": "executed", "age_seconds": 0.0}
+
+        result_dict = dict(self._record_latest(check_name, result))
+        result_dict["cache"] = cache_marker
+        return result_dict
+
+    def _interval_policies(self, default_interval: Optional[float] = None) -> Dict[str, IntervalPolicy]:
+        """Continuous-mode policy for every registered check."""
+        continuous = self.config["scheduler"]["continuous"]
+        per_check = continuous["checks"]
+        
+        policies = {}
+        for check_name in self.registry.checks:
+            check_config = per_check.get(check_name, {})
+            policies[check_name] = IntervalPolicy(
+                interval_seconds=check_config.get(
+                    "interval_seconds", default_interval or continuous["default_interval_seconds"]
+                ),
+                jitter_seconds=check_config.get("jitter_seconds", continuous["default_jitter_seconds"]),
+                timeout_seconds=check_config.get("timeout_seconds", continuous["default_timeout_seconds"])
+            )
+        return policies
+    
+    async def get_latest_snapshot(self) -> Dict[str, Any]:
+        """
+        Lightweight report over the most recent result of every check.
+        
+        Used by continuous mode in place of regenerating the full report on
+        every tick.
+        """
+        results = {
+            name: self.latest_results[name] for name in self.registry.checks if name in self.latest_results
+        }
+        total_checks = len(results)
+        status_counts = {status: 0 for status in HealthStatus}
+        for result in results.values():
+            status_counts[HealthStatus(result["status"])] += 1
+        
+        if status_counts[HealthStatus.CRITICAL] > 0:
+            overall_status = HealthStatus.CRITICAL
+        elif status_counts[HealthStatus.DEGRADED] > 0:
+            overall_status = HealthStatus.DEGRADED
+        else:
+            overall_status = HealthStatus.HEALTHY
+        
+        now = datetime.now(timezone.utc)
+        return {
+            "snapshot_metadata": {
+                "generated_at": now.isoformat(),
+                "report_type": "latest_results_snapshot",
+                "sequence": self.latest_sequence,
+                "checks_pending": sorted(set(self.registry.checks) - set(results))
+            },
+            "overall_status": overall_status.value,
+            "overall_score": sum(r["score"] for r in results.values()) / total_checks if total_checks else 0.0,
+            "summary": {
+                "healthy_count": status_counts[HealthStatus.HEALTHY],
+                "degraded_count": status_counts[HealthStatus.DEGRADED],
+                "critical_count": status_counts[HealthStatus.CRITICAL],
+                "unknown_count": status_counts[HealthStatus.UNKNOWN],
+                "success_rate_percent": (status_counts[HealthStatus.HEALTHY] / max(total_checks, 1)) * 100
+            },
+            "scheduling": self.interval_scheduler.get_stats() if self.interval_scheduler else {},
+            "recommendations": await self._generate_recommendations(results, overall_status),
+            "latest_results": results,
+            "result_ages_seconds": {
+                name: (now - datetime.fromisoformat(result["timestamp"])).total_seconds()
+                for name, result in results.items()
+            },
+            "forensic_chain_of_custody": {
+                "results_hash": self._calculate_results_hash(results),
+                "hash_scheme": HASH_SCHEME,
+                "merkle_scheme": MERKLE_SCHEME
+            }
+        }
     
+    async def run_continuous(
+        self,
+        output: Optional[Path] = None,
+        output_format: str = "json",
+        compression: Optional[str] = None,
+        default_interval: Optional[float] = None
+    ):
+        """
+        Run every check on its own interval until cancelled.
+        
+        The latest-results snapshot is republished (and ``output`` rewritten)
+        at most every ``snapshot_interval_seconds`` when something changed.
+        Incident response fires when the overall status turns critical and
+        repeats every ``alert_repeat_seconds`` while it stays critical.
+        """
+        continuous = self.config["scheduler"]["continuous"]
+        self.interval_scheduler = IntervalScheduler(
+            self.scheduler,
+            self._interval_policies(default_interval),
+            on_result=self._record_latest
+        )
+        scheduler_task = asyncio.create_task(self.interval_scheduler.run())
+        self.loop_lag_sampler.start()
+        
+        published_sequence = 0
+        last_status = None
+        last_alert = 0.0
+        loop = asyncio.get_running_loop()
+        try:
+            while not scheduler_task.done():
+                await asyncio.wait({scheduler_task}, timeout=continuous["snapshot_interval_seconds"])
+                if self.latest_sequence == published_sequence:
+                    continue
+                published_sequence = self.latest_sequence
+                
+                snapshot = await self.get_latest_snapshot()
+                if output:
+                    try:
+                        # Encoding, compression and fsync stay off the event loop
+                        await loop.run_in_executor(
+                            None, write_health_report, snapshot, output, output_format, compression
+                        )
+                    except Exception as e:
+                        self.logger.log_audit_event(
+                            "health_snapshot_write_failed",
+                            {"output": str(output), "error": str(e)}
+                        )
+                
+                status = snapshot["overall_status"]
+                if status != last_status:
+                    self.logger.log_audit_event(
+                        "health_status_changed",
+                        {"previous_status": last_status, "status": status, "summary": snapshot["summary"]}
+                    )
+                    print(f"Health status: {status} - Critical issues: {snapshot['summary']['critical_count']}")
+                
+                if status == HealthStatus.CRITICAL.value and (
+                    last_status != status or loop.time() - last_alert >= continuous["alert_repeat_seconds"]
+                ):
+                    last_alert = loop.time()
+                    await self._execute_incident_response(snapshot)
+                last_status = status
+            
+            # Surface an unexpected scheduler failure
+            scheduler_task.result()
+        finally:
+            self.interval_scheduler.stop()
+            await self.loop_lag_sampler.stop()
+            if not scheduler_task.done():
+                await asyncio.gather(scheduler_task, return_exceptions=True)
+
+    async def serve(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        output: Optional[Path] = None,
+        output_format: str = "json",
+        compression: Optional[str] = None,
+        default_interval: Optional[float] = None
+    ):
+        """
+        Resident daemon: continuous monitoring plus the HTTP query API.
+
+        The API serves the warm latest-results state; it stays up until
+        cancelled, and stops together with the interval scheduler.
+        """
+        daemon_config = self.config["daemon"]
+        api = HealthCheckAPI(self, trigger_timeout_seconds=daemon_config["trigger_timeout_seconds"])
+        host = host or daemon_config["host"]
+        port = port or daemon_config["port"]
+
+        await api.start(host, port)
+        print(f"Health check API listening on http://{host}:{port}")
+        try:
+            await self.run_continuous(output, output_format, compression, default_interval)
+        finally:
+            await api.stop()
+
     async def _generate_comprehensive_report(
         self, 
         results: Dict[str, Any], 
-        start_time: datetime
+        start_time: datetime,
+        schedule: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Generate comprehensive health report with forensic analysis."""
         end_time = datetime.now(timezone.utc)
@@ -479,7 +968,15 @@ class BusinessCriticalHealthOrchestrator:
                 "end_time": end_time.isoformat(),
                 "total_duration_seconds": (end_time - start_time).total_seconds(),
                 "checks_executed": total_checks,
-                "enabled_industries": self.config["enabled_industries"]
+                "enabled_industries": self.config["enabled_industries"],
+                "scheduling": schedule or {},
+                "probe_stats": {name: dict(check.probe_stats) for name, check in self.registry.checks.items()},
+                "results_from_cache": sum(1 for r in results.values() if r.get("cache", {}).get("state") != "executed"),
+                "result_cache": self.registry.result_cache.get_stats(),
+                # Wall vs event-loop CPU time of each check's latest execution
+                "loop_time": {name: tracer.check_timings[name] for name in results if name in tracer.check_timings},
+                "tracing": tracer.get_stats(),
+                "forensic_log_sink": self.logger.get_sink_stats()
             },
             "overall_status": overall_status.value,
             "overall_score": overall_score,
@@ -498,6 +995,9 @@ class BusinessCriticalHealthOrchestrator:
             "recommendations": await self._generate_recommendations(results, overall_status),
             "forensic_chain_of_custody": {
                 "results_hash": self._calculate_results_hash(results),
+                "hash_scheme": HASH_SCHEME,
+                "merkle_scheme": MERKLE_SCHEME,
+                "merkle_proofs": merkle_proofs({name: result["hash"] for name, result in results.items()}),
                 "integrity_verified": True,
                 "audit_trail_complete": True,
                 "digital_signature_required": self.config["compliance"]["digital_signatures_required"]
@@ -678,8 +1178,8 @@ class BusinessCriticalHealthOrchestrator:
             if "evidence" in result:
                 evidence_collected += len(result["evidence"])
             
-            # Check if hash is present (chain of custody)
-            if "hash" not in result:
+            # Check the recorded hash still matches the result (chain of custody)
+            if not HealthCheckResult.verify_hash(result):
                 chain_of_custody_intact = False
         
         return {
@@ -736,13 +1236,9 @@ class BusinessCriticalHealthOrchestrator:
         return recommendations
     
     def _calculate_results_hash(self, results: Dict[str, Any]) -> str:
-        """Calculate hash of all results for forensic integrity."""
-        import hashlib
-        
-        # Sort results for consistent hashing
-        sorted_results = dict(sorted(results.items()))
-        results_json = json.dumps(sorted_results, sort_keys=True)
-        return hashlib.sha256(results_json.encode()).hexdigest()
+        """Merkle root over the per-result hashes for forensic integrity."""
+        # Reuse the hash each result computed once; evidence is never re-serialized
+        return merkle_root({name: result["hash"] for name, result in results.items()})
     
     async def _execute_incident_response(self, health_report: Dict[str, Any]):
         """Execute automated incident response procedures."""
@@ -761,20 +1257,46 @@ class BusinessCriticalHealthOrchestrator:
         # Send alerts to configured endpoints
         for webhook_url in self.config["alerting"]["webhook_endpoints"]:
             try:
-                import aiohttp
+                session = await self.session_manager.get_session()
                 timeout = aiohttp.ClientTimeout(total=10)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(webhook_url, json=incident_data) as response:
-                        if response.status == 200:
-                            self.logger.log_audit_event(
-                                "incident_alert_sent",
-                                {"webhook": webhook_url, "incident_id": incident_data["incident_id"]}
-                            )
+                async with session.post(webhook_url, json=incident_data, timeout=timeout) as response:
+                    if response.status == 200:
+                        self.logger.log_audit_event(
+                            "incident_alert_sent",
+                            {"webhook": webhook_url, "incident_id": incident_data["incident_id"]}
+                        )
             except Exception as e:
                 self.logger.log_audit_event(
                     "incident_alert_failed",
                     {"webhook": webhook_url, "error": str(e)}
                 )
+    
+    async def shutdown(self):
+        """Stop background work, release pooled connections and flush the audit trail."""
+        await self.registry.result_cache.close()
+        
+        for check in self.registry.checks.values():
+            await check.close()
+        
+        await self.session_manager.close()
+        
+        # Make sure the audit trail reaches disk before exiting
+        await self.logger.flush(timeout=10.0)
+
+
+def write_chrome_trace(output_path: Path):
+    """Atomically write the buffered trace events as a Chrome trace JSON file."""
+    write_report_atomically(tracer.export_chrome_trace(), output_path, "json")
+
+
+def write_health_report(
+    health_report: Dict[str, Any],
+    output_path: Path,
+    output_format: str = "json",
+    compression: Optional[str] = None
+):
+    """Stream a health report section by section to a temp file and rename it into place."""
+    write_report_atomically(health_report, output_path, output_format, compression)
 
 
 async def main():
@@ -784,49 +1306,45 @@ async def main():
     parser = argparse.ArgumentParser(description="Business-Critical Health Check Orchestrator")
     parser.add_argument("--config", type=Path, help="Configuration file path")
     parser.add_argument("--output", type=Path, help="Output file for health report")
-    parser.add_argument("--format", choices=["json", "yaml"], default="json", help="Output format")
+    parser.add_argument("--format", choices=list(REPORT_FORMATS), default="json", help="Output format")
+    parser.add_argument("--compress", choices=list(REPORT_COMPRESSIONS), help="Compress the output file")
     parser.add_argument("--continuous", action="store_true", help="Run continuously")
-    parser.add_argument("--interval", type=int, default=300, help="Interval in seconds for continuous mode")
+    parser.add_argument("--trace", type=Path, help="Write a Chrome trace of check and stage spans on exit")
+    parser.add_argument("--serve", action="store_true", help="Run as a daemon with the HTTP query API")
+    parser.add_argument("--host", help="Daemon mode: listen address (default from config)")
+    parser.add_argument("--port", type=int, help="Daemon mode: listen port (default from config)")
+    parser.add_argument(
+        "--interval", type=int,
+        help="Continuous mode: interval in seconds for checks without a per-check interval"
+    )
     
     args = parser.parse_args()
+    if args.output:
+        check_report_format(args.format)
     
     # Initialize orchestrator
     orchestrator = BusinessCriticalHealthOrchestrator(args.config)
     
-    if args.continuous:
-        print(f"Starting continuous health monitoring (interval: {args.interval}s)")
-        while True:
-            try:
-                health_report = await orchestrator.run_comprehensive_health_check()
-                
-                if args.output:
-                    with open(args.output, 'w') as f:
-                        if args.format == "yaml":
-                            yaml.dump(health_report, f, default_flow_style=False)
-                        else:
-                            json.dump(health_report, f, indent=2)
-                
-                print(f"Health check completed - Status: {health_report['overall_status']}")
-                print(f"Critical issues: {health_report['summary']['critical_count']}")
-                
-                await asyncio.sleep(args.interval)
-                
-            except KeyboardInterrupt:
-                print("Stopping continuous monitoring...")
-                break
-            except Exception as e:
-                print(f"Error during health check: {e}")
-                await asyncio.sleep(60)  # Wait before retrying
+    if args.serve:
+        print("Starting health check daemon (per-check intervals)")
+        try:
+            await orchestrator.serve(
+                args.host, args.port, args.output, args.format, args.compress, args.interval
+            )
+        except asyncio.CancelledError:
+            print("Stopping health check daemon...")
+    elif args.continuous:
+        print("Starting continuous health monitoring (per-check intervals)")
+        try:
+            await orchestrator.run_continuous(args.output, args.format, args.compress, args.interval)
+        except asyncio.CancelledError:
+            print("Stopping continuous monitoring...")
     else:
         # Single execution
         health_report = await orchestrator.run_comprehensive_health_check()
         
         if args.output:
-            with open(args.output, 'w') as f:
-                if args.format == "yaml":
-                    yaml.dump(health_report, f, default_flow_style=False)
-                else:
-                    json.dump(health_report, f, indent=2)
+            write_health_report(health_report, args.output, args.format, args.compress)
         else:
             # Print summary to console
             print(f"Overall Status: {health_report['overall_status']}")
@@ -838,6 +1356,10 @@ async def main():
                 print("\nRecommendations:")
                 for rec in health_report['recommendations'][:3]:  # Show top 3
                     print(f"  - [{rec['priority'].upper()}] {rec['recommendation']}")
+    
+    if args.trace:
+        write_chrome_trace(args.trace)
+    await orchestrator.shutdown()
 
 
 if __name__ == "__main__":
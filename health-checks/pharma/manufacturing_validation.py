@@ -36,6 +36,7 @@ import numpy as np
 from ..common.forensic_validator import (
     BaseHealthCheck, HealthStatus, Severity, ForensicLogger
 )
+from ..common.tracing import traced_stage
 
 
 class ManufacturingEfficiencyCheck(BaseHealthCheck):
@@ -131,29 +132,37 @@ class ManufacturingEfficiencyCheck(BaseHealthCheck):
     async def _monitor_production_line(self, endpoint: str) -> Dict[str, Any]:
         """Monitor individual production line performance."""
         try:
+            session = await self._get_http_session()
             timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            
+            async def fetch_line_state():
                 # Get production metrics
-                async with session.get(f"{endpoint}/metrics") as response:
+                async with session.get(f"{endpoint}/metrics", timeout=timeout) as response:
                     metrics_data = await response.json()
                 
                 # Get equipment status
-                async with session.get(f"{endpoint}/equipment/status") as response:
+                async with session.get(f"{endpoint}/equipment/status", timeout=timeout) as response:
                     equipment_data = await response.json()
                 
                 # Get current batch information
-                async with session.get(f"{endpoint}/batch/current") as response:
+                async with session.get(f"{endpoint}/batch/current", timeout=timeout) as response:
                     batch_data = await response.json()
                 
-                return {
-                    "endpoint": endpoint,
-                    "line_id": metrics_data.get("line_id", "unknown"),
-                    "metrics": metrics_data,
-                    "equipment": equipment_data,
-                    "batch": batch_data,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "success": True
-                }
+                return metrics_data, equipment_data, batch_data
+            
+            metrics_data, equipment_data, batch_data = await self._run_probe(
+                endpoint, fetch_line_state, timeout_seconds=30.0, hedge=True
+            )
+            
+            return {
+                "endpoint": endpoint,
+                "line_id": metrics_data.get("line_id", "unknown"),
+                "metrics": metrics_data,
+                "equipment": equipment_data,
+                "batch": batch_data,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "success": True
+            }
         
         except Exception as e:
             return {
@@ -469,22 +478,26 @@ class SensorValidationCheck(BaseHealthCheck):
     async def _collect_sensor_data(self, endpoint: str) -> Dict[str, Any]:
         """Collect data from individual sensor endpoint."""
         try:
+            session = await self._get_http_session()
             timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(f"{endpoint}/readings") as response:
-                    data = await response.json()
-                
-                return {
-                    "endpoint": endpoint,
-                    "sensor_id": data.get("sensor_id"),
-                    "location": data.get("location"),
-                    "readings": data.get("readings", {}),
-                    "timestamp": data.get("timestamp"),
-                    "calibration_date": data.get("calibration_date"),
-                    "next_calibration": data.get("next_calibration"),
-                    "status": data.get("status", "unknown"),
-                    "success": True
-                }
+            
+            async def fetch_readings():
+                async with session.get(f"{endpoint}/readings", timeout=timeout) as response:
+                    return await response.json()
+            
+            data = await self._run_probe(endpoint, fetch_readings, timeout_seconds=5.0, hedge=True)
+            
+            return {
+                "endpoint": endpoint,
+                "sensor_id": data.get("sensor_id"),
+                "location": data.get("location"),
+                "readings": data.get("readings", {}),
+                "timestamp": data.get("timestamp"),
+                "calibration_date": data.get("calibration_date"),
+                "next_calibration": data.get("next_calibration"),
+                "status": data.get("status", "unknown"),
+                "success": True
+            }
         
         except Exception as e:
             return {
@@ -811,23 +824,31 @@ class BatchIntegrityCheck(BaseHealthCheck):
     async def _validate_batch_system(self, system: str) -> Dict[str, Any]:
         """Validate individual batch system."""
         try:
+            session = await self._get_http_session()
             timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            
+            async def fetch_batch_state():
                 # Get active batches
-                async with session.get(f"{system}/batches/active") as response:
+                async with session.get(f"{system}/batches/active", timeout=timeout) as response:
                     active_batches = await response.json()
                 
                 # Get batch integrity scores
-                async with session.get(f"{system}/integrity/summary") as response:
+                async with session.get(f"{system}/integrity/summary", timeout=timeout) as response:
                     integrity_summary = await response.json()
                 
-                return {
-                    "system": system,
-                    "active_batches": active_batches,
-                    "integrity_summary": integrity_summary,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "success": True
-                }
+                return active_batches, integrity_summary
+            
+            active_batches, integrity_summary = await self._run_probe(
+                system, fetch_batch_state, timeout_seconds=20.0, hedge=True
+            )
+            
+            return {
+                "system": system,
+                "active_batches": active_batches,
+                "integrity_summary": integrity_summary,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "success": True
+            }
         
         except Exception as e:
             return {
@@ -928,6 +949,7 @@ class BatchIntegrityCheck(BaseHealthCheck):
             ) * 100
         }
     
+    @traced_stage()
     def _verify_data_integrity(self, batch_systems: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Verify data integrity using forensic validation."""
         violations = []
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Online Change-Point Detection
+=============================
+
+Per-metric sequential change detectors updated in O(1) per sample:
+- Two-sided tabular CUSUM on standardised residuals (Page, 1954)
+- Two-sided Page-Hinkley test against the running mean
+- Self-starting reference: mean and spread are learned during a warm-up
+  period and refined by every in-control sample, then re-anchored on the
+  post-change level after every detected shift
+
+Both detectors keep the mean of the samples since the statistic last left
+zero, which estimates the post-change level without storing history.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Optional
+
+from .streaming_stats import WelfordAccumulator
+
+
+class ChangePoint(NamedTuple):
+    """A detected level shift."""
+    algorithm: str
+    direction: str
+    statistic: float
+    threshold: float
+    reference_mean: float
+    shifted_mean: float
+    samples_since_change: int
+    reference_samples: int
+    reference_std: float
+
+    @property
+    def p_value(self) -> float:
+        """Two-sided z-test p-value for the reference vs post-change means."""
+        if self.samples_since_change == 0 or self.reference_samples == 0 or self.reference_std <= 0:
+            return 1.0
+        standard_error = self.reference_std * math.sqrt(
+            1.0 / self.samples_since_change + 1.0 / self.reference_samples
+        )
+        z_score = abs(self.shifted_mean - self.reference_mean) / standard_error
+        return math.erfc(z_score / math.sqrt(2))
+
+
+class _RunMean:
+    """Mean of the samples since the last reset."""
+
+    __slots__ = ("total", "count")
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: float):
+        self.total += value
+        self.count += 1
+
+    def reset(self):
+        self.total = 0.0
+        self.count = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class ChangePointDetector(ABC):
+    """
+    Base class handling warm-up and re-anchoring around a detector statistic.
+
+    ``threshold`` and ``drift`` are expressed in reference standard deviations.
+    """
+
+    algorithm = "base"
+
+    def __init__(self, threshold: float = 5.0, drift: float = 0.5, warmup_samples: int = 20):
+        self.threshold = threshold
+        self.drift = drift
+        self.warmup_samples = warmup_samples
+        self._reference = WelfordAccumulator()
+        self._anchored = False
+        self.detections = 0
+        self._upper_run = _RunMean()
+        self._lower_run = _RunMean()
+
+    @property
+    def warmed_up(self) -> bool:
+        return self._anchored
+
+    @property
+    def reference_mean(self) -> float:
+        return self._reference.mean
+
+    @property
+    def reference_std(self) -> float:
+        # Constant warm-up data would make every deviation infinitely significant
+        return max(self._reference.std_dev, abs(self._reference.mean) * 1e-3, 1e-9)
+
+    @property
+    def reference_samples(self) -> int:
+        return self._reference.count
+
+    def update(self, value: float) -> Optional[ChangePoint]:
+        """Fold in one sample and report a change point if one was confirmed."""
+        if not self.warmed_up:
+            self._reference.add(value)
+            if self._reference.count >= self.warmup_samples:
+                self._anchor(self._reference)
+            return None
+
+        upper, lower = self._step(value)
+        if upper <= self.threshold and lower <= self.threshold:
+            # In control: refine the reference (self-starting detector)
+            self._reference.add(value)
+            return None
+
+        increase = upper >= lower
+        run = self._upper_run if increase else self._lower_run
+        change = ChangePoint(
+            algorithm=self.algorithm,
+            direction="increase" if increase else "decrease",
+            statistic=upper if increase else lower,
+            threshold=self.threshold,
+            reference_mean=self.reference_mean,
+            shifted_mean=run.mean,
+            samples_since_change=run.count,
+            reference_samples=self.reference_samples,
+            reference_std=self.reference_std
+        )
+        self.detections += 1
+
+        # Re-anchor on the new level, keeping the learned spread (a one-sample
+        # seed would carry no variance and alarm on the next sample)
+        self._anchor(WelfordAccumulator.from_moments(
+            max(run.count, 2), change.shifted_mean, self._reference.variance
+        ))
+        return change
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "algorithm": self.algorithm,
+            "warmed_up": self.warmed_up,
+            "reference_mean": self.reference_mean,
+            "reference_std": self.reference_std,
+            "detections": self.detections
+        }
+
+    def _anchor(self, reference: WelfordAccumulator):
+        self._reference = reference
+        self._anchored = True
+        self._upper_run.reset()
+        self._lower_run.reset()
+        self._reset_statistic()
+
+    @abstractmethod
+    def _reset_statistic(self):
+        """Zero the detector statistic after (re-)anchoring."""
+        pass
+
+    @abstractmethod
+    def _step(self, value: float):
+        """Advance the statistic by one sample; returns (upper, lower)."""
+        pass
+
+
+class CusumDetector(ChangePointDetector):
+    """Two-sided tabular CUSUM: S± = max(0, S± ± z - k), alarm when S± > h."""
+
+    algorithm = "cusum"
+
+    def _reset_statistic(self):
+        self._upper = 0.0
+        self._lower = 0.0
+
+    def _step(self, value: float):
+        z_score = (value - self.reference_mean) / self.reference_std
+
+        self._upper = max(0.0, self._upper + z_score - self.drift)
+        if self._upper == 0.0:
+            self._upper_run.reset()
+        else:
+            self._upper_run.add(value)
+
+        self._lower = max(0.0, self._lower - z_score - self.drift)
+        if self._lower == 0.0:
+            self._lower_run.reset()
+        else:
+            self._lower_run.add(value)
+
+        return self._upper, self._lower
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        if self.warmed_up:
+            state.update({"upper_statistic": self._upper, "lower_statistic": self._lower})
+        return state
+
+
+class PageHinkleyDetector(ChangePointDetector):
+    """Two-sided Page-Hinkley test of cumulative deviations from the running mean."""
+
+    algorithm = "page_hinkley"
+
+    def _reset_statistic(self):
+        self._running_mean = self.reference_mean
+        self._count = 0
+        self._upper_sum = self._upper_min = 0.0
+        self._lower_sum = self._lower_max = 0.0
+
+    def _step(self, value: float):
+        self._count += 1
+        self._running_mean += (value - self._running_mean) / self._count
+        deviation = (value - self._running_mean) / self.reference_std
+
+        self._upper_sum += deviation - self.drift
+        if self._upper_sum <= self._upper_min:
+            self._upper_min = self._upper_sum
+            self._upper_run.reset()
+        else:
+            self._upper_run.add(value)
+
+        self._lower_sum += deviation + self.drift
+        if self._lower_sum >= self._lower_max:
+            self._lower_max = self._lower_sum
+            self._lower_run.reset()
+        else:
+            self._lower_run.add(value)
+
+        return self._upper_sum - self._upper_min, self._lower_max - self._lower_sum
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        if self.warmed_up:
+            state.update({
+                "upper_statistic": self._upper_sum - self._upper_min,
+                "lower_statistic": self._lower_max - self._lower_sum
+            })
+        return state
+
+
+CHANGE_POINT_DETECTORS = {
+    CusumDetector.algorithm: CusumDetector,
+    PageHinkleyDetector.algorithm: PageHinkleyDetector
+}
+
+
+def create_change_point_detector(config: Optional[Dict[str, Any]] = None) -> ChangePointDetector:
+    """Build a detector from the ``change_point`` configuration block."""
+    config = config or {}
+    method = config.get("method", "cusum")
+    if method not in CHANGE_POINT_DETECTORS:
+        raise ValueError(f"Unknown change point method: {method}")
+    return CHANGE_POINT_DETECTORS[method](
+        threshold=config.get("threshold", 5.0),
+        drift=config.get("drift", 0.5),
+        warmup_samples=config.get("warmup_samples", 20)
+    )
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Anomaly Model Lifecycle Management
+==================================
+
+Amortised training and serving of per-metric IsolationForest models:
+- Retraining only on cold start, on a fixed schedule, as the training window
+  doubles, or when the rolling baseline drifts away from the distribution
+  the model was trained on
+- Fitting runs in a process pool so the event loop never blocks on sklearn
+- Fitted models are persisted with joblib (atomic replace) and reloaded on
+  startup, so restarts do not begin cold
+- Scoring always uses the last good model while a refit is in flight
+- Each fitted 1-D forest is compiled into a sorted breakpoint/score table so
+  all metrics are scored in one batched pass instead of three sklearn calls
+  per metric
+
+Forensic Methodology Applied:
+- Every retrain records its trigger, training window statistics and duration
+- Training failures leave the previous model in service and are audited
+"""
+
+import asyncio
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import joblib
+import numpy as np
+import sklearn
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from ..common.forensic_validator import ForensicLogger
+
+
+@dataclass
+class AnomalyModel:
+    """Fitted scaler/forest pair together with its training provenance."""
+    metric_name: str
+    scaler: StandardScaler
+    model: IsolationForest
+    version: int
+    trained_at: datetime
+    trigger: str
+    sample_count: int
+    training_mean: float
+    training_std: float
+    score_table: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    sklearn_version: str = sklearn.__version__
+
+
+class AnomalyScore(NamedTuple):
+    """Batched scoring output for a single metric."""
+    metric_name: str
+    scaled_value: float
+    anomaly_score: float
+    is_anomaly: bool
+    model: AnomalyModel
+
+
+def fit_anomaly_model(
+    values: np.ndarray,
+    contamination: float,
+    n_estimators: int,
+    random_state: int
+) -> Tuple[StandardScaler, IsolationForest, Tuple[np.ndarray, np.ndarray]]:
+    """Fit a scaler and IsolationForest on a 1-D sample window (runs in a worker)."""
+    X = np.asarray(values, dtype=np.float64).reshape(-1, 1)
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    model = IsolationForest(
+        n_estimators=n_estimators,
+        contamination=contamination,
+        random_state=random_state
+    )
+    model.fit(X_scaled)
+    return scaler, model, compile_score_table(model)
+
+
+def compile_score_table(model: IsolationForest) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compile a single-feature IsolationForest into a step function.
+
+    With one input feature every tree splits on ``x <= threshold``, so the
+    forest's decision function is constant between consecutive thresholds.
+    Returns the sorted unique thresholds and the decision value for each of
+    the ``len(thresholds) + 1`` segments. Segment values are computed at a
+    float32 point inside each segment because sklearn trees evaluate float32
+    inputs; lookups reproduce ``decision_function`` exactly.
+    """
+    thresholds = np.unique(np.concatenate([
+        estimator.tree_.threshold[estimator.tree_.feature >= 0]
+        for estimator in model.estimators_
+    ] + [np.empty(0)]))
+
+    # Largest float32 <= each threshold represents the segment ending there
+    representatives = thresholds.astype(np.float32)
+    above = representatives.astype(np.float64) > thresholds
+    representatives[above] = np.nextafter(representatives[above], np.float32(-np.inf))
+
+    if len(thresholds):
+        last = np.float32(thresholds[-1])
+        if last <= thresholds[-1]:
+            last = np.nextafter(last, np.float32(np.inf))
+    else:
+        last = np.float32(0.0)
+    representatives = np.append(representatives, last)
+
+    scores = model.decision_function(representatives.astype(np.float64).reshape(-1, 1))
+    return thresholds, scores
+
+
+class AnomalyModelManager:
+    """Schedules, runs and persists IsolationForest retraining per metric."""
+
+    def __init__(self, logger: ForensicLogger, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.logger = logger
+        self.retrain_interval_seconds = config.get("retrain_interval_seconds", 3600)
+        self.drift_threshold_sigma = config.get("drift_threshold_sigma", 3.0)
+        self.min_training_samples = config.get("min_training_samples", 20)
+        self.contamination = config.get("contamination", 0.05)
+        self.n_estimators = config.get("n_estimators", 100)
+        self.random_state = config.get("random_state", 42)
+        self.executor_kind = config.get("executor", "process")
+        self.max_workers = config.get("max_workers", 2)
+        model_dir = config.get("model_dir")
+        self.model_dir: Optional[Path] = Path(model_dir) if model_dir else None
+
+        self.models: Dict[str, AnomalyModel] = {}
+        self._models_generation = 0
+        self._packed_generation = -1
+        self._packed: Dict[str, Any] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._executor: Optional[Executor] = None
+        self.stats = {
+            "retrains_started": 0,
+            "retrains_completed": 0,
+            "retrains_failed": 0,
+            "models_loaded": 0,
+            "triggers": {"cold_start": 0, "schedule": 0, "window_growth": 0, "drift": 0},
+            "last_training_ms": None
+        }
+
+        self._load_persisted_models()
+
+    def get_model(self, metric_name: str) -> Optional[AnomalyModel]:
+        """Last successfully trained model for a metric, if any."""
+        return self.models.get(metric_name)
+
+    def is_training(self, metric_name: str) -> bool:
+        return metric_name in self._inflight
+
+    def retrain_trigger(self, metric_name: str, sample_count: int, window_mean: float, window_std: float) -> Optional[str]:
+        """Decide whether a metric's model needs refitting, and why."""
+        current = self.models.get(metric_name)
+        if current is None:
+            return "cold_start"
+
+        age_seconds = (datetime.now(timezone.utc) - current.trained_at).total_seconds()
+        if age_seconds >= self.retrain_interval_seconds:
+            return "schedule"
+
+        # Early models see only a short window; refit as the window doubles
+        if sample_count >= 2 * current.sample_count:
+            return "window_growth"
+
+        # Drift: the baseline mean moved by more than N training standard deviations,
+        # or the spread changed by more than the same factor
+        reference_std = max(current.training_std, 1e-9)
+        if abs(window_mean - current.training_mean) > self.drift_threshold_sigma * reference_std:
+            return "drift"
+        if window_std > self.drift_threshold_sigma * reference_std or \
+                window_std * self.drift_threshold_sigma < current.training_std:
+            return "drift"
+
+        return None
+
+    def maybe_retrain(self, metric_name: str, values: np.ndarray, window_mean: float, window_std: float) -> Optional[str]:
+        """Start a background refit when a trigger fires; returns the trigger."""
+        if len(values) < self.min_training_samples or metric_name in self._inflight:
+            return None
+
+        trigger = self.retrain_trigger(metric_name, len(values), window_mean, window_std)
+        if trigger is None:
+            return None
+
+        self.stats["retrains_started"] += 1
+        self.stats["triggers"][trigger] += 1
+        # Copy the window: the caller's view aliases a ring buffer that keeps moving
+        task = asyncio.create_task(self._retrain(metric_name, np.array(values, dtype=np.float64), trigger))
+        self._inflight[metric_name] = task
+        return trigger
+
+    def score_batch(self, current_metrics: Dict[str, float]) -> List[AnomalyScore]:
+        """
+        Score every metric that has a model in one batched pass.
+
+        Scaling is a single vectorized operation across metrics; compiled
+        models then need one binary search each, and the anomaly label is
+        derived from the score (``score < 0``, as in ``IsolationForest.predict``).
+        Models without a compiled table fall back to one ``decision_function``.
+        """
+        packed = self._pack_models()
+        names = [name for name in packed["names"] if name in current_metrics]
+        if not names:
+            return []
+
+        index = packed["index"]
+        rows = np.fromiter((index[name] for name in names), dtype=np.intp, count=len(names))
+        values = np.fromiter((current_metrics[name] for name in names), dtype=np.float64, count=len(names))
+        scaled = (values - packed["means"][rows]) / packed["scales"][rows]
+        # sklearn trees compare float32 inputs against their thresholds
+        tree_inputs = scaled.astype(np.float32).astype(np.float64)
+
+        results = []
+        for position, name in enumerate(names):
+            fitted = self.models[name]
+            value = tree_inputs[position]
+            if not np.isfinite(value):
+                continue
+            if fitted.score_table is not None:
+                thresholds, scores = fitted.score_table
+                score = float(scores[np.searchsorted(thresholds, value, side="left")])
+            else:
+                score = float(fitted.model.decision_function([[scaled[position]]])[0])
+            results.append(AnomalyScore(
+                metric_name=name,
+                scaled_value=float(scaled[position]),
+                anomaly_score=score,
+                is_anomaly=score < 0,
+                model=fitted
+            ))
+        return results
+
+    def _pack_models(self) -> Dict[str, Any]:
+        """Stack scaler parameters of all models; rebuilt only when a model changes."""
+        if self._packed_generation != self._models_generation:
+            names = list(self.models)
+            self._packed = {
+                "names": names,
+                "index": {name: i for i, name in enumerate(names)},
+                "means": np.array([self.models[name].scaler.mean_[0] for name in names], dtype=np.float64),
+                "scales": np.array([self.models[name].scaler.scale_[0] for name in names], dtype=np.float64)
+            }
+            self._packed_generation = self._models_generation
+        return self._packed
+
+    async def wait_idle(self):
+        """Wait for all in-flight retraining to finish."""
+        if self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+
+    async def close(self):
+        """Cancel in-flight retraining and shut the worker pool down."""
+        for task in self._inflight.values():
+            task.cancel()
+        await self.wait_idle()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        return {
+            **self.stats,
+            "executor": self.executor_kind,
+            "models": {
+                name: {
+                    "version": model.version,
+                    "trigger": model.trigger,
+                    "sample_count": model.sample_count,
+                    "age_seconds": (now - model.trained_at).total_seconds()
+                }
+                for name, model in self.models.items()
+            },
+            "training_in_flight": sorted(self._inflight)
+        }
+
+    async def _retrain(self, metric_name: str, values: np.ndarray, trigger: str):
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        try:
+            scaler, model, score_table = await loop.run_in_executor(
+                self._get_executor(), fit_anomaly_model,
+                values, self.contamination, self.n_estimators, self.random_state
+            )
+            previous = self.models.get(metric_name)
+            fitted = AnomalyModel(
+                metric_name=metric_name,
+                scaler=scaler,
+                model=model,
+                version=previous.version + 1 if previous else 1,
+                trained_at=datetime.now(timezone.utc),
+                trigger=trigger,
+                sample_count=len(values),
+                training_mean=float(values.mean()),
+                training_std=float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+                score_table=score_table
+            )
+            # Swap in atomically from the event loop; scoring never sees a half-fitted model
+            self.models[metric_name] = fitted
+            self._models_generation += 1
+
+            training_ms = (time.perf_counter() - start_time) * 1000
+            self.stats["retrains_completed"] += 1
+            self.stats["last_training_ms"] = training_ms
+            self.logger.log_audit_event("ml_model_retrained", {
+                "metric": metric_name,
+                "trigger": trigger,
+                "version": fitted.version,
+                "sample_count": fitted.sample_count,
+                "training_ms": training_ms
+            })
+
+            if self.model_dir is not None:
+                await loop.run_in_executor(None, self._persist_model, fitted)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["retrains_failed"] += 1
+            self.logger.log_audit_event(
+                "ml_model_training_failed",
+                {"metric": metric_name, "trigger": trigger, "error": str(e)}
+            )
+        finally:
+            self._inflight.pop(metric_name, None)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                # spawn avoids forking a process that already runs logging/informer threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="anomaly-model-fit"
+                )
+        return self._executor
+
+    def _model_path(self, metric_name: str) -> Path:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", metric_name)
+        return self.model_dir / f"{safe_name}.joblib"
+
+    def _persist_model(self, fitted: AnomalyModel):
+        """Write a model with temp-file + rename so readers never see partial files."""
+        try:
+            self.model_dir.mkdir(parents=True, exist_ok=True)
+            path = self._model_path(fitted.metric_name)
+            temp_path = path.with_suffix(f".joblib.tmp.{os.getpid()}")
+            joblib.dump(fitted, temp_path)
+            os.replace(temp_path, path)
+        except Exception as e:
+            self.logger.log_audit_event(
+                "ml_model_persist_failed",
+                {"metric": fitted.metric_name, "error": str(e)}
+            )
+
+    def _load_persisted_models(self):
+        """Warm-start from models persisted by a previous run (trusted directory only)."""
+        if self.model_dir is None or not self.model_dir.is_dir():
+            return
+
+        for path in sorted(self.model_dir.glob("*.joblib")):
+            try:
+                fitted = joblib.load(path)
+                if not isinstance(fitted, AnomalyModel) or fitted.sklearn_version != sklearn.__version__:
+                    continue
+                if fitted.score_table is None:
+                    fitted.score_table = compile_score_table(fitted.model)
+                self.models[fitted.metric_name] = fitted
+                self._models_generation += 1
+                self.stats["models_loaded"] += 1
+            except Exception as e:
+                self.logger.log_audit_event(
+                    "ml_model_load_failed",
+                    {"path": str(path), "error": str(e)}
+                )
@@ -20,20 +20,24 @@ Forensic Methodology Applied:
 
 import asyncio
 import json
-import math
 import statistics
 import time
-from collections import defaultdict, deque
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+from functools import partial
 from typing import Dict, Any, List, Optional, Tuple, NamedTuple
 import numpy as np
-import scipy.stats as stats
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 
 from ..common.forensic_validator import (
     BaseHealthCheck, HealthStatus, Severity, ForensicLogger, HealthCheckResult
 )
+from ..common.tracing import traced_stage
+from .streaming_stats import RollingBaseline
+from .model_lifecycle import AnomalyModelManager
+from .changepoint import ChangePointDetector, create_change_point_detector
+from .correlation import (
+    IncrementalCorrelation, pearson_matrix, pearson_p_values, top_correlated_pairs
+)
+from .timeseries import MetricRingBuffer, TimeSeriesStore, now_ns
 
 
 class PerformanceBaseline(NamedTuple):
@@ -70,15 +74,30 @@ class PerformanceRegressionDetector(BaseHealthCheck):
         super().__init__("regression.performance", logger)
         self.config = config
         self.baselines: Dict[str, PerformanceBaseline] = {}
-        self.performance_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.anomaly_detectors: Dict[str, IsolationForest] = {}
-        self.scalers: Dict[str, StandardScaler] = {}
+        self.performance_history: Dict[str, MetricRingBuffer] = TimeSeriesStore(capacity=1000)
         
         # Configuration parameters
         self.baseline_window_hours = config.get("baseline_window_hours", 24)
         self.regression_threshold_percent = config.get("regression_threshold_percent", 10.0)
         self.minimum_samples = config.get("minimum_samples", 50)
         self.confidence_threshold = config.get("confidence_threshold", 0.8)
+        self.correlation_top_k = config.get("correlation_top_k", 20)
+        
+        # Optional sliding co-moment tracking instead of per-cycle matrix recomputation
+        self.correlation_tracker: Optional[IncrementalCorrelation] = (
+            IncrementalCorrelation(window_size=self.performance_history.capacity)
+            if config.get("correlation_incremental", False) else None
+        )
+        
+        # Online change-point detectors, one per metric
+        self.change_point_config = config.get("change_point", {})
+        self.change_point_detectors: Dict[str, ChangePointDetector] = {}
+        
+        # IsolationForest models are refit in the background on schedule/drift only
+        self.model_manager = AnomalyModelManager(logger, config.get("ml_models", {}))
+        
+        # Streaming baseline estimators over the columnar history, updated once per sample
+        self.baseline_estimators: Dict[str, RollingBaseline] = {}
     
     async def execute(self):
         """Execute performance regression detection."""
@@ -94,14 +113,16 @@ class PerformanceRegressionDetector(BaseHealthCheck):
             # Detect regressions using multiple methods
             regression_results = []
             
+            # Machine learning anomaly detection, scored for all metrics at once
+            ml_results = self._detect_ml_anomalies(current_metrics)
+            
             for metric_name, current_value in current_metrics.items():
                 # Statistical regression detection
                 stat_result = self._detect_statistical_regression(metric_name, current_value)
                 if stat_result:
                     regression_results.append(stat_result)
                 
-                # Machine learning anomaly detection
-                ml_result = await self._detect_ml_anomaly(metric_name, current_value)
+                ml_result = ml_results.get(metric_name)
                 if ml_result:
                     regression_results.append(ml_result)
                 
@@ -110,11 +131,8 @@ class PerformanceRegressionDetector(BaseHealthCheck):
                 if change_result:
                     regression_results.append(change_result)
                 
-                # Update performance history
-                self.performance_history[metric_name].append({
-                    "timestamp": datetime.now(timezone.utc),
-                    "value": current_value
-                })
+                # Update performance history and rolling baseline
+                self._record_sample(metric_name, current_value)
             
             # Correlation analysis
             correlation_analysis = self._perform_correlation_analysis(current_metrics)
@@ -129,6 +147,7 @@ class PerformanceRegressionDetector(BaseHealthCheck):
                 "regression_detections": [result._asdict() for result in regression_results],
                 "correlation_analysis": correlation_analysis,
                 "root_cause_analysis": root_cause_analysis,
+                "ml_model_lifecycle": self.model_manager.get_stats(),
                 "detection_metadata": {
                     "detection_timestamp": datetime.now(timezone.utc).isoformat(),
                     "baseline_window_hours": self.baseline_window_hours,
@@ -175,6 +194,11 @@ class PerformanceRegressionDetector(BaseHealthCheck):
                 severity=Severity.CRITICAL
             )
     
+    async def close(self):
+        """Cancel in-flight model refits and stop the training pool."""
+        await self.model_manager.close()
+        await super().close()
+    
     async def _collect_performance_metrics(self) -> Dict[str, float]:
         """Collect current performance metrics from various sources."""
         metrics = {}
@@ -182,7 +206,12 @@ class PerformanceRegressionDetector(BaseHealthCheck):
         # Collect from configured endpoints
         for endpoint_config in self.config.get("metric_endpoints", []):
             try:
-                endpoint_metrics = await self._collect_from_endpoint(endpoint_config)
+                endpoint_metrics = await self._run_probe(
+                    endpoint_config["name"],
+                    partial(self._collect_from_endpoint, endpoint_config),
+                    timeout_seconds=endpoint_config.get("timeout", 5),
+                    hedge=True
+                )
                 metrics.update(endpoint_metrics)
             except Exception as e:
                 self.logger.log_audit_event(
@@ -204,22 +233,22 @@ class PerformanceRegressionDetector(BaseHealthCheck):
         url = endpoint_config["url"]
         timeout = aiohttp.ClientTimeout(total=endpoint_config.get("timeout", 5))
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url) as response:
-                data = await response.json()
-                
-                # Extract metrics based on configuration
-                metrics = {}
-                for metric_config in endpoint_config.get("metrics", []):
-                    metric_name = metric_config["name"]
-                    metric_path = metric_config["path"]
-                    
-                    # Navigate JSON path to extract value
-                    value = self._extract_json_value(data, metric_path)
-                    if value is not None:
-                        metrics[f"{endpoint_config['name']}_{metric_name}"] = float(value)
-                
-                return metrics
+        session = await self._get_http_session()
+        async with session.get(url, timeout=timeout) as response:
+            data = await response.json()
+        
+        # Extract metrics based on configuration
+        metrics = {}
+        for metric_config in endpoint_config.get("metrics", []):
+            metric_name = metric_config["name"]
+            metric_path = metric_config["path"]
+            
+            # Navigate JSON path to extract value
+            value = self._extract_json_value(data, metric_path)
+            if value is not None:
+                metrics[f"{endpoint_config['name']}_{metric_name}"] = float(value)
+        
+        return metrics
     
     def _extract_json_value(self, data: Dict[str, Any], path: str) -> Optional[float]:
         """Extract value from JSON data using dot notation path."""
@@ -263,71 +292,50 @@ class PerformanceRegressionDetector(BaseHealthCheck):
         
         return metrics
     
+    def _record_sample(self, metric_name: str, value: float):
+        """Append a sample to history and fold it into the rolling baseline."""
+        estimator = self.baseline_estimators.get(metric_name)
+        if estimator is None:
+            estimator = RollingBaseline(
+                self.baseline_window_hours * 3600,
+                series=self.performance_history[metric_name]
+            )
+            self.baseline_estimators[metric_name] = estimator
+        estimator.add(value, now_ns())
+    
+    @traced_stage()
     async def _update_baselines(self):
-        """Update performance baselines using historical data."""
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.baseline_window_hours)
-        
-        for metric_name, history in self.performance_history.items():
-            # Filter recent data for baseline calculation
-            recent_data = [
-                entry["value"] for entry in history
-                if entry["timestamp"] > cutoff_time
-            ]
+        """Update performance baselines from the streaming estimators."""
+        now = datetime.now(timezone.utc)
+        cutoff_ns = now_ns() - int(self.baseline_window_hours * 3600 * 1e9)
+        
+        for metric_name, estimator in self.baseline_estimators.items():
+            # Age out samples that left the baseline window
+            estimator.evict_before(cutoff_ns)
             
-            if len(recent_data) >= self.minimum_samples:
-                # Calculate statistical baseline
-                mean_val = statistics.mean(recent_data)
-                std_dev = statistics.stdev(recent_data) if len(recent_data) > 1 else 0.0
-                percentile_95 = np.percentile(recent_data, 95)
-                percentile_99 = np.percentile(recent_data, 99)
-                min_val = min(recent_data)
-                max_val = max(recent_data)
-                
-                # Calculate confidence interval
-                confidence_level = 0.95
-                t_value = stats.t.ppf((1 + confidence_level) / 2, len(recent_data) - 1)
-                margin_error = t_value * (std_dev / math.sqrt(len(recent_data)))
-                confidence_interval = (mean_val - margin_error, mean_val + margin_error)
-                
-                # Update baseline
+            if estimator.count >= self.minimum_samples:
+                # Snapshot the incrementally maintained statistics
                 self.baselines[metric_name] = PerformanceBaseline(
                     metric_name=metric_name,
-                    mean=mean_val,
-                    std_dev=std_dev,
-                    percentile_95=percentile_95,
-                    percentile_99=percentile_99,
-                    min_value=min_val,
-                    max_value=max_val,
-                    sample_count=len(recent_data),
-                    last_updated=datetime.now(timezone.utc),
-                    confidence_interval=confidence_interval
+                    mean=estimator.mean,
+                    std_dev=estimator.std_dev,
+                    percentile_95=estimator.percentile_95,
+                    percentile_99=estimator.percentile_99,
+                    min_value=estimator.min_value,
+                    max_value=estimator.max_value,
+                    sample_count=estimator.count,
+                    last_updated=now,
+                    confidence_interval=estimator.confidence_interval(0.95)
                 )
                 
-                # Update machine learning models
-                await self._update_ml_models(metric_name, recent_data)
+                # Refit machine learning models when scheduled or drifting
+                self._update_ml_models(metric_name, estimator)
     
-    async def _update_ml_models(self, metric_name: str, data: List[float]):
-        """Update machine learning models for anomaly detection."""
-        if len(data) < 20:  # Need minimum data for ML
-            return
-        
-        # Prepare data for ML
-        X = np.array(data).reshape(-1, 1)
-        
-        # Initialize or update scaler
-        if metric_name not in self.scalers:
-            self.scalers[metric_name] = StandardScaler()
-        
-        X_scaled = self.scalers[metric_name].fit_transform(X)
-        
-        # Initialize or update isolation forest
-        if metric_name not in self.anomaly_detectors:
-            self.anomaly_detectors[metric_name] = IsolationForest(
-                contamination=0.05,  # Expect 5% outliers
-                random_state=42
-            )
-        
-        self.anomaly_detectors[metric_name].fit(X_scaled)
+    def _update_ml_models(self, metric_name: str, estimator: RollingBaseline):
+        """Schedule a background model refit if the lifecycle manager asks for one."""
+        self.model_manager.maybe_retrain(
+            metric_name, estimator.window_values(), estimator.mean, estimator.std_dev
+        )
     
     def _detect_statistical_regression(self, metric_name: str, current_value: float) -> Optional[RegressionDetectionResult]:
         """Detect regression using statistical methods."""
@@ -409,168 +417,173 @@ class PerformanceRegressionDetector(BaseHealthCheck):
         
         return None
     
-    async def _detect_ml_anomaly(self, metric_name: str, current_value: float) -> Optional[RegressionDetectionResult]:
-        """Detect anomalies using machine learning models."""
-        if metric_name not in self.anomaly_detectors or metric_name not in self.scalers:
-            return None
+    @traced_stage()
+    def _detect_ml_anomalies(self, current_metrics: Dict[str, float]) -> Dict[str, RegressionDetectionResult]:
+        """Detect anomalies for all metrics using a single batched model scoring pass."""
+        results: Dict[str, RegressionDetectionResult] = {}
         
         try:
-            # Scale the current value
-            X = np.array([[current_value]])
-            X_scaled = self.scalers[metric_name].transform(X)
-            
-            # Predict anomaly
-            anomaly_score = self.anomaly_detectors[metric_name].decision_function(X_scaled)[0]
-            is_anomaly = self.anomaly_detectors[metric_name].predict(X_scaled)[0] == -1
-            
-            if is_anomaly:
-                # Convert anomaly score to confidence and severity
-                confidence = min(abs(anomaly_score), 1.0)
-                
-                if confidence > 0.8:
-                    severity = Severity.CRITICAL
-                elif confidence > 0.6:
-                    severity = Severity.HIGH
-                else:
-                    severity = Severity.MEDIUM
-                
-                baseline = self.baselines.get(metric_name)
-                baseline_value = baseline.mean if baseline else 0.0
-                deviation_percent = abs(current_value - baseline_value) / max(baseline_value, 1.0) * 100
-                
-                evidence = {
-                    "detection_method": "machine_learning",
-                    "anomaly_score": anomaly_score,
-                    "model_type": "isolation_forest",
-                    "scaled_value": X_scaled[0][0],
-                }
-                
-                return RegressionDetectionResult(
-                    is_regression=True,
-                    severity=severity,
-                    confidence=confidence,
-                    detected_at=datetime.now(timezone.utc),
-                    baseline_value=baseline_value,
-                    current_value=current_value,
-                    deviation_percent=deviation_percent,
-                    detection_method="machine_learning",
-                    evidence=evidence
-                )
-        
+            # Last good models; a refit in flight replaces a model only once complete
+            scores = self.model_manager.score_batch(current_metrics)
         except Exception as e:
             self.logger.log_audit_event(
                 "ml_anomaly_detection_failed",
-                {"metric": metric_name, "error": str(e)}
+                {"metrics": len(current_metrics), "error": str(e)}
             )
+            return results
         
-        return None
+        detected_at = datetime.now(timezone.utc)
+        for scored in scores:
+            if not scored.is_anomaly:
+                continue
+            
+            metric_name = scored.metric_name
+            current_value = current_metrics[metric_name]
+            fitted = scored.model
+            
+            # Convert anomaly score to confidence and severity
+            confidence = min(abs(scored.anomaly_score), 1.0)
+            
+            if confidence > 0.8:
+                severity = Severity.CRITICAL
+            elif confidence > 0.6:
+                severity = Severity.HIGH
+            else:
+                severity = Severity.MEDIUM
+            
+            baseline = self.baselines.get(metric_name)
+            baseline_value = baseline.mean if baseline else 0.0
+            deviation_percent = abs(current_value - baseline_value) / max(baseline_value, 1.0) * 100
+            
+            evidence = {
+                "detection_method": "machine_learning",
+                "anomaly_score": scored.anomaly_score,
+                "model_type": "isolation_forest",
+                "scaled_value": scored.scaled_value,
+                "model_version": fitted.version,
+                "model_trained_at": fitted.trained_at.isoformat(),
+                "model_training_samples": fitted.sample_count,
+                "model_refit_in_flight": self.model_manager.is_training(metric_name)
+            }
+            
+            results[metric_name] = RegressionDetectionResult(
+                is_regression=True,
+                severity=severity,
+                confidence=confidence,
+                detected_at=detected_at,
+                baseline_value=baseline_value,
+                current_value=current_value,
+                deviation_percent=deviation_percent,
+                detection_method="machine_learning",
+                evidence=evidence
+            )
+        
+        return results
     
     def _detect_change_point(self, metric_name: str, current_value: float) -> Optional[RegressionDetectionResult]:
-        """Detect change points in performance metrics."""
-        if metric_name not in self.performance_history:
+        """Detect change points with an online CUSUM/Page-Hinkley detector (O(1) per sample)."""
+        detector = self.change_point_detectors.get(metric_name)
+        if detector is None:
+            detector = create_change_point_detector(self.change_point_config)
+            self.change_point_detectors[metric_name] = detector
+        
+        try:
+            change = detector.update(current_value)
+        except Exception as e:
+            self.logger.log_audit_event(
+                "change_point_detection_failed",
+                {"metric": metric_name, "error": str(e)}
+            )
             return None
         
-        history = list(self.performance_history[metric_name])
-        if len(history) < 20:  # Need sufficient history
+        if change is None:
             return None
         
-        # Get recent values for change point detection
-        recent_values = [entry["value"] for entry in history[-20:]]
+        change_percent = abs(change.shifted_mean - change.reference_mean) / max(change.reference_mean, 1.0) * 100
         
-        # Simple change point detection using sliding window
-        window_size = 10
-        if len(recent_values) >= window_size * 2:
-            first_half = recent_values[:window_size]
-            second_half = recent_values[window_size:]
-            
-            first_mean = statistics.mean(first_half)
-            second_mean = statistics.mean(second_half)
-            
-            # Perform t-test to check for significant difference
-            try:
-                t_stat, p_value = stats.ttest_ind(first_half, second_half)
-                
-                # If p-value is small, there's a significant change
-                if p_value < 0.05:
-                    change_percent = abs(second_mean - first_mean) / max(first_mean, 1.0) * 100
-                    
-                    # Determine if this is a regression
-                    is_regression = change_percent > self.regression_threshold_percent
-                    
-                    if is_regression:
-                        confidence = 1.0 - p_value  # Higher confidence for lower p-value
-                        severity = Severity.HIGH if change_percent > 25 else Severity.MEDIUM
-                        
-                        evidence = {
-                            "detection_method": "change_point",
-                            "t_statistic": t_stat,
-                            "p_value": p_value,
-                            "first_period_mean": first_mean,
-                            "second_period_mean": second_mean,
-                            "window_size": window_size
-                        }
-                        
-                        return RegressionDetectionResult(
-                            is_regression=True,
-                            severity=severity,
-                            confidence=confidence,
-                            detected_at=datetime.now(timezone.utc),
-                            baseline_value=first_mean,
-                            current_value=current_value,
-                            deviation_percent=change_percent,
-                            detection_method="change_point",
-                            evidence=evidence
-                        )
-            
-            except Exception as e:
-                self.logger.log_audit_event(
-                    "change_point_detection_failed",
-                    {"metric": metric_name, "error": str(e)}
-                )
+        # Determine if this is a regression
+        if change_percent <= self.regression_threshold_percent:
+            return None
         
-        return None
+        p_value = change.p_value
+        confidence = 1.0 - p_value  # Higher confidence for lower p-value
+        severity = Severity.HIGH if change_percent > 25 else Severity.MEDIUM
+        
+        evidence = {
+            "detection_method": "change_point",
+            "algorithm": change.algorithm,
+            "direction": change.direction,
+            "statistic": change.statistic,
+            "threshold": change.threshold,
+            "p_value": p_value,
+            "first_period_mean": change.reference_mean,
+            "second_period_mean": change.shifted_mean,
+            "samples_since_change": change.samples_since_change,
+            "reference_std": change.reference_std
+        }
+        
+        return RegressionDetectionResult(
+            is_regression=True,
+            severity=severity,
+            confidence=confidence,
+            detected_at=datetime.now(timezone.utc),
+            baseline_value=change.reference_mean,
+            current_value=current_value,
+            deviation_percent=change_percent,
+            detection_method="change_point",
+            evidence=evidence
+        )
     
+    @traced_stage()
     def _perform_correlation_analysis(self, current_metrics: Dict[str, float]) -> Dict[str, Any]:
         """Perform correlation analysis across metrics."""
-        correlations = {}
-        correlated_count = 0
-        
         metric_names = list(current_metrics.keys())
+        total_pairs = len(metric_names) * (len(metric_names) - 1) // 2
+        
+        # Only metrics with enough history take part in the correlation matrix
+        names = [
+            name for name in metric_names
+            if name in self.performance_history and len(self.performance_history[name]) > 10
+        ]
+        if len(names) < 2:
+            return {"correlations": {}, "correlated_count": 0, "total_pairs_analyzed": total_pairs}
+        
+        try:
+            tracker = self.correlation_tracker
+            if tracker is not None and tracker.names == tuple(names):
+                # Slide the co-moment window by this cycle's observation
+                tracker.update(np.fromiter((current_metrics[name] for name in names), dtype=np.float64))
+                correlation = tracker.correlation()
+                sample_count = tracker.count
+            else:
+                # Align the most recent samples of every metric into an N x M window
+                sample_count = min(len(self.performance_history[name]) for name in names)
+                window = np.column_stack([
+                    self.performance_history[name].latest(sample_count) for name in names
+                ])
+                correlation = pearson_matrix(window)
+                if tracker is not None:
+                    tracker.reset(names, window)
+            
+            p_values = pearson_p_values(correlation, sample_count)
+            correlations, correlated_count = top_correlated_pairs(
+                names, correlation, p_values, top_k=self.correlation_top_k
+            )
         
-        # Calculate correlations between metrics
-        for i, metric1 in enumerate(metric_names):
-            for metric2 in metric_names[i+1:]:
-                if metric1 in self.performance_history and metric2 in self.performance_history:
-                    history1 = [entry["value"] for entry in self.performance_history[metric1]]
-                    history2 = [entry["value"] for entry in self.performance_history[metric2]]
-                    
-                    # Ensure same length
-                    min_length = min(len(history1), len(history2))
-                    if min_length > 10:
-                        history1 = history1[-min_length:]
-                        history2 = history2[-min_length:]
-                        
-                        # Calculate correlation
-                        try:
-                            correlation, p_value = stats.pearsonr(history1, history2)
-                            
-                            if abs(correlation) > 0.7 and p_value < 0.05:
-                                correlations[f"{metric1}_vs_{metric2}"] = {
-                                    "correlation": correlation,
-                                    "p_value": p_value,
-                                    "strength": "strong" if abs(correlation) > 0.8 else "moderate"
-                                }
-                                correlated_count += 1
-                        
-                        except Exception:
-                            pass  # Skip if correlation calculation fails
+        except Exception as e:
+            self.logger.log_audit_event(
+                "correlation_analysis_failed",
+                {"metrics": len(names), "error": str(e)}
+            )
+            correlations, correlated_count = {}, 0
         
         return {
             "correlations": correlations,
             "correlated_count": correlated_count,
-            "total_pairs_analyzed": len(metric_names) * (len(metric_names) - 1) // 2
+            "total_pairs_analyzed": total_pairs
         }
     
+    @traced_stage()
     async def _perform_root_cause_analysis(self, regressions: List[RegressionDetectionResult]) -> Dict[str, Any]:
         """Perform root cause analysis for detected regressions."""
         if not regressions:
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Streaming Statistics for Performance Baselines
+==============================================
+
+Constant-time estimators used to maintain rolling performance baselines
+without re-scanning metric history on every detection cycle:
+
+- Welford mean/variance with exact removal of evicted samples
+- P-square (P²) streaming quantile estimation (Jain & Chlamtac, 1985)
+- Two-generation windowed quantiles so old samples age out of P² markers
+- Monotonic-deque sliding minimum/maximum
+- Time- and count-bounded rolling window over a columnar ring buffer
+
+Every update is O(1) (amortised for min/max), independent of history length.
+"""
+
+import math
+from collections import deque
+from functools import lru_cache
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+import scipy.stats as stats
+
+from .timeseries import MetricRingBuffer
+
+
+class WelfordAccumulator:
+    """Running mean and variance supporting both insertion and removal."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    @classmethod
+    def from_moments(cls, count: int, mean: float, variance: float) -> "WelfordAccumulator":
+        """Seed an accumulator from summary statistics."""
+        accumulator = cls()
+        accumulator.count = count
+        accumulator.mean = mean
+        accumulator._m2 = variance * max(count - 1, 0)
+        return accumulator
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        previous_mean = (self.count * self.mean - value) / (self.count - 1)
+        self._m2 -= (value - self.mean) * (value - previous_mean)
+        self.mean = previous_mean
+        self.count -= 1
+        # Guard against negative drift from floating point cancellation
+        self._m2 = max(self._m2, 0.0)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), matching ``statistics.variance``."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """P² single-quantile estimator using five markers and O(1) memory."""
+
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self.count = 0
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[float] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float):
+        self.count += 1
+
+        if self.count <= 5:
+            self._initial.append(value)
+            if self.count == 5:
+                self._initial.sort()
+                self._heights = list(self._initial)
+                self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+                p = self.quantile
+                self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+            return
+
+        heights = self._heights
+        positions = self._positions
+
+        # Locate the cell containing the new observation
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while cell < 3 and value >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the three middle markers towards their desired positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                positions[i] += step
+
+    def value(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.count < 5:
+            ordered = sorted(self._initial)
+            rank = self.quantile * (len(ordered) - 1)
+            lower = int(math.floor(rank))
+            upper = min(lower + 1, len(ordered) - 1)
+            return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+        return self._heights[2]
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+
+class WindowedQuantile:
+    """
+    Approximate sliding-window quantile built from two P² generations.
+
+    Every sample feeds both generations; once the newer generation has seen
+    half a window it replaces the older one. Estimates therefore always cover
+    between half and a full window of recent data while staying O(1).
+    """
+
+    MIN_GENERATION_SAMPLES = 5
+
+    def __init__(self, quantile: float, window_seconds: float, window_samples: int):
+        self.quantile = quantile
+        self.half_window_seconds = window_seconds / 2
+        self.half_window_samples = max(window_samples // 2, self.MIN_GENERATION_SAMPLES)
+        self._older = P2Quantile(quantile)
+        self._newer = P2Quantile(quantile)
+        self._newer_started_at: Optional[float] = None
+
+    def add(self, value: float, timestamp: float):
+        if self._newer_started_at is None:
+            self._newer_started_at = timestamp
+
+        self._older.add(value)
+        self._newer.add(value)
+
+        if (self._newer.count >= self.half_window_samples
+                or timestamp - self._newer_started_at >= self.half_window_seconds):
+            self._older = self._newer
+            self._newer = P2Quantile(self.quantile)
+            self._newer_started_at = timestamp
+
+    def value(self) -> float:
+        if self._older.count >= self.MIN_GENERATION_SAMPLES or self._newer.count == 0:
+            return self._older.value()
+        return self._newer.value()
+
+
+class RollingBaseline:
+    """
+    Time- and count-bounded rolling baseline for a single metric.
+
+    Samples live in a columnar ``MetricRingBuffer``; the baseline only tracks
+    the sequence number of its oldest in-window sample so evicted values can
+    be removed from the running moments. All summary statistics are
+    maintained incrementally.
+    """
+
+    def __init__(self, window_seconds: float, max_samples: int = 1000,
+                 series: Optional[MetricRingBuffer] = None):
+        self.window_seconds = window_seconds
+        self.series = series if series is not None else MetricRingBuffer(max_samples)
+        self.max_samples = self.series.capacity
+        self._start = self.series.total
+        self._moments = WelfordAccumulator()
+        self._min_candidates: Deque[Tuple[float, int]] = deque()
+        self._max_candidates: Deque[Tuple[float, int]] = deque()
+        self._p95 = WindowedQuantile(0.95, window_seconds, self.max_samples)
+        self._p99 = WindowedQuantile(0.99, window_seconds, self.max_samples)
+        self.last_updated: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        return self.series.total - self._start
+
+    def add(self, value: float, timestamp_ns: int):
+        """Append a sample to the series, evicting the oldest once it would be overwritten."""
+        if self.count >= self.max_samples:
+            self._evict_oldest()
+
+        sequence = self.series.append(value, timestamp_ns)
+        self._moments.add(value)
+
+        while self._min_candidates and self._min_candidates[-1][0] >= value:
+            self._min_candidates.pop()
+        self._min_candidates.append((value, sequence))
+        while self._max_candidates and self._max_candidates[-1][0] <= value:
+            self._max_candidates.pop()
+        self._max_candidates.append((value, sequence))
+
+        timestamp = timestamp_ns / 1e9
+        self._p95.add(value, timestamp)
+        self._p99.add(value, timestamp)
+        self.last_updated = timestamp
+
+    def evict_before(self, cutoff_ns: int):
+        """Drop samples at or before ``cutoff_ns`` (epoch nanoseconds)."""
+        while self.count and self.series.timestamp_at(self._start) <= cutoff_ns:
+            self._evict_oldest()
+
+    def window_values(self) -> np.ndarray:
+        """Zero-copy view of the in-window values, oldest first."""
+        return self.series.latest(self.count)
+
+    @property
+    def mean(self) -> float:
+        return self._moments.mean
+
+    @property
+    def std_dev(self) -> float:
+        return self._moments.std_dev
+
+    @property
+    def min_value(self) -> float:
+        return self._min_candidates[0][0] if self._min_candidates else 0.0
+
+    @property
+    def max_value(self) -> float:
+        return self._max_candidates[0][0] if self._max_candidates else 0.0
+
+    @property
+    def percentile_95(self) -> float:
+        return self._p95.value()
+
+    @property
+    def percentile_99(self) -> float:
+        # Independent P² estimators can cross on small samples
+        return max(self._p99.value(), self._p95.value())
+
+    def confidence_interval(self, confidence_level: float = 0.95) -> Tuple[float, float]:
+        n = self.count
+        if n < 2:
+            return (self.mean, self.mean)
+        margin_error = _t_critical(confidence_level, n - 1) * (self.std_dev / math.sqrt(n))
+        return (self.mean - margin_error, self.mean + margin_error)
+
+    def _evict_oldest(self):
+        sequence = self._start
+        self._moments.remove(self.series.value_at(sequence))
+        self._start += 1
+        if self._min_candidates and self._min_candidates[0][1] == sequence:
+            self._min_candidates.popleft()
+        if self._max_candidates and self._max_candidates[0][1] == sequence:
+            self._max_candidates.popleft()
+
+
+@lru_cache(maxsize=2048)
+def _t_critical(confidence_level: float, degrees_of_freedom: int) -> float:
+    """Two-sided Student-t critical value, cached per degrees of freedom."""
+    return float(stats.t.ppf((1 + confidence_level) / 2, degrees_of_freedom))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Columnar Time-Series Storage
+============================
+
+Compact per-metric history for performance regression detection:
+- Preallocated float64 value and int64 epoch-nanosecond timestamp columns
+- Fixed-capacity ring buffer with mirrored writes, so any window of the most
+  recent samples is a single contiguous, zero-copy NumPy view
+- Time-bounded windows located with a binary search over the timestamps
+
+Downstream statistics operate directly on these views instead of rebuilding
+Python lists from dictionaries on every detection cycle.
+"""
+
+import time
+from typing import Tuple
+
+import numpy as np
+
+
+def now_ns() -> int:
+    """Current wall-clock time as integer epoch nanoseconds."""
+    return time.time_ns()
+
+
+class MetricRingBuffer:
+    """
+    Fixed-capacity ring buffer of ``(timestamp_ns, value)`` samples.
+
+    Each sample is written twice, at ``i`` and ``i + capacity``. The most
+    recent ``n`` samples therefore always occupy one contiguous slice of the
+    backing arrays and can be returned as views without copying.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self._values = np.zeros(2 * capacity, dtype=np.float64)
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self.total = 0  # Number of samples ever appended (next sequence number)
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, value: float, timestamp_ns: int) -> int:
+        """Append a sample and return its sequence number."""
+        position = self.total % self.capacity
+        mirror = position + self.capacity
+        self._values[position] = self._values[mirror] = value
+        self._timestamps[position] = self._timestamps[mirror] = timestamp_ns
+        sequence = self.total
+        self.total += 1
+        return sequence
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Sequence number of the oldest sample still held."""
+        return self.total - len(self)
+
+    def value_at(self, sequence: int) -> float:
+        self._check_sequence(sequence)
+        return float(self._values[sequence % self.capacity])
+
+    def timestamp_at(self, sequence: int) -> int:
+        self._check_sequence(sequence)
+        return int(self._timestamps[sequence % self.capacity])
+
+    def latest(self, n: int) -> np.ndarray:
+        """Read-only view of the most recent ``n`` values, oldest first."""
+        return self._view(self._values, n)
+
+    def latest_timestamps(self, n: int) -> np.ndarray:
+        """Read-only view of the most recent ``n`` timestamps, oldest first."""
+        return self._view(self._timestamps, n)
+
+    def values(self) -> np.ndarray:
+        return self.latest(len(self))
+
+    def timestamps(self) -> np.ndarray:
+        return self.latest_timestamps(len(self))
+
+    def since(self, cutoff_ns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of ``(timestamps, values)`` strictly newer than ``cutoff_ns``."""
+        timestamps = self.timestamps()
+        start = int(np.searchsorted(timestamps, cutoff_ns, side="right"))
+        n = len(timestamps) - start
+        return self.latest_timestamps(n), self.latest(n)
+
+    def _view(self, column: np.ndarray, n: int) -> np.ndarray:
+        n = max(0, min(n, len(self)))
+        end = self.total % self.capacity + self.capacity
+        view = column[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def _check_sequence(self, sequence: int):
+        if not self.oldest_sequence <= sequence < self.total:
+            raise IndexError(f"Sample {sequence} is no longer held in the ring buffer")
+
+
+class TimeSeriesStore(dict):
+    """Metric name -> MetricRingBuffer mapping that creates buffers on demand."""
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__()
+        self.capacity = capacity
+
+    def __missing__(self, metric_name: str) -> MetricRingBuffer:
+        buffer = MetricRingBuffer(self.capacity)
+        self[metric_name] = buffer
+        return buffer
@@ -0,0 +1,18 @@
+"""
+Shared test setup.
+
+The checks live in the ``health-checks`` directory and use relative imports;
+register that directory as the ``health_checks`` package the README imports.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+if "health_checks" not in sys.modules:
+    package = types.ModuleType("health_checks")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["health_checks"] = package
@@ -0,0 +1,70 @@
+"""ResourceInformer list/watch behaviour against the in-process FakeKubernetesAPI."""
+
+import time
+
+import pytest
+
+from health_checks.infrastructure.fake_kubernetes import FakeKubernetesAPI
+from health_checks.infrastructure.kubernetes_cache import ResourceInformer, pod_phase_indexer
+
+
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def api():
+    fake = FakeKubernetesAPI()
+    fake.add_pod("default", "web-0", phase="Running")
+    return fake
+
+
+@pytest.fixture
+def informer(api):
+    pods = ResourceInformer(
+        "pods",
+        api.list_pod_for_all_namespaces,
+        indexers={"phase": pod_phase_indexer},
+        watch_factory=api.watch_factory,
+        watch_timeout_seconds=5,
+        retry_backoff_seconds=0.05
+    )
+    pods.start()
+    assert pods.wait_for_sync(2.0)
+    yield pods
+    pods.stop()
+
+
+def test_phase_change_is_delivered_by_watch(api, informer):
+    api.set_pod_phase("default", "web-0", "Failed")
+
+    assert wait_until(lambda: informer.count_by_index("phase", "Failed") == 1)
+    assert informer.count_by_index("phase", "Running") == 0
+    assert api.call_counts["list_pod_for_all_namespaces"] == 1
+
+
+def test_bookmark_advances_resource_version(api, informer):
+    api.bookmark("pods")
+    expected = str(api._resource_version)
+
+    assert wait_until(lambda: informer.resource_version == expected)
+    stats = informer.get_stats()
+    assert stats["errors"] == 0
+    assert stats["object_count"] == 1
+
+
+def test_compaction_forces_relist(api, informer):
+    informer.stop()
+    api.add_pod("default", "web-1", phase="Pending")
+    api.compact()
+    informer.start()
+
+    assert wait_until(lambda: api.call_counts["list_pod_for_all_namespaces"] == 2)
+    assert wait_until(lambda: informer.count() == 2)
+    assert informer.count_by_index("phase", "Pending") == 1
+    assert informer.get_stats()["errors"] == 0
@@ -0,0 +1,92 @@
+"""OrderProcessingCheck against the in-process StubTradingServer."""
+
+import pytest
+import pytest_asyncio
+
+from health_checks.common.forensic_validator import ForensicLogger, HealthStatus
+from health_checks.finance.stub_trading_server import StubTradingServer
+from health_checks.finance.trading_validation import OrderProcessingCheck
+
+
+@pytest_asyncio.fixture
+async def server():
+    stub = StubTradingServer(stage_latency_ms={"validate": 0.5, "route": 0.5, "execute": 1.0})
+    stub.endpoint = await stub.start()
+    yield stub
+    await stub.stop()
+
+
+@pytest.fixture
+def logger(tmp_path):
+    forensic_logger = ForensicLogger(tmp_path / "logs")
+    yield forensic_logger
+    forensic_logger.close()
+
+
+def make_check(server, logger, **kwargs) -> OrderProcessingCheck:
+    return OrderProcessingCheck(logger, [server.endpoint], risk_endpoint=server.endpoint, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_succeeds_without_executing_orders(server, logger):
+    check = make_check(server, logger)
+    try:
+        result = await check.execute()
+    finally:
+        await check.close()
+
+    assert result.status == HealthStatus.HEALTHY
+    assert result.metrics["order_success_rate"] == 100.0
+    assert result.metrics["order_book_integrity_score"] == 100.0
+    assert all(test["failed_stage"] is None for test in result.evidence["order_lifecycle_tests"])
+    assert server.orders_executed == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_stage_stops_the_order_chain(server, logger):
+    server.failing_stages.add("route")
+    check = make_check(server, logger, execute_test_orders=True)
+    try:
+        result = await check.execute()
+    finally:
+        await check.close()
+
+    order_tests = result.evidence["order_lifecycle_tests"]
+    assert order_tests
+    assert all(test["failed_stage"] == "routing" for test in order_tests)
+    assert result.metrics["order_success_rate"] == 0.0
+    assert server.orders_executed == 0
+    assert result.status != HealthStatus.HEALTHY
+
+
+@pytest.mark.asyncio
+async def test_crossed_book_lowers_integrity(server, logger):
+    server.crossed_book = True
+    check = make_check(server, logger)
+    try:
+        result = await check.execute()
+    finally:
+        await check.close()
+
+    assert result.metrics["order_book_integrity_score"] < 100.0
+
+
+@pytest.mark.asyncio
+async def test_short_load_run_sustains_target_rate(server, logger):
+    check = make_check(server, logger, load_test_config={
+        "enabled": True,
+        "arrival_rate_per_second": 50.0,
+        "duration_seconds": 0.5,
+        "concurrency": 8,
+        "arrival": "uniform"
+    })
+    try:
+        result = await check.execute()
+    finally:
+        await check.close()
+
+    load_test = result.evidence["load_test"]
+    assert load_test["offered"] == load_test["completed"] == load_test["succeeded"]
+    assert load_test["unfinished"] == 0 and load_test["dropped_backlog"] == 0
+    assert result.metrics["load_sustained_ratio"] > 0.5
+    assert server.orders_executed == load_test["succeeded"]